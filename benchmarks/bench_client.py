@@ -0,0 +1,408 @@
+"""
+Microbenchmarks of client side request overhead.
+
+Requests are served in-process by FakeBankAccountDataAPI with memoized
+responses, so results measure time spent in the library and requests
+rather than in the network or the stand-in.
+
+Usage:
+    python -m benchmarks.bench_client              # compare with baseline
+    python -m benchmarks.bench_client --save       # store new baseline
+    python -m benchmarks.bench_client -k accounts  # run matching ones
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from requests.models import Response
+
+from nordigen import NordigenClient
+from nordigen.testing import FakeBankAccountDataAPI, install_fake_api
+from nordigen.testing.fake_api import FakeResponse
+from nordigen.types.http_enums import HTTPMethod
+
+BASELINE = Path(__file__).with_name("baseline.json")
+ACCOUNT_ID = "1d2b827b-9ca2-4adb-b4c3-0deb76a0ac50"
+AGREEMENT_PAYLOAD = {
+    "max_historical_days": 90,
+    "access_valid_for_days": 90,
+    "access_scope": ["balances", "details", "transactions"],
+    "institution_id": "REVOLUT_REVOGB21",
+}
+
+BENCHMARKS: Dict[str, Callable[[NordigenClient], Callable[[], object]]] = {}
+
+
+@dataclass
+class Result:
+    ops_per_sec: float
+    peak_bytes: int
+
+
+class MemoizedAPI(FakeBankAccountDataAPI):
+    """API stand-in that serves every distinct request from memory."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._responses: Dict[Tuple, FakeResponse] = {}
+
+    def handle(self, method, path, query, body) -> FakeResponse:
+        key = (method, path, tuple(sorted(query.items())))
+        if key not in self._responses:
+            self._responses[key] = super().handle(method, path, query, body)
+        return self._responses[key]
+
+
+def benchmark(name: str):
+    """Register benchmark factory, factory returns the measured callable."""
+
+    def register(factory):
+        BENCHMARKS[name] = factory
+        return factory
+
+    return register
+
+
+def create_client() -> NordigenClient:
+    client = NordigenClient(secret_key="SECRET_KEY", secret_id="SECRET_ID")
+    api = install_fake_api(client, MemoizedAPI(transactions=1000))
+    client.generate_token()
+    agreement = client.agreement.create_agreement("REVOLUT_REVOGB21")
+    requisition = client.requisition.create_requisition(
+        "https://gocardless.com", "reference", "REVOLUT_REVOGB21"
+    )
+    client.bench_ids = {
+        "agreement": agreement["id"],
+        "requisition": requisition["id"],
+    }
+    client.bench_api = api
+    return client
+
+
+# Hot path building blocks
+
+
+@benchmark("hot_path.filter_payload")
+def filter_payload(client):
+    data = {"date_from": "2021-12-01", "date_to": None, "country": ""}
+    return lambda: client.data_filter.filter_payload(data)
+
+
+@benchmark("hot_path.send_get")
+def send_get(client):
+    request_meta = {
+        "url": f"{client.base_url}/accounts/{ACCOUNT_ID}/balances/",
+        "headers": client._headers,
+    }
+    return lambda: client._send(HTTPMethod.GET, request_meta, {})
+
+
+@benchmark("hot_path.send_post")
+def send_post(client):
+    request_meta = {
+        "url": f"{client.base_url}/agreements/enduser/",
+        "headers": client._headers,
+    }
+    return lambda: client._send(
+        HTTPMethod.POST, request_meta, AGREEMENT_PAYLOAD
+    )
+
+
+@benchmark("hot_path.perform")
+def perform(client):
+    endpoint = f"accounts/{ACCOUNT_ID}/balances/"
+    return lambda: client._perform(HTTPMethod.GET, endpoint)
+
+
+@benchmark("hot_path.response_json_transactions")
+def response_json(client):
+    response = Response()
+    response.status_code = 200
+    response._content = client.bench_api.handle(
+        "GET", f"accounts/{ACCOUNT_ID}/transactions/", {}, b""
+    ).body
+    return response.json
+
+
+# Token handling
+
+
+@benchmark("token.generate_token")
+def generate_token(client):
+    return client.generate_token
+
+
+@benchmark("token.exchange_token")
+def exchange_token(client):
+    return lambda: client.exchange_token("refresh_token")
+
+
+# API classes
+
+
+@benchmark("institutions.get_institutions")
+def get_institutions(client):
+    return lambda: client.institution.get_institutions("LV")
+
+
+@benchmark("institutions.get_institution_by_id")
+def get_institution_by_id(client):
+    return lambda: client.institution.get_institution_by_id("REVOLUT_REVOGB21")
+
+
+@benchmark("institutions.get_institution_id_by_name")
+def get_institution_id_by_name(client):
+    return lambda: client.institution.get_institution_id_by_name(
+        "LV", "revolut"
+    )
+
+
+@benchmark("agreements.create_agreement")
+def create_agreement(client):
+    return lambda: client.agreement.create_agreement("REVOLUT_REVOGB21")
+
+
+@benchmark("agreements.get_agreements")
+def get_agreements(client):
+    return client.agreement.get_agreements
+
+
+@benchmark("agreements.get_agreement_by_id")
+def get_agreement_by_id(client):
+    id = client.bench_ids["agreement"]
+    return lambda: client.agreement.get_agreement_by_id(id)
+
+
+@benchmark("agreements.accept_agreement")
+def accept_agreement(client):
+    id = client.bench_ids["agreement"]
+    return lambda: client.agreement.accept_agreement(id, "127.0.0.1", "Chrome")
+
+
+@benchmark("agreements.delete_agreement")
+def delete_agreement(client):
+    id = client.bench_ids["agreement"]
+    return lambda: client.agreement.delete_agreement(id)
+
+
+@benchmark("requisitions.create_requisition")
+def create_requisition(client):
+    return lambda: client.requisition.create_requisition(
+        "https://gocardless.com", "reference", "REVOLUT_REVOGB21"
+    )
+
+
+@benchmark("requisitions.get_requisitions")
+def get_requisitions(client):
+    return client.requisition.get_requisitions
+
+
+@benchmark("requisitions.get_requisition_by_id")
+def get_requisition_by_id(client):
+    id = client.bench_ids["requisition"]
+    return lambda: client.requisition.get_requisition_by_id(id)
+
+
+@benchmark("requisitions.delete_requisition")
+def delete_requisition(client):
+    id = client.bench_ids["requisition"]
+    return lambda: client.requisition.delete_requisition(id)
+
+
+@benchmark("accounts.get_metadata")
+def get_metadata(client):
+    return client.account_api(ACCOUNT_ID).get_metadata
+
+
+@benchmark("accounts.get_balances")
+def get_balances(client):
+    return client.account_api(ACCOUNT_ID).get_balances
+
+
+@benchmark("accounts.get_details")
+def get_details(client):
+    return client.account_api(ACCOUNT_ID).get_details
+
+
+@benchmark("accounts.get_transactions")
+def get_transactions(client):
+    account = client.account_api(ACCOUNT_ID)
+    return lambda: account.get_transactions("2022-01-01", "2022-12-31")
+
+
+@benchmark("accounts.iter_transactions")
+def iter_transactions(client):
+    account = client.account_api(ACCOUNT_ID)
+    return lambda: sum(1 for _ in account.iter_transactions())
+
+
+@benchmark("accounts.get_premium_details")
+def get_premium_details(client):
+    account = client.account_api(ACCOUNT_ID)
+    return lambda: account.get_premium_details("LV")
+
+
+@benchmark("accounts.get_premium_balances")
+def get_premium_balances(client):
+    return client.account_api(ACCOUNT_ID).get_premium_balances
+
+
+@benchmark("accounts.get_premium_transactions")
+def get_premium_transactions(client):
+    account = client.account_api(ACCOUNT_ID)
+    return lambda: account.get_premium_transactions("LV")
+
+
+def measure(call: Callable[[], object], min_time: float) -> Result:
+    """
+    Measure throughput and peak memory of a single call.
+
+    Args:
+        call (Callable[[], object]): measured callable
+        min_time (float): minimum seconds to run throughput loop
+
+    Returns:
+        Result: operations per second and peak traced bytes per call
+    """
+    call()
+
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        iterations *= 2
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        call()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return Result(ops_per_sec=iterations / elapsed, peak_bytes=peak)
+
+
+def run(pattern: str = "", min_time: float = 0.2) -> Dict[str, Result]:
+    """
+    Run benchmarks which name contains pattern.
+
+    Args:
+        pattern (str, optional): benchmark name filter
+        min_time (float, optional): minimum seconds per benchmark
+
+    Returns:
+        Dict[str, Result]: results by benchmark name
+    """
+    client = create_client()
+    return {
+        name: measure(factory(client), min_time)
+        for name, factory in BENCHMARKS.items()
+        if pattern in name
+    }
+
+
+def compare(
+    results: Dict[str, Result],
+    baseline: Dict[str, Dict],
+    tolerance: float,
+) -> List[str]:
+    """
+    Find regressions against baseline.
+
+    Args:
+        results (Dict[str, Result]): current results
+        baseline (Dict[str, Dict]): stored results
+        tolerance (float): allowed relative regression, e.g 0.25
+
+    Returns:
+        List[str]: names of regressed benchmarks
+    """
+    regressions = []
+    for name, result in results.items():
+        stored = baseline.get(name)
+        if stored is None:
+            continue
+        slower = result.ops_per_sec < stored["ops_per_sec"] * (1 - tolerance)
+        # Small peaks are dominated by interpreter noise
+        heavier = result.peak_bytes > max(
+            stored["peak_bytes"] * (1 + tolerance), stored["peak_bytes"] + 1024
+        )
+        if slower or heavier:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "-k",
+        dest="pattern",
+        default="",
+        help="run benchmarks matching pattern",
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds per benchmark"
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="store results as baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative regression",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.min_time)
+    baseline = (
+        json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    )
+
+    print(
+        f"{'benchmark':45} {'ops/sec':>12} {'peak KiB':>10} "
+        f"{'vs baseline':>12}"
+    )
+    for name, result in results.items():
+        stored = baseline.get(name)
+        change = (
+            f"{result.ops_per_sec / stored['ops_per_sec'] - 1:+.0%}"
+            if stored
+            else "-"
+        )
+        print(
+            f"{name:45} {result.ops_per_sec:12,.0f} "
+            f"{result.peak_bytes / 1024:10.1f} {change:>12}"
+        )
+
+    if args.save:
+        baseline.update(
+            {name: asdict(result) for name, result in results.items()}
+        )
+        args.baseline.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n"
+        )
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nRegressed: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
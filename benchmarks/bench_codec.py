@@ -0,0 +1,83 @@
+"""
+Compare response.json() with bytes-level codecs on transaction payloads.
+
+Usage:
+    python -m benchmarks.bench_codec
+    python -m benchmarks.bench_codec --transactions 1000 10000
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, List
+
+from requests.models import Response
+
+from nordigen.testing.fake_api import generate_transactions
+from nordigen.utils.codec import CODECS
+
+
+def ops_per_sec(call: Callable[[], object], min_time: float) -> float:
+    call()
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            return iterations / elapsed
+        iterations *= 2
+
+
+def response_json(content: bytes) -> Callable[[], object]:
+    def decode():
+        # Fresh response, as returned by requests, without charset header
+        response = Response()
+        response._content = content
+        response.status_code = 200
+        return response.json()
+
+    return decode
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--transactions", type=int, nargs="+", default=[100, 1000, 10000]
+    )
+    parser.add_argument("--min-time", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    codecs = {}
+    for name, codec in CODECS.items():
+        try:
+            codecs[name] = codec()
+        except ImportError:
+            print(f"{name} is not installed, skipping")
+
+    print(f"{'payload':>22} {'decoder':18} {'ops/sec':>10} {'speedup':>8}")
+    for count in args.transactions:
+        content = json.dumps(
+            {
+                "transactions": {
+                    "booked": generate_transactions(count),
+                    "pending": [],
+                }
+            }
+        ).encode()
+        label = f"{count} txns {len(content) // 1024} KiB"
+        baseline = ops_per_sec(response_json(content), args.min_time)
+        print(
+            f"{label:>22} {'response.json()':18} {baseline:10,.0f} {1:8.1f}x"
+        )
+        for name, codec in codecs.items():
+            rate = ops_per_sec(lambda: codec.loads(content), args.min_time)
+            print(
+                f"{'':>22} {name + '.loads':18} {rate:10,.0f} "
+                f"{rate / baseline:8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -62,22 +62,15 @@ def results():
             requisition_id=session["req_id"]
         )["accounts"]
 
-        accounts_data = []
-        for id in accounts:
-            account = client.account_api(id)
-            metadata = account.get_metadata()
-            transactions = account.get_transactions()
-            details = account.get_details()
-            balances = account.get_balances()
-
-            accounts_data.append(
-                {
-                    "metadata": metadata,
-                    "details": details,
-                    "balances": balances,
-                    "transactions": transactions,
-                }
-            )
+        # Fetch metadata, details, balances and transactions concurrently
+        snapshot = client.fetch_accounts(accounts)
+        accounts_data = [
+            {
+                **account.data,
+                "errors": {k: str(v) for k, v in account.errors.items()},
+            }
+            for account in snapshot.accounts.values()
+        ]
 
         return jsonify(accounts_data)
 
@@ -1 +1,3 @@
+from .aio import AsyncNordigenClient
 from .nordigen import NordigenClient
+from .tenants import TenantRegistry
@@ -0,0 +1,5 @@
+import sys
+
+from nordigen.cli import main
+
+sys.exit(main())
@@ -0,0 +1,7 @@
+from .client import (
+    AsyncAccountApi,
+    AsyncAgreementsApi,
+    AsyncInstitutionsApi,
+    AsyncNordigenClient,
+    AsyncRequisitionsApi,
+)
@@ -0,0 +1,433 @@
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Dict, Final, Optional, Tuple, Type
+
+from requests.models import HTTPError
+
+from nordigen.api import (
+    AccountApi,
+    AgreementsApi,
+    InstitutionsApi,
+    RequisitionsApi,
+)
+from nordigen.types.http_enums import HTTPMethod
+from nordigen.types.models import Model
+from nordigen.types.types import (
+    EnduserAgreement,
+    Requisition,
+    RequisitionDto,
+    TokenType,
+)
+from nordigen.utils.filter import DataFilter
+from nordigen.utils.pagination import apaginate
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+# NordigenClient options AsyncNordigenClient does not implement
+UNSUPPORTED_OPTIONS: Final = frozenset(
+    {
+        "pool_connections",
+        "keep_alive",
+        "prewarm",
+        "max_workers",
+        "auto_refresh",
+        "token_refresh_margin",
+        "rate_limiter",
+        "retry_policy",
+        "cache",
+        "coalesce",
+        "metrics",
+        "codec",
+        "transport",
+        "reuse_agreements",
+        "executor",
+    }
+)
+
+
+class AsyncInstitutionsApi(InstitutionsApi):
+    """
+    Institution API class for AsyncNordigenClient.
+
+    Methods that only wrap a single request are inherited and return
+    awaitables, methods that post-process responses are overridden.
+    Institution catalog is not available, its loading is synchronous.
+    """
+
+    def _create_catalog(self) -> None:
+        return None
+
+    async def get_institution_id_by_name(
+        self, country: str, institution: str
+    ) -> str:
+        """
+        Get institution id by institution name.
+
+        Args:
+            country (str): Two-character country code
+            institution (str): Institution name (ex: Revolut)
+
+        Raises:
+            ValueError: If institution with given name is not found
+
+        Returns:
+            str: Institution id
+        """
+        institutions = await self.get_institutions(country)
+
+        for bank in institutions:
+            if institution.lower() in bank["name"].lower():
+                return bank["id"]
+
+        raise ValueError(f"Institution: {institution} is not found")
+
+
+class AsyncRequisitionsApi(RequisitionsApi):
+    """Requisitions API class for AsyncNordigenClient."""
+
+    def iter_requisitions(
+        self, limit: int = 100, offset: int = 0, prefetch: bool = False
+    ) -> AsyncIterator[Requisition]:
+        """
+        Iterate over requisitions of all pages.
+
+        Args:
+            limit (int, optional): number of results to fetch per page.
+                Defaults to 100.
+            offset (int, optional): the initial index from which to return
+                the results. Defaults to 0.
+            prefetch (bool, optional): fetch next page in background.
+                Defaults to False.
+
+        Returns:
+            AsyncIterator[Requisition]: requisitions one by one
+        """
+        return apaginate(self.get_requisitions, limit, offset, prefetch)
+
+
+class AsyncAgreementsApi(AgreementsApi):
+    """Agreements API class for AsyncNordigenClient."""
+
+    def iter_agreements(
+        self, limit: int = 100, offset: int = 0, prefetch: bool = False
+    ) -> AsyncIterator[EnduserAgreement]:
+        """
+        Iterate over agreements of all pages.
+
+        Args:
+            limit (int, optional): number of results to fetch per page.
+                Defaults to 100.
+            offset (int, optional): the initial index from which to return
+                the results. Defaults to 0.
+            prefetch (bool, optional): fetch next page in background.
+                Defaults to False.
+
+        Returns:
+            AsyncIterator[EnduserAgreement]: agreements one by one
+        """
+        return apaginate(self.get_agreements, limit, offset, prefetch)
+
+
+class AsyncAccountApi(AccountApi):
+    """
+    Account API class for AsyncNordigenClient.
+
+    Transactions are iterated from decoded response, response body is not
+    streamed.
+    """
+
+    @classmethod
+    async def _iter_response(
+        cls, response: Awaitable[Dict]
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        transactions = (await response)["transactions"]
+        for status in cls.TRANSACTION_STATUSES:
+            for transaction in transactions.get(status, []):
+                yield status, transaction
+
+    def iter_transactions(
+        self, date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Iterate over account transactions one by one.
+
+        Args:
+            date_from (Optional[str], optional): date_from. Defaults to None.
+            date_to (Optional[str], optional): date_to. Defaults to None.
+
+        Returns:
+            AsyncIterator[Tuple[str, Dict]]: transaction status ("booked"
+                or "pending") and transaction
+        """
+        return self._iter_response(self.get_transactions(date_from, date_to))
+
+    def iter_premium_transactions(
+        self,
+        country: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Iterate over premium transactions one by one.
+
+        Args:
+            country (Optional[str], optional): country in iso format.
+                Defaults to None.
+            date_from (Optional[str], optional): date_from. Defaults to None.
+            date_to (Optional[str], optional): date_to. Defaults to None.
+
+        Returns:
+            AsyncIterator[Tuple[str, Dict]]: transaction status ("booked"
+                or "pending") and transaction
+        """
+        return self._iter_response(
+            self.get_premium_transactions(country, date_from, date_to)
+        )
+
+
+class AsyncNordigenClient:
+    """
+    Asyncio counterpart of NordigenClient.
+
+    API classes are shared with NordigenClient, every API method returns
+    an awaitable. All requests go through one pooled httpx.AsyncClient and
+    are limited by a semaphore.
+
+    Requests are sent once, without retries, rate limiting, caching or
+    metrics, and access token is not refreshed automatically. Passing
+    NordigenClient options for these features raises ValueError.
+
+    Attributes
+    ---------
+    secret_key (str): Generated secret_key
+    secret_id (str): Generated secret_id
+    timeout (int): Request timeout in seconds
+    base_url (str): API base url
+    pool_maxsize (int): Maximum number of connections kept open
+    max_concurrency (int): Maximum number of requests in flight
+    response_models (bool): Return lazily parsed models from
+        nordigen.types.models instead of dicts where available
+    """
+
+    __ENDPOINT: Final = "token"
+
+    def __init__(
+        self,
+        secret_key: str,
+        secret_id: str,
+        timeout: int = 10,
+        base_url: str = "https://bankaccountdata.gocardless.com/api/v2",
+        pool_maxsize: int = 100,
+        max_concurrency: int = 100,
+        response_models: bool = False,
+        **options,
+    ) -> None:
+        unsupported = UNSUPPORTED_OPTIONS.intersection(options)
+        if unsupported:
+            raise ValueError(
+                f"AsyncNordigenClient does not support {sorted(unsupported)}, "
+                "use NordigenClient"
+            )
+        if options:
+            raise TypeError(f"Unexpected keyword arguments {sorted(options)}")
+        if httpx is None:
+            raise ImportError(
+                "AsyncNordigenClient requires httpx. "
+                "Install it with `pip install nordigen[async]`"
+            )
+
+        self.secret_key = secret_key
+        self.secret_id = secret_id
+        self.base_url = base_url
+        self._headers = {
+            "accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": "Nordigen-Python-v2",
+        }
+        self._token: Optional[str] = None
+        self._timeout = timeout
+        self._max_concurrency = max_concurrency
+        self.response_models = response_models
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize,
+            ),
+        )
+        self.institution = AsyncInstitutionsApi(client=self)
+        self.requisition = AsyncRequisitionsApi(client=self)
+        self.agreement = AsyncAgreementsApi(client=self)
+        self.data_filter = DataFilter()
+
+    def account_api(self, id: str) -> AsyncAccountApi:
+        """
+        Create Account api instance.
+
+        Args:
+            id (str): account id
+
+        Returns:
+            AsyncAccountApi: Account instance with awaitable methods
+        """
+        return AsyncAccountApi(client=self, id=id)
+
+    @property
+    def token(self):
+        """
+        Get token.
+
+        Returns:
+            str: return token
+        """
+        return self._token
+
+    @token.setter
+    def token(self, value: str):
+        """
+        Set token.
+
+        Args:
+            value (str): token
+        """
+        self._token = value
+        self._headers["Authorization"] = f"Bearer {value}"
+
+    async def generate_token(self) -> TokenType:
+        """
+        Generate new access token.
+
+        Returns:
+            TokenType: Dict that contains access and refresh token
+        """
+        payload = {"secret_key": self.secret_key, "secret_id": self.secret_id}
+        response = await self.request(
+            HTTPMethod.POST, f"{self.__ENDPOINT}/new/", payload
+        )
+
+        self.token = response["access"]
+        return response
+
+    async def exchange_token(self, refresh_token: str) -> TokenType:
+        """
+        Exchange refresh token for access token.
+
+        Args:
+            refresh_token (str): refresh token
+
+        Returns:
+            TokenType: Dict that contains new access token
+        """
+        payload = {"refresh": refresh_token}
+        response = await self.request(
+            HTTPMethod.POST, f"{self.__ENDPOINT}/refresh/", payload
+        )
+
+        self.token = response["access"]
+        return response
+
+    async def request(
+        self,
+        method: HTTPMethod,
+        endpoint: str,
+        data: Dict = None,
+        headers: Dict = None,
+        model: Optional[Type[Model]] = None,
+    ) -> Dict:
+        """
+        Async request wrapper for Nordigen library.
+
+        Args:
+            method (HTTPMethod): Supports GET, POST, PUT, DELETE
+            endpoint (str): endpoint url
+            data (Dict, optional): body or parameters that need to be sent
+                alongside with the request. Defaults to {}.
+            model (Type[Model], optional): response model used when
+                response_models is enabled
+
+        Raises:
+            Exception: HTTP method is not supported
+            HTTPError: HTTP error with status code
+
+        Returns:
+            Dict: JSON response
+        """
+        request_meta = {
+            "url": f"{self.base_url}/{endpoint}",
+            "headers": headers if headers else self._headers,
+        }
+
+        data = self.data_filter.filter_payload(data)
+
+        if method in (HTTPMethod.GET, HTTPMethod.DELETE):
+            request_meta["params"] = data
+        elif method in (HTTPMethod.POST, HTTPMethod.PUT):
+            request_meta["content"] = json.dumps(data)
+        else:
+            raise Exception(f'Method "{method}" is not supported')
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async with self._semaphore:
+            response = await self._session.request(
+                method.value, **request_meta
+            )
+
+        if response.is_success:
+            if model is not None and self.response_models:
+                return model.from_json(response.content)
+            return response.json()
+
+        raise HTTPError(
+            {"response": response.json(), "status": response.status_code},
+            response=response,
+        )
+
+    async def initialize_session(
+        self,
+        redirect_uri: str,
+        institution_id: str,
+        reference_id: str,
+        max_historical_days: int = 90,
+        access_valid_for_days: int = 90,
+        account_selection: bool = False,
+    ) -> RequisitionDto:
+        """
+        Factory method that creates agreement and requisition.
+
+        Returns:
+            RequisitionDto: link to initiate authorization with bank
+                and requisition_id
+        """
+        agreement = await self.agreement.create_agreement(
+            max_historical_days=max_historical_days,
+            access_valid_for_days=access_valid_for_days,
+            institution_id=institution_id,
+        )
+
+        requisition = await self.requisition.create_requisition(
+            redirect_uri=redirect_uri,
+            reference_id=reference_id,
+            institution_id=institution_id,
+            agreement=agreement["id"],
+            account_selection=account_selection,
+        )
+
+        return RequisitionDto(
+            link=requisition["link"], requisition_id=requisition["id"]
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._session.aclose()
+
+    async def __aenter__(self) -> "AsyncNordigenClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
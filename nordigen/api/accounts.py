@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Final, Optional
+from typing import TYPE_CHECKING, Dict, Final, Iterator, Optional, Tuple
 
 from nordigen.types.http_enums import HTTPMethod
+from nordigen.types.models import AccountBalancesModel, AccountDataModel
+from nordigen.utils.stream import iter_json_items
 
 if TYPE_CHECKING:
     from nordigen import NordigenClient
@@ -23,38 +25,66 @@ class AccountApi:
     """
 
     __ENDPOINT: Final = "accounts"
+    TRANSACTION_STATUSES: Final = ("booked", "pending")
 
     def __init__(self, client: NordigenClient, id: str) -> None:
+        self.__client = client
         self.__request = client.request
         self.__id: str = id
 
-    def __get(self, endpoint: str, parameters: dict = {}):
+    def __stream_transactions(
+        self, url: str, parameters: dict
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Stream transactions from response body without decoding it at once.
+
+        Args:
+            url (str): transactions endpoint
+            parameters (dict): query parameters
+
+        Returns:
+            Iterator[Tuple[str, Dict]]: transaction status and transaction
+        """
+        chunks = self.__client.stream(HTTPMethod.GET, url, parameters)
+        paths = [
+            ("transactions", status) for status in self.TRANSACTION_STATUSES
+        ]
+        for path, transaction in iter_json_items(chunks, paths):
+            yield path[-1], transaction
+
+    def __get(self, endpoint: str, parameters: dict = {}, model=None):
         """
         Construct get request.
 
         Args:
             endpoint (str): endpoint
+            model (Type[Model], optional): response model
 
         Returns:
             [type]: [description]
         """
         url = f"{self.__ENDPOINT}/{self.__id}/{endpoint}/"
-        return self.__request(HTTPMethod.GET, f"{url}", parameters)
+        return self.__request(
+            HTTPMethod.GET, f"{url}", parameters, model=model
+        )
 
 
-    def __getPremium(self, path, parameters: dict = {}):
+    def __getPremium(self, path, parameters: dict = {}, model=None):
         """
         Construct get request for premium endpoints
 
         Args:
             path (_type_): _description_
             parameters (dict, optional): _description_. Defaults to {}.
+            model (Type[Model], optional): response model
 
         Returns:
             _type_: _description_
         """
         url = f'{self.__ENDPOINT}/premium/{self.__id}/{path}'
-        return self.__request(HTTPMethod.GET, f"{url}", parameters)
+        return self.__request(
+            HTTPMethod.GET, f"{url}", parameters, model=model
+        )
 
     def get_metadata(self) -> dict:
         """
@@ -66,7 +96,9 @@ class AccountApi:
             AccountData: account metadata
         """
         return self.__request(
-            HTTPMethod.GET, f"{self.__ENDPOINT}/{self.__id}/"
+            HTTPMethod.GET,
+            f"{self.__ENDPOINT}/{self.__id}/",
+            model=AccountDataModel,
         )
 
     def get_balances(self) -> dict:
@@ -77,7 +109,7 @@ class AccountApi:
         Returns:
             dict: dictionary with balances
         """
-        return self.__get("balances")
+        return self.__get("balances", model=AccountBalancesModel)
 
     def get_details(self) -> dict:
         """
@@ -108,6 +140,32 @@ class AccountApi:
         }
         return self.__get("transactions", date_range)
 
+    def iter_transactions(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Stream account transactions one by one.
+        Response is decoded incrementally, so memory usage does not depend
+        on the length of transaction history.
+
+        Args:
+            date_from (Optional[str], optional): date_from. Defaults to None.
+            date_to (Optional[str], optional): date_to. Defaults to None.
+
+        Returns:
+            Iterator[Tuple[str, Dict]]: transaction status ("booked" or
+                "pending") and transaction
+        """
+        date_range = {
+            "date_from": date_from,
+            "date_to": date_to
+        }
+        return self.__stream_transactions(
+            f"{self.__ENDPOINT}/{self.__id}/transactions/", date_range
+        )
+
 
     def get_premium_details(self, country: str = "") -> dict:
         """
@@ -131,7 +189,7 @@ class AccountApi:
         Returns:
             dict: balances data
         """
-        return self.__getPremium("balances")
+        return self.__getPremium("balances", model=AccountBalancesModel)
 
     def get_premium_transactions(
         self,
@@ -156,3 +214,31 @@ class AccountApi:
             "country": country or "",
         }
         return self.__getPremium("transactions", parameters)
+
+    def iter_premium_transactions(
+        self,
+        country: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Stream premium transactions one by one.
+
+        Args:
+            country (Optional[str], optional): country in iso format.
+                Defaults to None.
+            date_from (Optional[str], optional): date_from. Defaults to None.
+            date_to (Optional[str], optional): date_to. Defaults to None.
+
+        Returns:
+            Iterator[Tuple[str, Dict]]: transaction status ("booked" or
+                "pending") and transaction
+        """
+        parameters = {
+            "date_from": date_from,
+            "date_to": date_to,
+            "country": country or "",
+        }
+        return self.__stream_transactions(
+            f"{self.__ENDPOINT}/premium/{self.__id}/transactions", parameters
+        )
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Final, List, Union
+from typing import TYPE_CHECKING, Dict, Final, Iterator, List, Union
 
 from nordigen.types.http_enums import HTTPMethod
+from nordigen.types.models import EnduserAgreementModel
 from nordigen.types.types import AgreementsList, EnduserAgreement
+from nordigen.utils.pagination import paginate
 
 if TYPE_CHECKING:
     from nordigen.client import NordigenClient
@@ -57,7 +59,10 @@ class AgreementsApi:
         }
 
         return self.__client.request(
-            HTTPMethod.POST, f"{self.__ENDPOINT}/", payload
+            HTTPMethod.POST,
+            f"{self.__ENDPOINT}/",
+            payload,
+            model=EnduserAgreementModel,
         )
 
     def get_agreements(
@@ -80,6 +85,25 @@ class AgreementsApi:
             HTTPMethod.GET, f"{self.__ENDPOINT}/", params
         )
 
+    def iter_agreements(
+        self, limit: int = 100, offset: int = 0, prefetch: bool = False
+    ) -> Iterator[EnduserAgreement]:
+        """
+        Iterate over agreements of all pages.
+
+        Args:
+            limit (int, optional): number of results to fetch per page.
+                Defaults to 100.
+            offset (int, optional): the initial index from which to return
+                the results. Defaults to 0.
+            prefetch (bool, optional): fetch next page in background.
+                Defaults to False.
+
+        Returns:
+            Iterator[EnduserAgreement]: agreements one by one
+        """
+        return paginate(self.get_agreements, limit, offset, prefetch)
+
     def get_agreement_by_id(self, agreement_id: str) -> EnduserAgreement:
         """
         Get agreement by agreement id.
@@ -90,7 +114,9 @@ class AgreementsApi:
             EnduserAgreement: JSON object with specific enduser agreements
         """
         return self.__client.request(
-            HTTPMethod.GET, f"{self.__ENDPOINT}/{agreement_id}"
+            HTTPMethod.GET,
+            f"{self.__ENDPOINT}/{agreement_id}",
+            model=EnduserAgreementModel,
         )
 
     def delete_agreement(self, agreement_id: str) -> Dict:
@@ -125,4 +151,5 @@ class AgreementsApi:
             HTTPMethod.PUT,
             f"{self.__ENDPOINT}/{agreement_id}/accept/",
             payload,
+            model=EnduserAgreementModel,
         )
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Final, List, Optional
 
 from nordigen.types import Institutions
 from nordigen.types.http_enums import HTTPMethod
+from nordigen.types.models import InstitutionModel
+from nordigen.utils.institution_catalog import InstitutionCatalog
 
 if TYPE_CHECKING:
     from nordigen import NordigenClient
@@ -16,6 +18,8 @@ class InstitutionsApi:
     Attributes
     ---------
     client(NordigenClient): Injectable NordigenClient object to make an http requests
+    catalog(InstitutionCatalog): Cached and indexed institutions of all
+        countries
 
     Returns: None
     """
@@ -25,6 +29,10 @@ class InstitutionsApi:
     def __init__(self, client: NordigenClient) -> None:
         self.__request = client.request
         self.ENDPOINT = "institutions"
+        self.catalog = self._create_catalog()
+
+    def _create_catalog(self) -> Optional[InstitutionCatalog]:
+        return InstitutionCatalog(fetch=self.get_institutions)
 
     def get_institutions(self, country: Optional[str] = None) -> List[Institutions]:
         """
@@ -42,7 +50,7 @@ class InstitutionsApi:
             url = f"{self.ENDPOINT}/?country={country}"
 
         return self.__request(
-            HTTPMethod.GET, url
+            HTTPMethod.GET, url, model=InstitutionModel
         )
 
     def get_institution_by_id(self, id: str) -> Institutions:
@@ -55,13 +63,19 @@ class InstitutionsApi:
         Returns:
             Institutions: Institutions json object
         """
-        return self.__request(HTTPMethod.GET, f"{self.ENDPOINT}/{id}/")
+        return self.__request(
+            HTTPMethod.GET, f"{self.ENDPOINT}/{id}/", model=InstitutionModel
+        )
 
     def get_institution_id_by_name(
         self, country: str, institution: str
     ) -> str:
         """
-        Get institution id by institution name.
+        Get institution id by institution name. First institution of
+        country which name contains given name is returned, in the order
+        institutions are returned by the API. Institutions are looked up
+        in the cached catalog, so repeated calls do not download the
+        institution list again.
 
         Args:
             country (str): Two-character country code
@@ -73,10 +87,9 @@ class InstitutionsApi:
         Returns:
             str: Institution id
         """
-        institutions = self.get_institutions(country)
-
-        for bank in institutions:
-            if institution.lower() in bank["name"].lower():
+        name = institution.lower()
+        for bank in self.catalog.institutions(country):
+            if name in bank["name"].lower():
                 return bank["id"]
 
         raise ValueError(f"Institution: {institution} is not found")
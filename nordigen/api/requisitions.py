@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Final, List
+from typing import TYPE_CHECKING, Dict, Final, Iterator, List
 
 from nordigen.types.http_enums import HTTPMethod
+from nordigen.types.models import RequisitionModel
 from nordigen.types.types import Requisition
+from nordigen.utils.pagination import paginate
 
 if TYPE_CHECKING:
     from nordigen import NordigenClient
@@ -43,6 +45,25 @@ class RequisitionsApi:
             HTTPMethod.GET, f"{self.ENDPOINT}/", payload
         )
 
+    def iter_requisitions(
+        self, limit: int = 100, offset: int = 0, prefetch: bool = False
+    ) -> Iterator[Requisition]:
+        """
+        Iterate over requisitions of all pages.
+
+        Args:
+            limit (int, optional): number of results to fetch per page.
+                Defaults to 100.
+            offset (int, optional): the initial index from which to return
+                the results. Defaults to 0.
+            prefetch (bool, optional): fetch next page in background.
+                Defaults to False.
+
+        Returns:
+            Iterator[Requisition]: requisitions one by one
+        """
+        return paginate(self.get_requisitions, limit, offset, prefetch)
+
     def create_requisition(
         self,
         redirect_uri: str,
@@ -82,7 +103,10 @@ class RequisitionsApi:
             payload["account_selection"] = account_selection
 
         return self.__client.request(
-            HTTPMethod.POST, f"{self.ENDPOINT}/", payload
+            HTTPMethod.POST,
+            f"{self.ENDPOINT}/",
+            payload,
+            model=RequisitionModel,
         )
 
     def get_requisition_by_id(self, requisition_id: str) -> Requisition:
@@ -95,7 +119,9 @@ class RequisitionsApi:
             Requisition: account details
         """
         return self.__client.request(
-            HTTPMethod.GET, f"{self.ENDPOINT}/{requisition_id}/"
+            HTTPMethod.GET,
+            f"{self.ENDPOINT}/{requisition_id}/",
+            model=RequisitionModel,
         )
 
     def delete_requisition(self, requisition_id: str) -> Dict:
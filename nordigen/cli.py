@@ -0,0 +1,359 @@
+"""
+Command line interface.
+
+Usage:
+    python -m nordigen sync --requisitions ID [ID ...] --output DIR
+    python -m nordigen sync --accounts ID [ID ...] --output DIR --workers 20
+    python -m nordigen sync --accounts ID [ID ...] --output DIR --resume RUN
+
+Credentials are read from SECRET_ID and SECRET_KEY environment variables
+unless passed with --secret-id and --secret-key.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import IO, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from nordigen.nordigen import ACCOUNT_PARTS, NordigenClient
+from nordigen.utils.export import NdjsonTransactionWriter
+
+# Account data larger than this is spooled to disk until account completes
+SPOOL_SIZE = 1024 * 1024
+
+
+class Checkpoint:
+    """
+    Append only list of accounts synced completely in one run. First line
+    holds run parameters, resumed run must use the same ones. Every other
+    line holds account id and sizes of output files once its data was
+    written, so resumed run can drop data written after the last line.
+
+    Attributes
+    ---------
+    path (Path): Checkpoint file path
+    parameters (Dict): Parts and date window of run
+    done (Set[str]): Ids of synced accounts
+    sizes (Dict[str, int]): Output file size by part after last synced
+        account
+    """
+
+    def __init__(
+        self, path: Path, parameters: Dict, resume: bool = False
+    ) -> None:
+        self.path = path
+        self.parameters = parameters
+        self.done: Set[str] = set()
+        self.sizes: Dict[str, int] = {}
+        if not resume:
+            self._file = open(path, "x")
+            self._write(parameters)
+            return
+
+        with open(path) as file:
+            started = json.loads(file.readline())
+            # Last line is incomplete if run was killed while writing it
+            for line in file:
+                if not line.endswith("\n"):
+                    break
+                synced = json.loads(line)
+                self.done.add(synced["account_id"])
+                self.sizes = synced["sizes"]
+        if started != parameters:
+            raise ValueError(
+                f"Run {path.name} was started with {started}, not {parameters}"
+            )
+        self._file = open(path, "a")
+
+    def _write(self, data: Dict) -> None:
+        self._file.write(json.dumps(data) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def add(self, account_id: str, sizes: Dict[str, int]) -> None:
+        self._write({"account_id": account_id, "sizes": sizes})
+        self.done.add(account_id)
+        self.sizes = sizes
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _Output:
+    """
+    Gzip compressed NDJSON file of one part, data of every account is a
+    complete gzip member. Data written after last commit is truncated
+    when file is opened.
+    """
+
+    def __init__(self, path: Path, size: int = 0) -> None:
+        self._file = open(path, "ab")
+        self._file.truncate(size)
+        self.size = size
+
+    def append(self, spool: IO[bytes]) -> None:
+        spool.seek(0)
+        with gzip.GzipFile(fileobj=self._file, mode="wb") as member:
+            shutil.copyfileobj(spool, member)
+
+    def commit(self) -> int:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.size = self._file.tell()
+        return self.size
+
+    def rollback(self) -> None:
+        self._file.truncate(self.size)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+@dataclass
+class SyncSummary:
+    run: str
+    accounts: int = 0
+    skipped: int = 0
+    failed: int = 0
+    records: int = 0
+    elapsed: float = 0.0
+
+
+def _fetch_part(
+    account,
+    account_id: str,
+    part: str,
+    spool: IO[bytes],
+    date_from: Optional[str],
+    date_to: Optional[str],
+) -> int:
+    if part == "transactions":
+        return NdjsonTransactionWriter(spool).write(
+            account.iter_transactions(date_from, date_to), account_id
+        )
+    data = getattr(account, f"get_{part}")()
+    spool.write(
+        json.dumps({"account_id": account_id, "data": data}).encode() + b"\n"
+    )
+    return 1
+
+
+def sync(
+    client: NordigenClient,
+    account_ids: Iterable[str],
+    output: Path,
+    parts: Sequence[str] = ACCOUNT_PARTS,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    run: Optional[str] = None,
+) -> SyncSummary:
+    """
+    Fetch data of accounts on client worker pool into gzip NDJSON files.
+
+    Every run writes `<part>-<run>.ndjson.gz` files and `<run>.checkpoint`
+    into output directory. Transactions are streamed into a spooled
+    temporary file of their account. Once all parts of account are
+    fetched, they are appended to output files as complete gzip members
+    and the account is recorded in checkpoint, so failed accounts leave
+    no partial lines. Resumed run truncates data written after the last
+    recorded account and skips recorded accounts.
+
+    Args:
+        client (NordigenClient): client with access token
+        account_ids (Iterable[str]): account ids
+        output (Path): output directory
+        parts (Sequence[str], optional): account parts to fetch
+        date_from (Optional[str], optional): transactions date_from
+        date_to (Optional[str], optional): transactions date_to
+        run (Optional[str], optional): id of interrupted run to resume,
+            new run is started if None
+
+    Raises:
+        ValueError: resumed run was started with other parts or dates
+
+    Returns:
+        SyncSummary: run id and number of synced, skipped and failed accounts
+    """
+    started = time.perf_counter()
+    output.mkdir(parents=True, exist_ok=True)
+    summary = SyncSummary(run=run or time.strftime("%Y%m%dT%H%M%S"))
+    checkpoint = Checkpoint(
+        output / f"{summary.run}.checkpoint",
+        {"parts": list(parts), "date_from": date_from, "date_to": date_to},
+        resume=run is not None,
+    )
+    outputs = {
+        part: _Output(
+            output / f"{part}-{summary.run}.ndjson.gz",
+            checkpoint.sizes.get(part, 0),
+        )
+        for part in parts
+    }
+    lock = Lock()
+
+    def commit(account_id: str, spools: Dict[str, IO[bytes]]) -> None:
+        with lock:
+            try:
+                for part in parts:
+                    outputs[part].append(spools[part])
+                sizes = {part: outputs[part].commit() for part in parts}
+            except BaseException:
+                for file in outputs.values():
+                    file.rollback()
+                raise
+            checkpoint.add(account_id, sizes)
+
+    def process(account_id: str) -> int:
+        account = client.account_api(account_id)
+        spools = {
+            part: tempfile.SpooledTemporaryFile(SPOOL_SIZE) for part in parts
+        }
+        try:
+            records = sum(
+                _fetch_part(
+                    account, account_id, part, spools[part], date_from, date_to
+                )
+                for part in parts
+            )
+            commit(account_id, spools)
+            return records
+        finally:
+            for spool in spools.values():
+                spool.close()
+
+    try:
+        futures = {}
+        for account_id in dict.fromkeys(account_ids):
+            if account_id in checkpoint.done:
+                summary.skipped += 1
+                continue
+            futures[client.executor.submit(process, account_id)] = account_id
+
+        for future in as_completed(futures):
+            account_id = futures[future]
+            try:
+                summary.records += future.result()
+            except Exception as error:
+                summary.failed += 1
+                print(f"{account_id}: {error}", file=sys.stderr)
+            else:
+                summary.accounts += 1
+    finally:
+        for file in outputs.values():
+            file.close()
+        checkpoint.close()
+
+    summary.elapsed = time.perf_counter() - started
+    return summary
+
+
+def _requisition_accounts(
+    client: NordigenClient, requisition_ids: Sequence[str]
+) -> Tuple[List[str], Dict[str, Exception]]:
+    futures = {
+        client.executor.submit(
+            client.requisition.get_requisition_by_id, id
+        ): id
+        for id in requisition_ids
+    }
+    accounts, errors = [], {}
+    for future in as_completed(futures):
+        try:
+            accounts += future.result()["accounts"]
+        except Exception as error:
+            errors[futures[future]] = error
+    return accounts, errors
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m nordigen")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser(
+        "sync", help="fetch account data into gzip compressed NDJSON files"
+    )
+    ids = command.add_mutually_exclusive_group(required=True)
+    ids.add_argument(
+        "--requisitions", nargs="+", metavar="ID", help="requisition ids"
+    )
+    ids.add_argument("--accounts", nargs="+", metavar="ID", help="account ids")
+    command.add_argument(
+        "--output", type=Path, required=True, help="output directory"
+    )
+    command.add_argument(
+        "--workers", type=int, default=10, help="concurrent requests"
+    )
+    command.add_argument(
+        "--parts",
+        nargs="+",
+        choices=ACCOUNT_PARTS,
+        default=list(ACCOUNT_PARTS),
+    )
+    command.add_argument(
+        "--date-from", help="transactions from date, YYYY-MM-DD"
+    )
+    command.add_argument("--date-to", help="transactions to date, YYYY-MM-DD")
+    command.add_argument(
+        "--resume", metavar="RUN", help="continue interrupted run"
+    )
+    command.add_argument("--secret-id", default=os.getenv("SECRET_ID"))
+    command.add_argument("--secret-key", default=os.getenv("SECRET_KEY"))
+    command.add_argument(
+        "--base-url", default="https://bankaccountdata.gocardless.com/api/v2"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.secret_id or not args.secret_key:
+        parser.error("credentials are missing, set SECRET_ID and SECRET_KEY")
+    if (
+        args.resume
+        and not (args.output / f"{args.resume}.checkpoint").exists()
+    ):
+        parser.error(f"run {args.resume} is not found in {args.output}")
+
+    with NordigenClient(
+        secret_id=args.secret_id,
+        secret_key=args.secret_key,
+        base_url=args.base_url,
+        pool_maxsize=args.workers,
+        max_workers=args.workers,
+    ) as client:
+        client.generate_token()
+        errors = {}
+        account_ids = args.accounts
+        if args.requisitions:
+            account_ids, errors = _requisition_accounts(
+                client, args.requisitions
+            )
+        for id, error in errors.items():
+            print(f"requisition {id}: {error}", file=sys.stderr)
+
+        try:
+            summary = sync(
+                client,
+                account_ids,
+                args.output,
+                args.parts,
+                args.date_from,
+                args.date_to,
+                args.resume,
+            )
+        except ValueError as error:
+            parser.error(str(error))
+
+    print(
+        f"run {summary.run}: synced {summary.accounts} accounts "
+        f"({summary.records} records), skipped {summary.skipped}, "
+        f"failed {summary.failed + len(errors)} in {summary.elapsed:.1f}s",
+        file=sys.stderr,
+    )
+    return 1 if summary.failed or errors else 0
@@ -1,5 +1,20 @@
 import json
-from typing import Dict, Final, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread
+from typing import (
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union
+)
 
 import requests
 from requests.models import HTTPError, Response
@@ -10,9 +25,33 @@ from nordigen.api import (
     InstitutionsApi,
     RequisitionsApi
 )
+from nordigen.transport import RequestsTransport, Transport
 from nordigen.types.http_enums import HTTPMethod
-from nordigen.types.types import RequisitionDto, TokenType
+from nordigen.types.models import Model
+from nordigen.types.types import (
+    AccountSnapshot,
+    AccountsSnapshot,
+    OnboardingResult,
+    RequisitionDto,
+    SessionRequest,
+    TokenType
+)
+from nordigen.utils.agreement_pool import AgreementPool, agreement_reusable
+from nordigen.utils.cache import ResponseCache, cache_scope
+from nordigen.utils.coalesce import SingleFlight
+from nordigen.utils.codec import JsonCodec, get_codec
+from nordigen.utils.endpoints import request_key
 from nordigen.utils.filter import DataFilter
+from nordigen.utils.metrics import HOOK_EVENTS, MetricsCollector, RequestEvent
+from nordigen.utils.onboarding import (
+    SQLiteOnboardingStore,
+    initialize_sessions
+)
+from nordigen.utils.rate_limit import RateLimiter
+from nordigen.utils.retry import RetryPolicy
+from nordigen.utils.token_manager import TokenManager
+
+ACCOUNT_PARTS: Final = ("metadata", "details", "balances", "transactions")
 
 
 class NordigenClient:
@@ -23,6 +62,40 @@ class NordigenClient:
     ---------
     secret_key (str): Generated secret_key
     secret_id (str): Generated secret_id
+    timeout (int): Request timeout in seconds
+    base_url (str): API base url
+    pool_connections (int): Number of connection pools to cache
+    pool_maxsize (int): Maximum number of connections kept per host
+    keep_alive (bool): Reuse connections between requests
+    prewarm (int): Number of connections to open on initialization
+    max_workers (int): Size of the worker pool used by bulk methods
+    auto_refresh (bool): Refresh access token before it expires
+    token_refresh_margin (int): Seconds before expiry to refresh token
+    rate_limiter (RateLimiter): Throttles requests using rate limit headers
+    retry_policy (RetryPolicy): Retries transient failures of idempotent
+        requests
+    response_models (bool): Return lazily parsed models from
+        nordigen.types.models instead of dicts where available
+    cache (ResponseCache): Caches responses of slowly changing endpoints
+    coalesce (bool): Share one in-flight request between concurrent
+        identical GET requests
+    codec (JsonCodec): Encodes request bodies and decodes response bytes,
+        response.json() and json.dumps are used if None
+    transport (Transport): Sends HTTP requests, pooled requests session
+        is used if None. pool_connections and pool_maxsize only configure
+        default transport. Transport and executor passed in are not closed
+        by close()
+    executor (ThreadPoolExecutor): Worker pool of bulk methods shared with
+        other clients, created on first use if None
+    reuse_agreements (bool): Reuse compatible unaccepted agreements not
+        linked to requisition in initialize_session
+    metrics (MetricsCollector): Collects per endpoint latency, status
+        codes, bytes transferred and retries
+    hooks (Dict[str, List[Callable]]): Callbacks run for every request
+        attempt, see register_hook()
+
+    Client owns a persistent HTTP transport. Use it as a context manager
+    or call close() to release pooled connections.
     """
 
     __ENDPOINT: Final = "token"
@@ -32,7 +105,24 @@ class NordigenClient:
         secret_key: str,
         secret_id: str,
         timeout: int = 10,
-        base_url: str = "https://bankaccountdata.gocardless.com/api/v2"
+        base_url: str = "https://bankaccountdata.gocardless.com/api/v2",
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        prewarm: int = 0,
+        max_workers: int = 10,
+        auto_refresh: bool = True,
+        token_refresh_margin: int = 60,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_models: bool = False,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        metrics: Optional[MetricsCollector] = None,
+        codec: Union[str, JsonCodec, None] = None,
+        transport: Optional[Transport] = None,
+        reuse_agreements: bool = False,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         self.secret_key = secret_key
         self.secret_id = secret_id
@@ -42,12 +132,137 @@ class NordigenClient:
             "Content-Type": "application/json",
             "User-Agent": "Nordigen-Python-v2",
         }
+        if not keep_alive:
+            self._headers["Connection"] = "close"
         self._token: Optional[str] = None
         self._timeout = timeout
+        self._auto_refresh = auto_refresh
+        self.token_manager = TokenManager(refresh_margin=token_refresh_margin)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.response_models = response_models
+        self.cache = cache
+        self.coalescer = SingleFlight() if coalesce else None
+        self.hooks: Dict[str, List[Callable]] = {
+            event: [] for event in HOOK_EVENTS
+        }
+        self.codec = get_codec(codec) if codec is not None else None
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.install(self)
         self.institution = InstitutionsApi(client=self)
         self.requisition = RequisitionsApi(client=self)
         self.agreement = AgreementsApi(client=self)
+        self.agreement_pool = (
+            AgreementPool(self.agreement, self.requisition)
+            if reuse_agreements else None
+        )
         self.data_filter = DataFilter()
+        self._owns_transport = transport is None
+        self.transport = transport or RequestsTransport(
+            pool_connections, pool_maxsize
+        )
+        self._max_workers = max_workers
+        self._owns_executor = executor is None
+        self._executor: Optional[ThreadPoolExecutor] = executor
+        self._executor_lock = Lock()
+
+        if prewarm:
+            self.prewarm(prewarm)
+
+    @property
+    def _session(self) -> requests.Session:
+        """
+        Session of requests transport, used to mount custom adapters.
+
+        Returns:
+            requests.Session: pooled session
+        """
+        return self.transport.session
+
+    def prewarm(self, connections: int = 1) -> None:
+        """
+        Open connections to the API host ahead of the first request.
+
+        Handshakes are performed concurrently so up to `connections`
+        sockets are kept alive in the pool. Errors are ignored, the pool
+        simply stays cold.
+
+        Args:
+            connections (int, optional): number of connections to open.
+                Defaults to 1.
+        """
+        def warm() -> None:
+            try:
+                self.transport.prewarm(self.base_url, timeout=self._timeout)
+            except requests.RequestException:
+                pass
+
+        threads = [Thread(target=warm) for _ in range(connections)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Worker pool used by bulk methods, created on first use.
+
+        Returns:
+            ThreadPoolExecutor: executor bounded by max_workers
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="nordigen",
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Close pooled connections and shut down worker pool."""
+        with self._executor_lock:
+            if self._executor is not None and self._owns_executor:
+                self._executor.shutdown()
+                self._executor = None
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> "NordigenClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def register_hook(self, event: str, hook: Callable) -> None:
+        """
+        Register callback run for every request attempt.
+
+        before_request(event) runs before attempt is sent,
+        after_response(event, response) runs for every received response,
+        on_error(event) runs when transport raises exception.
+
+        Args:
+            event (str): before_request, after_response or on_error
+            hook (Callable): callback receiving RequestEvent
+
+        Raises:
+            ValueError: unknown event
+        """
+        if event not in self.hooks:
+            raise ValueError(f'Hook event "{event}" is not supported')
+        self.hooks[event].append(hook)
+
+    def stats(self) -> List[Dict]:
+        """
+        Get request metrics collected by metrics collector.
+
+        Returns:
+            List[Dict]: metrics per method, endpoint template and institution,
+                slowest first. Empty if client has no metrics collector
+        """
+        return self.metrics.snapshot() if self.metrics else []
 
     def account_api(self, id: str) -> AccountApi:
         """
@@ -61,6 +276,64 @@ class NordigenClient:
         """
         return AccountApi(client=self, id=id)
 
+    def fetch_accounts(
+        self,
+        account_ids: Iterable[str],
+        parts: Sequence[str] = ACCOUNT_PARTS,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> AccountsSnapshot:
+        """
+        Fetch data of many accounts concurrently.
+
+        Every (account, part) pair is requested on the client worker pool.
+        Failed parts are collected per account instead of failing the
+        whole batch.
+
+        Args:
+            account_ids (Iterable[str]): account ids
+            parts (Sequence[str], optional): any of "metadata", "details",
+                "balances", "transactions". Defaults to all of them.
+            date_from (str, optional): transactions date_from
+            date_to (str, optional): transactions date_to
+
+        Raises:
+            ValueError: If unknown part is requested
+
+        Returns:
+            AccountsSnapshot: per account data and errors with wall time
+        """
+        unknown = set(parts) - set(ACCOUNT_PARTS)
+        if unknown:
+            raise ValueError(f"Unknown account parts: {sorted(unknown)}")
+
+        def fetch(account: AccountApi, part: str) -> Dict:
+            if part == "metadata":
+                return account.get_metadata()
+            if part == "transactions":
+                return account.get_transactions(date_from, date_to)
+            return getattr(account, f"get_{part}")()
+
+        started = time.perf_counter()
+        accounts = {id: AccountSnapshot(id=id) for id in account_ids}
+        futures = [
+            (accounts[id], part, self.executor.submit(
+                fetch, self.account_api(id), part
+            ))
+            for id in accounts
+            for part in parts
+        ]
+
+        for snapshot, part, future in futures:
+            try:
+                snapshot.data[part] = future.result()
+            except Exception as error:
+                snapshot.errors[part] = error
+
+        return AccountsSnapshot(
+            accounts=accounts, elapsed=time.perf_counter() - started
+        )
+
     @property
     def token(self):
         """
@@ -81,6 +354,7 @@ class NordigenClient:
         """
         self._token = value
         self._headers["Authorization"] = f"Bearer {value}"
+        self.token_manager.forget_access()
 
     def generate_token(self) -> TokenType:
         """
@@ -98,6 +372,7 @@ class NordigenClient:
         )
 
         self.token = response["access"]
+        self.token_manager.update(response)
         return response
 
     def exchange_token(self, refresh_token: str) -> TokenType:
@@ -119,6 +394,7 @@ class NordigenClient:
         )
 
         self.token = response["access"]
+        self.token_manager.update(response)
         return response
 
     def request(
@@ -127,6 +403,7 @@ class NordigenClient:
         endpoint: str,
         data: Dict = None,
         headers: Dict = None,
+        model: Optional[Type[Model]] = None,
     ) -> Response:
         """
         Request wrapper for Nordigen library.
@@ -136,6 +413,8 @@ class NordigenClient:
             endpoint (str): [endpoint url
             data (Dict, optional): body or parameters that need to be sent alongside with the request.
                 Defaults to {}.
+            model (Type[Model], optional): response model used when
+                response_models is enabled
 
         Raises:
             Exception: HTTP method is not supported
@@ -144,30 +423,241 @@ class NordigenClient:
         Returns:
             Response: JSON Response object
         """
+        if method == HTTPMethod.GET and (self.cache or self.coalescer):
+            content = self._get_content(endpoint, data, headers)
+            return self._decode(content, model)
+
+        response = self._perform(method, endpoint, data, headers)
+        if self.cache:
+            self.cache.invalidate(
+                endpoint, cache_scope(self.base_url, self.secret_id)
+            )
+
+        if model is not None and self.response_models:
+            return model.from_json(response.content)
+        if self.codec:
+            return self.codec.loads(response.content)
+        return response.json()
+
+    def _get_content(
+        self, endpoint: str, data: Dict = None, headers: Dict = None
+    ) -> bytes:
+        """
+        Get body of GET response through cache and request coalescing.
+
+        Bodies are shared as bytes, so every caller decodes its own copy.
+
+        Returns:
+            bytes: response body
+        """
+        params = self.data_filter.filter_payload(data)
+        if self.cache:
+            scope = cache_scope(self.base_url, self.secret_id)
+            content = self.cache.get(endpoint, params, scope)
+            if content is not None:
+                return content
+
+        def fetch() -> bytes:
+            response = self._perform(HTTPMethod.GET, endpoint, data, headers)
+            content = response.content
+            if self.cache:
+                self.cache.set(endpoint, params, content, scope)
+            return content
+
+        if self.coalescer:
+            return self.coalescer.do(request_key(endpoint, params), fetch)
+        return fetch()
+
+    def _decode(self, content: bytes, model: Optional[Type[Model]]):
+        """
+        Decode response body.
+
+        Args:
+            content (bytes): response body
+            model (Type[Model], optional): response model
+
+        Returns:
+            JSON response or model when response_models is enabled
+        """
+        if model is not None and self.response_models:
+            return model.from_json(content)
+        if self.codec:
+            return self.codec.loads(content)
+        return json.loads(content)
+
+    def stream(
+        self,
+        method: HTTPMethod,
+        endpoint: str,
+        data: Dict = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[bytes]:
+        """
+        Request wrapper that streams response body instead of decoding it.
+
+        Args:
+            method (HTTPMethod): Supports GET, POST, PUT, DELETE
+            endpoint (str): endpoint url
+            data (Dict, optional): body or parameters that need to be sent
+                alongside with the request. Defaults to {}.
+            chunk_size (int, optional): size of yielded chunks in bytes
+
+        Raises:
+            HTTPError: HTTP error with status code
+
+        Yields:
+            bytes: raw response body chunks
+        """
+        response = self._perform(method, endpoint, data, stream=True)
+        try:
+            yield from response.iter_content(chunk_size=chunk_size)
+        finally:
+            response.close()
+
+    def _perform(
+        self,
+        method: HTTPMethod,
+        endpoint: str,
+        data: Dict = None,
+        headers: Dict = None,
+        stream: bool = False,
+    ) -> Response:
+        """
+        Send request with token refresh, rate limiting and retries.
+
+        Raises:
+            Exception: HTTP method is not supported
+            HTTPError: HTTP error with status code
+
+        Returns:
+            Response: successful HTTP response
+        """
         request_meta = {
             "url": f"{self.base_url}/{endpoint}",
             "headers": headers if headers else self._headers,
         }
+        if stream:
+            request_meta["stream"] = True
 
         data = self.data_filter.filter_payload(data)
 
-        if method == HTTPMethod.GET:
-            response = requests.get(**request_meta, params=data, timeout=self._timeout)
-        elif method == HTTPMethod.POST:
-            response = requests.post(**request_meta, data=json.dumps(data), timeout=self._timeout)
-        elif method == HTTPMethod.PUT:
-            response = requests.put(**request_meta, data=json.dumps(data), timeout=self._timeout)
-        elif method == HTTPMethod.DELETE:
-            response = requests.delete(**request_meta, params=data, timeout=self._timeout)
-        else:
-            raise Exception(f'Method "{method}" is not supported')
-
-        if response.ok:
-            return response.json()
-
-        raise HTTPError(
-            {"response": response.json(), "status": response.status_code}, response=response
-        )
+        if self._auto_refresh and not endpoint.startswith(self.__ENDPOINT):
+            self.token_manager.ensure_fresh(
+                self.exchange_token, self.generate_token
+            )
+
+        if self.retry_policy:
+            self.retry_policy.start()
+
+        hooked = any(self.hooks.values())
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(endpoint)
+
+            if hooked:
+                event = RequestEvent(method.value, endpoint, attempt)
+                self._run_hooks("before_request", event)
+                started = time.perf_counter()
+
+            try:
+                response = self._send(method, request_meta, data)
+            except Exception as error:
+                if hooked:
+                    event.elapsed = time.perf_counter() - started
+                    event.error = error
+                    self._run_hooks("on_error", event)
+                if not isinstance(
+                    error, (requests.ConnectionError, requests.Timeout)
+                ):
+                    raise
+                delay = self._retry_delay(
+                    attempt, method, endpoint, error=error
+                )
+                if delay is None:
+                    raise
+            else:
+                if hooked:
+                    event.elapsed = time.perf_counter() - started
+                    event.status = response.status_code
+                    self._run_hooks("after_response", event, response)
+
+                if self.rate_limiter:
+                    self.rate_limiter.update(
+                        endpoint, response.status_code, response.headers
+                    )
+
+                if response.ok:
+                    return response
+
+                delay = self._retry_delay(
+                    attempt, method, endpoint, response=response
+                )
+                if delay is None:
+                    raise HTTPError(
+                        {
+                            "response": response.json(),
+                            "status": response.status_code,
+                        },
+                        response=response,
+                    )
+                # Return connection of streamed response to pool
+                response.close()
+
+            self.retry_policy.sleep(delay)
+            attempt += 1
+
+    def _run_hooks(self, name: str, *args) -> None:
+        for hook in self.hooks[name]:
+            hook(*args)
+
+    def _retry_delay(
+        self, attempt: int, method: HTTPMethod, endpoint: str, **failure
+    ) -> Optional[float]:
+        """
+        Get delay before retry of failed attempt.
+
+        Returns:
+            Optional[float]: seconds to wait, None if request is not retried
+        """
+        if not self.retry_policy:
+            return None
+        return self.retry_policy.delay(attempt, method, endpoint, **failure)
+
+    def _send(
+        self, method: HTTPMethod, request_meta: Dict, data: Dict
+    ) -> Response:
+        """
+        Send single request through transport.
+
+        Args:
+            method (HTTPMethod): Supports GET, POST, PUT, DELETE
+            request_meta (Dict): url and headers
+            data (Dict): filtered body or parameters
+
+        Raises:
+            Exception: HTTP method is not supported
+
+        Returns:
+            Response: HTTP response
+        """
+        dumps = self.codec.dumps if self.codec else json.dumps
+        if method in (HTTPMethod.GET, HTTPMethod.DELETE):
+            return self.transport.send(
+                method.value,
+                **request_meta,
+                params=data,
+                timeout=self._timeout,
+            )
+        elif method in (HTTPMethod.POST, HTTPMethod.PUT):
+            return self.transport.send(
+                method.value,
+                **request_meta,
+                data=dumps(data),
+                timeout=self._timeout,
+            )
+
+        raise Exception(f'Method "{method}" is not supported')
 
     def initialize_session(
         self,
@@ -188,23 +678,94 @@ class NordigenClient:
             Dict[str]: link to initiate authorization with bank and requisition_id
         """
         # Create agreement
-        agreement = self.agreement.create_agreement(
-            max_historical_days=max_historical_days,
-            access_valid_for_days=access_valid_for_days,
-            institution_id=institution_id,
+        agreement_id = self._obtain_agreement(
+            institution_id, max_historical_days, access_valid_for_days
         )
 
         requisition_dict = {
             "redirect_uri": redirect_uri,
             "reference_id": reference_id,
             "institution_id": institution_id,
-            "agreement": agreement["id"],
+            "agreement": agreement_id,
             "account_selection": account_selection,
         }
 
         # Create requisition
-        requisition = self.requisition.create_requisition(**requisition_dict)
+        try:
+            requisition = self.requisition.create_requisition(
+                **requisition_dict
+            )
+        except HTTPError as error:
+            if self.agreement_pool is not None and agreement_reusable(error):
+                self.agreement_pool.release(
+                    agreement_id,
+                    institution_id,
+                    max_historical_days,
+                    access_valid_for_days,
+                )
+            raise
 
         return RequisitionDto(
             link=requisition["link"], requisition_id=requisition["id"]
         )
+
+    def _obtain_agreement(
+        self,
+        institution_id: str,
+        max_historical_days: int,
+        access_valid_for_days: int,
+    ) -> str:
+        """
+        Reuse agreement from agreement pool or create new one.
+
+        Returns:
+            str: agreement id
+        """
+        if self.agreement_pool is not None:
+            return self.agreement_pool.acquire(
+                institution_id, max_historical_days, access_valid_for_days
+            )
+        return self.agreement.create_agreement(
+            max_historical_days=max_historical_days,
+            access_valid_for_days=access_valid_for_days,
+            institution_id=institution_id,
+        )["id"]
+
+    def initialize_sessions(
+        self,
+        session_requests: Iterable[
+            Union[SessionRequest, Tuple[str, str, str]]
+        ],
+        max_historical_days: int = 90,
+        access_valid_for_days: int = 90,
+        account_selection: bool = False,
+        store: Optional[SQLiteOnboardingStore] = None,
+    ) -> OnboardingResult:
+        """
+        Bulk variant of initialize_session for many end users.
+
+        Agreement and requisition creation of different end users is
+        pipelined on the client worker pool. Failures are collected per
+        end user instead of failing the whole batch.
+
+        Args:
+            session_requests (Iterable[Union[SessionRequest, Tuple]]):
+                institution id, reference id and redirect uri of every end user
+            max_historical_days (int, optional): Defaults to 90.
+            access_valid_for_days (int, optional): Defaults to 90.
+            account_selection (bool, optional): Defaults to False.
+            store (SQLiteOnboardingStore, optional): progress store, runs
+                using the same store skip already created agreements and
+                requisitions
+
+        Returns:
+            OnboardingResult: sessions and errors by reference id
+        """
+        return initialize_sessions(
+            self,
+            session_requests,
+            max_historical_days=max_historical_days,
+            access_valid_for_days=access_valid_for_days,
+            account_selection=account_selection,
+            store=store,
+        )
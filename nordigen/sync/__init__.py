@@ -0,0 +1,2 @@
+from .engine import SyncedTransaction, SyncResult, TransactionSync
+from .store import SQLiteSyncStore
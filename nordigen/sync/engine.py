@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from nordigen.sync.store import SQLiteSyncStore
+
+if TYPE_CHECKING:
+    from nordigen import NordigenClient
+
+
+@dataclass
+class SyncedTransaction:
+    key: str
+    status: str
+    transaction: Dict
+    is_new: bool
+
+
+@dataclass
+class SyncResult:
+    account_id: str
+    date_from: Optional[date]
+    date_to: date
+    transactions: List[SyncedTransaction] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+
+def transaction_key(transaction: Dict) -> str:
+    """
+    Get stable key of transaction.
+
+    Args:
+        transaction (Dict): Berlin Group transaction
+
+    Returns:
+        str: transactionId, internalTransactionId or content hash
+    """
+    if transaction.get("transactionId"):
+        return f"id:{transaction['transactionId']}"
+    if transaction.get("internalTransactionId"):
+        return f"internal:{transaction['internalTransactionId']}"
+    return f"hash:{content_hash('', transaction)}"
+
+
+def content_hash(status: str, transaction: Dict) -> str:
+    """
+    Hash transaction content together with its status.
+
+    Args:
+        status (str): booked or pending
+        transaction (Dict): Berlin Group transaction
+
+    Returns:
+        str: hex digest
+    """
+    content = json.dumps(
+        [status, transaction], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+class TransactionSync:
+    """
+    Incremental transaction sync built on AccountApi.get_transactions.
+
+    Only transactions since the last synced date minus `overlap_days` are
+    requested. Transactions already seen with the same content are
+    skipped, so every sync emits only new and changed transactions.
+
+    Attributes
+    ---------
+    client (NordigenClient): Client used to fetch transactions
+    store (SQLiteSyncStore): Watermark and seen transaction store
+    overlap_days (int): Days before watermark requested again to catch
+        late booked transactions
+    initial_days (Optional[int]): History requested on first sync, API
+        default is used if None
+    """
+
+    def __init__(
+        self,
+        client: NordigenClient,
+        store: SQLiteSyncStore,
+        overlap_days: int = 3,
+        initial_days: Optional[int] = None,
+    ) -> None:
+        self.client = client
+        self.store = store
+        self.overlap_days = overlap_days
+        self.initial_days = initial_days
+
+    def window(
+        self, account_id: str, today: Optional[date] = None
+    ) -> Tuple[Optional[date], date]:
+        """
+        Get date range that needs to be requested for account.
+
+        Args:
+            account_id (str): account id
+            today (date, optional): end of window. Defaults to today.
+
+        Returns:
+            Tuple[Optional[date], date]: date_from (None for API default)
+                and date_to
+        """
+        today = today or date.today()
+        watermark = self.store.get_watermark(account_id)
+
+        if watermark is not None:
+            date_from = watermark - timedelta(days=self.overlap_days)
+        elif self.initial_days is not None:
+            date_from = today - timedelta(days=self.initial_days)
+        else:
+            date_from = None
+
+        return date_from, today
+
+    def sync(
+        self, account_id: str, today: Optional[date] = None
+    ) -> SyncResult:
+        """
+        Fetch delta window of account and record seen transactions.
+
+        Args:
+            account_id (str): account id
+            today (date, optional): end of window. Defaults to today.
+
+        Returns:
+            SyncResult: new and changed transactions
+        """
+        date_from, date_to = self.window(account_id, today)
+        response = self.client.account_api(account_id).get_transactions(
+            date_from=date_from.isoformat() if date_from else None,
+            date_to=date_to.isoformat(),
+        )
+
+        candidates = {}
+        occurrences: Dict[str, int] = {}
+        for status in ("booked", "pending"):
+            for transaction in response["transactions"].get(status, []):
+                key = transaction_key(transaction)
+                if key.startswith("hash:"):
+                    # Identical transactions without id, e.g two equal
+                    # payments on the same day, are told apart by order
+                    occurrences[key] = occurrences.get(key, 0) + 1
+                    key = f"{key}:{occurrences[key]}"
+                candidates[key] = (
+                    status,
+                    transaction,
+                    content_hash(status, transaction),
+                )
+
+        changed = self.store.commit(
+            account_id,
+            date_to,
+            ((key, item[2]) for key, item in candidates.items()),
+        )
+
+        return SyncResult(
+            account_id=account_id,
+            date_from=date_from,
+            date_to=date_to,
+            transactions=[
+                SyncedTransaction(
+                    key=key,
+                    status=candidates[key][0],
+                    transaction=candidates[key][1],
+                    is_new=is_new,
+                )
+                for key, is_new in changed.items()
+            ],
+        )
+
+    def sync_many(
+        self, account_ids: Iterable[str], today: Optional[date] = None
+    ) -> List[SyncResult]:
+        """
+        Sync many accounts concurrently on the client worker pool.
+
+        Args:
+            account_ids (Iterable[str]): account ids
+            today (date, optional): end of window. Defaults to today.
+
+        Returns:
+            List[SyncResult]: results in order of account ids, failed
+                accounts have error set and watermark unchanged
+        """
+        today = today or date.today()
+        futures = [
+            (id, self.client.executor.submit(self.sync, id, today))
+            for id in account_ids
+        ]
+
+        results = []
+        for id, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:
+                results.append(
+                    SyncResult(
+                        account_id=id,
+                        date_from=None,
+                        date_to=today,
+                        error=error,
+                    )
+                )
+        return results
@@ -0,0 +1,113 @@
+import sqlite3
+from datetime import date
+from threading import Lock
+from typing import Dict, Iterable, Optional, Tuple
+
+# Stay below SQLite host parameter limit of older versions
+BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    account_id TEXT PRIMARY KEY,
+    synced_to TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    account_id TEXT NOT NULL,
+    transaction_key TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (account_id, transaction_key)
+);
+"""
+
+
+class SQLiteSyncStore:
+    """
+    Local SQLite store of per account sync watermarks and seen
+    transactions.
+
+    Attributes
+    ---------
+    path (str): Database file path, ":memory:" for in-memory store
+    """
+
+    def __init__(self, path: str = "nordigen-sync.db") -> None:
+        self.path = path
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+    def get_watermark(self, account_id: str) -> Optional[date]:
+        """
+        Get date up to which account transactions have been synced.
+
+        Args:
+            account_id (str): account id
+
+        Returns:
+            Optional[date]: watermark or None if account was never synced
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT synced_to FROM watermarks WHERE account_id = ?",
+                (account_id,),
+            ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
+
+    def commit(
+        self,
+        account_id: str,
+        synced_to: date,
+        transactions: Iterable[Tuple[str, str]],
+    ) -> Dict[str, bool]:
+        """
+        Record seen transactions and move watermark in one transaction.
+
+        Args:
+            account_id (str): account id
+            synced_to (date): new watermark
+            transactions (Iterable[Tuple[str, str]]): transaction keys and
+                content hashes
+
+        Returns:
+            Dict[str, bool]: keys of transactions that are new or have
+                changed, mapped to True for new transactions
+        """
+        transactions = dict(transactions)
+
+        with self._lock, self._connection:
+            known = {}
+            keys = list(transactions)
+            for start in range(0, len(keys), BATCH_SIZE):
+                end = start + BATCH_SIZE
+                batch = keys[start:end]
+                placeholders = ",".join("?" * len(batch))
+                known.update(
+                    self._connection.execute(
+                        "SELECT transaction_key, content_hash "
+                        "FROM transactions WHERE account_id = ? "
+                        f"AND transaction_key IN ({placeholders})",
+                        (account_id, *batch),
+                    )
+                )
+
+            changed = {
+                key: key not in known
+                for key, content_hash in transactions.items()
+                if known.get(key) != content_hash
+            }
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO transactions "
+                "(account_id, transaction_key, content_hash) VALUES (?, ?, ?)",
+                ((account_id, key, transactions[key]) for key in changed),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO watermarks (account_id, synced_to) "
+                "VALUES (?, ?)",
+                (account_id, synced_to.isoformat()),
+            )
+
+        return changed
+
+    def close(self) -> None:
+        """Close database connection."""
+        self._connection.close()
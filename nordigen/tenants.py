@@ -0,0 +1,190 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import Any, Callable, Dict, Final, Iterator, List, Optional
+
+from nordigen.nordigen import NordigenClient
+from nordigen.transport import RequestsTransport, Transport
+from nordigen.utils.cache import ResponseCache
+from nordigen.utils.metrics import MetricsCollector
+from nordigen.utils.rate_limit import RateLimiter
+from nordigen.utils.retry import RetryPolicy
+
+# Client options holding state, sharing one instance would mix tenants
+PER_TENANT_OPTIONS: Final = frozenset(
+    {"rate_limiter", "retry_policy", "cache", "metrics"}
+)
+
+
+class TenantRegistry:
+    """
+    Registry of clients of many tenants, each with own credentials.
+
+    Clients share one transport and one worker pool, so sockets and
+    threads do not grow with number of tenants. Tokens, rate limit budgets
+    and metrics stay per tenant. Access token of tenant is generated on
+    first get().
+
+    Attributes
+    ---------
+    transport (Transport): Transport shared by all tenants
+    executor (ThreadPoolExecutor): Worker pool shared by all tenants
+    rate_limiter_factory (Optional[Callable[[], RateLimiter]]): Creates
+        rate limiter of every tenant, tenants are not throttled if None
+    retry_policy_factory (Optional[Callable[[], RetryPolicy]]): Creates
+        retry policy of every tenant, requests are not retried if None
+    cache_factory (Optional[Callable[[], ResponseCache]]): Creates
+        response cache of every tenant, responses are not cached if None
+    metrics (bool): Collect metrics of every tenant
+    client_options (Dict[str, Any]): Other NordigenClient options applied
+        to every tenant, e.g base_url or timeout. Stateful options
+        rate_limiter, retry_policy, cache and metrics are rejected, use
+        factories or pass them to register()
+    """
+
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        max_workers: int = 10,
+        pool_maxsize: int = 10,
+        rate_limiter_factory: Optional[Callable[[], RateLimiter]] = None,
+        retry_policy_factory: Optional[Callable[[], RetryPolicy]] = None,
+        cache_factory: Optional[Callable[[], ResponseCache]] = None,
+        metrics: bool = False,
+        **client_options: Any,
+    ) -> None:
+        shared = sorted(PER_TENANT_OPTIONS & client_options.keys())
+        if shared:
+            raise ValueError(
+                f"{', '.join(shared)} would be shared by all tenants, "
+                "pass a factory or set it per tenant in register()"
+            )
+        if transport is None:
+            transport = RequestsTransport(pool_maxsize=pool_maxsize)
+            # Session is shared by tenants, never carry cookies between them
+            transport.session.cookies.set_policy(
+                DefaultCookiePolicy(allowed_domains=[])
+            )
+        self.transport = transport
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="nordigen"
+        )
+        self.rate_limiter_factory = rate_limiter_factory
+        self.retry_policy_factory = retry_policy_factory
+        self.cache_factory = cache_factory
+        self.metrics = metrics
+        self.client_options = client_options
+        self._max_workers = max_workers
+        self._clients: Dict[str, NordigenClient] = {}
+        self._token_locks: Dict[str, Lock] = {}
+        self._lock = Lock()
+
+    def register(
+        self, tenant_id: str, secret_id: str, secret_key: str, **options: Any
+    ) -> NordigenClient:
+        """
+        Add tenant.
+
+        Args:
+            tenant_id (str): tenant identifier
+            secret_id (str): secret id of tenant
+            secret_key (str): secret key of tenant
+            **options: NordigenClient options of this tenant, override
+                registry client options
+
+        Raises:
+            ValueError: tenant is already registered
+
+        Returns:
+            NordigenClient: client of tenant
+        """
+        options = {**self.client_options, **options}
+        factories = {
+            "rate_limiter": self.rate_limiter_factory,
+            "retry_policy": self.retry_policy_factory,
+            "cache": self.cache_factory,
+            "metrics": MetricsCollector if self.metrics else None,
+        }
+        for name, factory in factories.items():
+            if factory and name not in options:
+                options[name] = factory()
+
+        client = NordigenClient(
+            secret_key=secret_key,
+            secret_id=secret_id,
+            transport=self.transport,
+            executor=self.executor,
+            max_workers=self._max_workers,
+            **options,
+        )
+        with self._lock:
+            if tenant_id in self._clients:
+                raise ValueError(f'Tenant "{tenant_id}" is already registered')
+            self._clients[tenant_id] = client
+            self._token_locks[tenant_id] = Lock()
+        return client
+
+    def get(self, tenant_id: str) -> NordigenClient:
+        """
+        Get client of tenant with access token.
+
+        Args:
+            tenant_id (str): tenant identifier
+
+        Raises:
+            KeyError: tenant is not registered
+
+        Returns:
+            NordigenClient: client of tenant
+        """
+        client = self._clients[tenant_id]
+        if client.token is None:
+            with self._token_locks[tenant_id]:
+                if client.token is None:
+                    client.generate_token()
+        return client
+
+    __getitem__ = get
+
+    def remove(self, tenant_id: str) -> None:
+        """
+        Remove tenant.
+
+        Args:
+            tenant_id (str): tenant identifier
+        """
+        with self._lock:
+            self._clients.pop(tenant_id, None)
+            self._token_locks.pop(tenant_id, None)
+
+    def __contains__(self, tenant_id: str) -> bool:
+        return tenant_id in self._clients
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._clients))
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def stats(self) -> Dict[str, List[Dict]]:
+        """
+        Get request metrics of every tenant.
+
+        Returns:
+            Dict[str, List[Dict]]: client.stats() by tenant id
+        """
+        return {
+            tenant_id: client.stats()
+            for tenant_id, client in list(self._clients.items())
+        }
+
+    def close(self) -> None:
+        """Shut down shared worker pool and close shared transport."""
+        self.executor.shutdown()
+        self.transport.close()
+
+    def __enter__(self) -> "TenantRegistry":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,3 @@
+from .adapter import FakeAdapter, install_fake_api
+from .fake_api import FakeBankAccountDataAPI, FakeResponse
+from .server import FakeServer, ServerBehaviour
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from io import BytesIO
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from nordigen.testing.fake_api import FakeBankAccountDataAPI
+
+if TYPE_CHECKING:
+    from nordigen import NordigenClient
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Requests transport adapter serving requests from FakeBankAccountDataAPI
+    without network.
+
+    Attributes
+    ---------
+    api (FakeBankAccountDataAPI): API stand-in
+    base_path (str): Path of API base url, e.g "/api/v2/"
+    """
+
+    def __init__(self, api: FakeBankAccountDataAPI, base_path: str) -> None:
+        super().__init__()
+        self.api = api
+        self.base_path = base_path.rstrip("/") + "/"
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        url = urlsplit(request.url)
+        body = request.body or b""
+        result = self.api.handle(
+            request.method,
+            url.path[len(self.base_path) :],
+            dict(parse_qsl(url.query)),
+            body.encode() if isinstance(body, str) else body,
+        )
+
+        response = Response()
+        response.status_code = result.status_code
+        response.headers = CaseInsensitiveDict(result.headers)
+        response.raw = BytesIO(result.body)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def install_fake_api(
+    client: NordigenClient, api: FakeBankAccountDataAPI = None
+) -> FakeBankAccountDataAPI:
+    """
+    Route all requests of client to in-process API stand-in.
+
+    Args:
+        client (NordigenClient): client instance
+        api (FakeBankAccountDataAPI, optional): API stand-in, new instance
+            is created if omitted
+
+    Returns:
+        FakeBankAccountDataAPI: API stand-in serving client requests
+    """
+    api = api or FakeBankAccountDataAPI()
+    adapter = FakeAdapter(api, urlsplit(client.base_url).path)
+    client._session.mount(client.base_url, adapter)
+    return api
@@ -0,0 +1,335 @@
+import json
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@dataclass
+class FakeResponse:
+    status_code: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=lambda: dict(JSON_HEADERS))
+
+
+def _json(status_code: int, data) -> FakeResponse:
+    return FakeResponse(status_code, json.dumps(data).encode())
+
+
+def generate_transactions(
+    count: int, start: date = date(2022, 1, 1)
+) -> List[Dict]:
+    """
+    Generate Berlin Group transactions.
+
+    Args:
+        count (int): number of transactions
+        start (date, optional): booking date of the first transaction
+
+    Returns:
+        List[Dict]: transactions
+    """
+    return [
+        {
+            "transactionId": f"{index:012d}",
+            "bookingDate": (start + timedelta(days=index % 730)).isoformat(),
+            "valueDate": (start + timedelta(days=index % 730)).isoformat(),
+            "transactionAmount": {
+                "amount": f"{(index % 2 * 2 - 1) * (index % 9973) / 100:.2f}",
+                "currency": "EUR",
+            },
+            "creditorName": f"Merchant {index % 97}",
+            "remittanceInformationUnstructured": f"Payment {index}",
+            "bankTransactionCode": "PMNT",
+        }
+        for index in range(count)
+    ]
+
+
+class FakeBankAccountDataAPI:
+    """
+    In-process stand-in of Bank Account Data API.
+
+    Serves every endpoint used by NordigenClient with generated data.
+    Created agreements and requisitions are kept in memory.
+
+    Attributes
+    ---------
+    transactions (int): Number of booked transactions per account
+    accounts_per_requisition (int): Number of accounts of new requisitions
+    """
+
+    def __init__(
+        self, transactions: int = 100, accounts_per_requisition: int = 2
+    ) -> None:
+        self.transactions = transactions
+        self.accounts_per_requisition = accounts_per_requisition
+        self.agreements: Dict[str, Dict] = {}
+        self.requisitions: Dict[str, Dict] = {}
+        self._lock = Lock()
+        self._transactions_body: Optional[bytes] = None
+        id = r"(?P<id>[^/]+)"
+        account = rf"accounts/(?:premium/)?{id}"
+        self._routes: List[Tuple[str, re.Pattern, Callable]] = [
+            (method, re.compile(pattern), handler)
+            for method, pattern, handler in (
+                ("POST", r"token/new/", self._token),
+                ("POST", r"token/refresh/", self._refresh),
+                ("GET", r"institutions/?", self._institutions),
+                ("GET", rf"institutions/{id}/", self._institution),
+                ("POST", r"agreements/enduser/", self._create_agreement),
+                ("GET", r"agreements/enduser/", self._list_agreements),
+                ("GET", rf"agreements/enduser/{id}/?", self._agreement),
+                (
+                    "DELETE",
+                    rf"agreements/enduser/{id}/?",
+                    self._delete_agreement,
+                ),
+                (
+                    "PUT",
+                    rf"agreements/enduser/{id}/accept/",
+                    self._accept_agreement,
+                ),
+                ("POST", r"requisitions/", self._create_requisition),
+                ("GET", r"requisitions/", self._list_requisitions),
+                ("GET", rf"requisitions/{id}/?", self._requisition),
+                ("DELETE", rf"requisitions/{id}/?", self._delete_requisition),
+                (
+                    "GET",
+                    rf"{account}/transactions/?",
+                    self._account_transactions,
+                ),
+                ("GET", rf"{account}/balances/?", self._balances),
+                ("GET", rf"{account}/details/?", self._details),
+                ("GET", rf"accounts/{id}/", self._account),
+            )
+        ]
+
+    def handle(
+        self, method: str, path: str, query: Dict[str, str], body: bytes
+    ) -> FakeResponse:
+        """
+        Serve request.
+
+        Args:
+            method (str): HTTP method
+            path (str): path relative to API base url, e.g "requisitions/"
+            query (Dict[str, str]): query parameters
+            body (bytes): request body
+
+        Returns:
+            FakeResponse: response
+        """
+        payload = json.loads(body) if body else {}
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                return handler(
+                    query=query, payload=payload, **match.groupdict()
+                )
+        return _json(404, {"summary": "Not found.", "status_code": 404})
+
+    def _token(self, payload, **kwargs) -> FakeResponse:
+        if not payload.get("secret_id") or not payload.get("secret_key"):
+            return _json(
+                401, {"summary": "Authentication failed", "status_code": 401}
+            )
+        return _json(
+            200,
+            {
+                "access": uuid.uuid4().hex,
+                "access_expires": 86400,
+                "refresh": uuid.uuid4().hex,
+                "refresh_expires": 2592000,
+            },
+        )
+
+    def _refresh(self, payload, **kwargs) -> FakeResponse:
+        return _json(
+            200, {"access": uuid.uuid4().hex, "access_expires": 86400}
+        )
+
+    @staticmethod
+    def _institution_data(id: str) -> Dict:
+        return {
+            "id": id,
+            "name": id.split("_")[0].title(),
+            "bic": id.split("_")[-1],
+            "transaction_total_days": "730",
+            "countries": ["LV", "GB"],
+            "logo": f"https://cdn-logos.gocardless.com/ais/{id}.png",
+        }
+
+    def _institutions(self, **kwargs) -> FakeResponse:
+        return _json(
+            200,
+            [
+                self._institution_data(f"BANK{index}_BANKLV{index:02d}")
+                for index in range(50)
+            ]
+            + [self._institution_data("REVOLUT_REVOGB21")],
+        )
+
+    def _institution(self, id, **kwargs) -> FakeResponse:
+        return _json(200, self._institution_data(id))
+
+    def _create_agreement(self, payload, **kwargs) -> FakeResponse:
+        agreement = {
+            "id": str(uuid.uuid4()),
+            "created": "2022-02-22T10:20:10.977Z",
+            "institution_id": payload.get("institution_id"),
+            "max_historical_days": payload.get("max_historical_days", 90),
+            "access_valid_for_days": payload.get("access_valid_for_days", 90),
+            "access_scope": payload.get(
+                "access_scope", ["balances", "details", "transactions"]
+            ),
+            "accepted": None,
+        }
+        with self._lock:
+            self.agreements[agreement["id"]] = agreement
+        return _json(201, agreement)
+
+    def _page(self, items: List[Dict], path: str, query: Dict) -> FakeResponse:
+        limit = int(query.get("limit", 100))
+        offset = int(query.get("offset", 0))
+        following = offset + limit
+        return _json(
+            200,
+            {
+                "count": len(items),
+                "next": (
+                    f"https://bankaccountdata.gocardless.com/api/v2/{path}"
+                    f"?limit={limit}&offset={following}"
+                    if following < len(items)
+                    else None
+                ),
+                "previous": None,
+                "results": items[offset:following],
+            },
+        )
+
+    def _list_agreements(self, query, **kwargs) -> FakeResponse:
+        with self._lock:
+            agreements = list(self.agreements.values())
+        return self._page(agreements, "agreements/enduser/", query)
+
+    def _agreement(self, id, **kwargs) -> FakeResponse:
+        agreement = self.agreements.get(id)
+        if agreement is None:
+            return _json(404, {"summary": "Not found.", "status_code": 404})
+        return _json(200, agreement)
+
+    def _delete_agreement(self, id, **kwargs) -> FakeResponse:
+        with self._lock:
+            self.agreements.pop(id, None)
+        return _json(
+            200, {"summary": "End User Agreement deleted", "status_code": 200}
+        )
+
+    def _accept_agreement(self, id, **kwargs) -> FakeResponse:
+        agreement = self.agreements.get(id)
+        if agreement is None:
+            return _json(404, {"summary": "Not found.", "status_code": 404})
+        agreement["accepted"] = "2022-02-22T10:25:10.977Z"
+        return _json(200, agreement)
+
+    def _create_requisition(self, payload, **kwargs) -> FakeResponse:
+        id = str(uuid.uuid4())
+        requisition = {
+            "id": id,
+            "created": "2022-02-22T10:20:10.977Z",
+            "redirect": payload.get("redirect"),
+            "status": "CR",
+            "institution_id": payload.get("institution_id"),
+            "agreement": payload.get("agreement"),
+            "reference": payload.get("reference"),
+            "accounts": [
+                str(uuid.uuid4()) for _ in range(self.accounts_per_requisition)
+            ],
+            "user_language": payload.get("user_language", "EN"),
+            "link": f"https://ob.gocardless.com/psd2/start/{id}",
+        }
+        with self._lock:
+            self.requisitions[id] = requisition
+        return _json(201, requisition)
+
+    def _list_requisitions(self, query, **kwargs) -> FakeResponse:
+        with self._lock:
+            requisitions = list(self.requisitions.values())
+        return self._page(requisitions, "requisitions/", query)
+
+    def _requisition(self, id, **kwargs) -> FakeResponse:
+        requisition = self.requisitions.get(id)
+        if requisition is None:
+            return _json(404, {"summary": "Not found.", "status_code": 404})
+        return _json(200, requisition)
+
+    def _delete_requisition(self, id, **kwargs) -> FakeResponse:
+        with self._lock:
+            self.requisitions.pop(id, None)
+        return _json(
+            200, {"summary": "Requisition deleted", "status_code": 200}
+        )
+
+    def _account(self, id, **kwargs) -> FakeResponse:
+        return _json(
+            200,
+            {
+                "id": id,
+                "created": "2022-02-22T10:37:34.556Z",
+                "last_accessed": "2022-02-22T10:37:34.556Z",
+                "iban": "LT213250024324970797",
+                "institution_id": "REVOLUT_REVOGB21",
+                "status": "READY",
+                "owner_name": "John Doe",
+            },
+        )
+
+    def _balances(self, **kwargs) -> FakeResponse:
+        return _json(
+            200,
+            {
+                "balances": [
+                    {
+                        "balanceAmount": {
+                            "amount": "657.49",
+                            "currency": "EUR",
+                        },
+                        "balanceType": balance_type,
+                        "referenceDate": "2022-02-22",
+                    }
+                    for balance_type in ("expected", "interimAvailable")
+                ]
+            },
+        )
+
+    def _details(self, id, **kwargs) -> FakeResponse:
+        return _json(
+            200,
+            {
+                "account": {
+                    "resourceId": id,
+                    "iban": "LT213250024324970797",
+                    "currency": "EUR",
+                    "ownerName": "John Doe",
+                    "product": "Current account",
+                }
+            },
+        )
+
+    def _account_transactions(self, **kwargs) -> FakeResponse:
+        # Transactions are the same for every account, encode them once
+        if self._transactions_body is None:
+            self._transactions_body = json.dumps(
+                {
+                    "transactions": {
+                        "booked": generate_transactions(self.transactions),
+                        "pending": generate_transactions(2, date(2023, 1, 1)),
+                    }
+                }
+            ).encode()
+        return FakeResponse(200, self._transactions_body)
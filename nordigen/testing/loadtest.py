@@ -0,0 +1,324 @@
+"""
+Load driver running simulated accounts through the client against
+FakeServer or any compatible base url.
+
+Usage:
+    python -m nordigen.testing.loadtest --accounts 200 --latency 0.05 \
+        --jitter 0.02
+    python -m nordigen.testing.loadtest --modes threaded async \
+        --error-rate 0.01 --retries 3
+"""
+
+import argparse
+import asyncio
+import math
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from nordigen.nordigen import NordigenClient
+from nordigen.testing.fake_api import FakeBankAccountDataAPI
+from nordigen.testing.server import FakeServer, ServerBehaviour
+from nordigen.transport import (
+    HttpxTransport,
+    RequestsTransport,
+    Urllib3Transport,
+)
+from nordigen.utils.retry import RetryPolicy
+
+MODES = ("sequential", "threaded", "async")
+TRANSPORTS = {
+    "requests": RequestsTransport,
+    "urllib3": Urllib3Transport,
+    "httpx": HttpxTransport,
+}
+
+
+@dataclass
+class LoadReport:
+    """
+    Result of load run.
+
+    Attributes
+    ---------
+    mode (str): sequential, threaded or async
+    accounts (int): Number of simulated accounts
+    elapsed (float): Wall time of run in seconds
+    latencies (List[float]): Latency of every request in seconds
+    errors (int): Number of failed requests
+    """
+
+    mode: str
+    accounts: int
+    elapsed: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Get latency percentile using nearest rank.
+
+        Args:
+            q (float): percentile, from 0 to 100
+
+        Returns:
+            float: latency in seconds
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "accounts": self.accounts,
+            "requests": self.requests,
+            "errors": self.errors,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class _Recorder:
+    def __init__(self, report: LoadReport) -> None:
+        self.report = report
+        self._lock = Lock()
+
+    def record(self, started: float, failed: bool) -> None:
+        latency = time.perf_counter() - started
+        with self._lock:
+            self.report.latencies.append(latency)
+            self.report.errors += failed
+
+    def call(self, function: Callable[[], Any]) -> None:
+        started = time.perf_counter()
+        try:
+            function()
+        except Exception:
+            self.record(started, True)
+        else:
+            self.record(started, False)
+
+    async def acall(self, function: Callable[[], Awaitable]) -> None:
+        started = time.perf_counter()
+        try:
+            await function()
+        except Exception:
+            self.record(started, True)
+        else:
+            self.record(started, False)
+
+
+def _account_ids(accounts: int) -> List[str]:
+    return [str(uuid.uuid4()) for _ in range(accounts)]
+
+
+def _sync_account(
+    client: NordigenClient, recorder: _Recorder, id: str
+) -> None:
+    account = client.account_api(id)
+    for call in (
+        account.get_metadata,
+        account.get_details,
+        account.get_balances,
+        account.get_transactions,
+    ):
+        recorder.call(call)
+
+
+async def _async_account(client, recorder: _Recorder, id: str) -> None:
+    account = client.account_api(id)
+    for call in (
+        account.get_metadata,
+        account.get_details,
+        account.get_balances,
+        account.get_transactions,
+    ):
+        await recorder.acall(call)
+
+
+def run_load(
+    base_url: str,
+    accounts: int = 100,
+    mode: str = "threaded",
+    concurrency: int = 10,
+    retry_policy: Optional[RetryPolicy] = None,
+    transport: str = "requests",
+) -> LoadReport:
+    """
+    Fetch metadata, details, balances and transactions of simulated accounts.
+
+    Args:
+        base_url (str): API base url
+        accounts (int, optional): number of simulated accounts
+        mode (str, optional): sequential, threaded or async
+        concurrency (int, optional): accounts processed in parallel in
+            threaded and async modes
+        retry_policy (Optional[RetryPolicy], optional): retry policy of
+            synchronous client
+        transport (str, optional): requests, urllib3 or httpx transport of
+            synchronous client
+
+    Returns:
+        LoadReport: throughput and latency of run
+    """
+    if mode not in MODES:
+        raise ValueError(f'Mode "{mode}" is not supported')
+
+    report = LoadReport(mode=mode, accounts=accounts)
+    recorder = _Recorder(report)
+    ids = _account_ids(accounts)
+
+    if mode == "async":
+        asyncio.run(_run_async(base_url, ids, concurrency, recorder))
+        return report
+
+    # Client does not close transport passed in
+    http = TRANSPORTS[transport](pool_maxsize=concurrency)
+    try:
+        with NordigenClient(
+            secret_key="SECRET_KEY",
+            secret_id="SECRET_ID",
+            base_url=base_url,
+            retry_policy=retry_policy,
+            transport=http,
+        ) as client:
+            client.generate_token()
+            started = time.perf_counter()
+            if mode == "sequential":
+                for id in ids:
+                    _sync_account(client, recorder, id)
+            else:
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    list(
+                        executor.map(
+                            lambda id: _sync_account(client, recorder, id), ids
+                        )
+                    )
+            report.elapsed = time.perf_counter() - started
+    finally:
+        http.close()
+
+    return report
+
+
+async def _run_async(
+    base_url: str, ids: List[str], concurrency: int, recorder: _Recorder
+) -> None:
+    from nordigen.aio import AsyncNordigenClient
+
+    async with AsyncNordigenClient(
+        secret_key="SECRET_KEY",
+        secret_id="SECRET_ID",
+        base_url=base_url,
+        pool_maxsize=concurrency,
+        max_concurrency=concurrency,
+    ) as client:
+        await client.generate_token()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def account(id: str) -> None:
+            async with semaphore:
+                await _async_account(client, recorder, id)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(account(id) for id in ids))
+        recorder.report.elapsed = time.perf_counter() - started
+
+
+def main(argv: List[str] = None) -> List[LoadReport]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--base-url", help="API base url, starts local FakeServer if omitted"
+    )
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument(
+        "--modes", nargs="+", choices=MODES, default=list(MODES)
+    )
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--transport", choices=TRANSPORTS, default="requests")
+    parser.add_argument(
+        "--retries", type=int, default=0, help="retries of synchronous client"
+    )
+    parser.add_argument(
+        "--transactions",
+        type=int,
+        default=100,
+        help="transactions per account",
+    )
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int)
+    parser.add_argument("--account-rate-limit", type=int)
+    parser.add_argument("--rate-limit-window", type=float, default=60.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = FakeServer(
+            api=FakeBankAccountDataAPI(transactions=args.transactions),
+            behaviour=ServerBehaviour(
+                latency=args.latency,
+                jitter=args.jitter,
+                error_rate=args.error_rate,
+                rate_limit=args.rate_limit,
+                account_rate_limit=args.account_rate_limit,
+                rate_limit_window=args.rate_limit_window,
+                seed=args.seed,
+            ),
+        ).start()
+        base_url = server.base_url
+
+    retry_policy = (
+        RetryPolicy(max_retries=args.retries) if args.retries else None
+    )
+    reports = []
+    try:
+        print(
+            f"{'mode':12} {'requests':>9} {'errors':>7} {'req/sec':>10} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for mode in args.modes:
+            report = run_load(
+                base_url,
+                args.accounts,
+                mode,
+                args.concurrency,
+                retry_policy,
+                args.transport,
+            )
+            reports.append(report)
+            print(
+                f"{mode:12} {report.requests:9} {report.errors:7} "
+                f"{report.throughput:10,.0f} "
+                f"{report.percentile(50) * 1000:8.1f} "
+                f"{report.percentile(95) * 1000:8.1f} "
+                f"{report.percentile(99) * 1000:8.1f}"
+            )
+    finally:
+        if server is not None:
+            server.stop()
+    return reports
+
+
+if __name__ == "__main__":
+    main()
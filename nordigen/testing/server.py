@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from nordigen.testing.fake_api import FakeBankAccountDataAPI, FakeResponse
+from nordigen.utils.rate_limit import (
+    ACCOUNT_HEADERS,
+    GENERAL_HEADERS,
+    rate_limit_buckets,
+)
+
+BASE_PATH = "/api/v2/"
+
+
+@dataclass
+class ServerBehaviour:
+    """
+    Simulated network and API behaviour of FakeServer.
+
+    Attributes
+    ---------
+    latency (float): Base response latency in seconds
+    jitter (float): Maximum random latency added to base latency in seconds
+    error_rate (float): Share of requests failing with 503, from 0 to 1
+    rate_limit (Optional[int]): Requests allowed per window for every
+        endpoint family, unlimited if None
+    account_rate_limit (Optional[int]): Requests allowed per window for
+        every account and scope, unlimited if None
+    rate_limit_window (float): Rate limit window in seconds
+    seed (Optional[int]): Random seed for reproducible runs
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit: Optional[int] = None
+    account_rate_limit: Optional[int] = None
+    rate_limit_window: float = 60.0
+    seed: Optional[int] = None
+
+
+class _Window:
+    """Fixed window request counter."""
+
+    def __init__(self, limit: int, length: float) -> None:
+        self.limit = limit
+        self.length = length
+        self.started = time.monotonic()
+        self.count = 0
+
+    def hit(self) -> Tuple[bool, int, float]:
+        now = time.monotonic()
+        if now - self.started >= self.length:
+            self.started = now
+            self.count = 0
+        reset = self.length - (now - self.started)
+        if self.count >= self.limit:
+            return False, 0, reset
+        self.count += 1
+        return True, self.limit - self.count, reset
+
+
+class FakeServer:
+    """
+    Local HTTP server exposing FakeBankAccountDataAPI with simulated latency,
+    failures and rate limits, for load tests without the real API.
+
+    Attributes
+    ---------
+    api (FakeBankAccountDataAPI): API stand-in serving responses
+    behaviour (ServerBehaviour): Simulated latency, errors and rate limits
+    host (str): Interface to listen on
+    port (int): Port to listen on, 0 picks free port
+    """
+
+    def __init__(
+        self,
+        api: FakeBankAccountDataAPI = None,
+        behaviour: ServerBehaviour = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.api = api or FakeBankAccountDataAPI()
+        self.behaviour = behaviour or ServerBehaviour()
+        self._random = random.Random(self.behaviour.seed)
+        self._windows: Dict[str, _Window] = {}
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """
+        Get API base url of running server.
+
+        Returns:
+            str: base url, e.g "http://127.0.0.1:8000/api/v2"
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH.rstrip('/')}"
+
+    def start(self) -> FakeServer:
+        """
+        Start serving in background thread.
+
+        Returns:
+            FakeServer: started server
+        """
+        self._thread = Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> FakeServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def serve(self, method: str, url: str, body: bytes) -> FakeResponse:
+        """
+        Serve request applying simulated behaviour.
+
+        Args:
+            method (str): HTTP method
+            url (str): request path with query string
+            body (bytes): request body
+
+        Returns:
+            FakeResponse: response
+        """
+        behaviour = self.behaviour
+        with self._lock:
+            delay = behaviour.latency + self._random.uniform(
+                0, behaviour.jitter
+            )
+            failed = self._random.random() < behaviour.error_rate
+        if delay:
+            time.sleep(delay)
+
+        split = urlsplit(url)
+        if not split.path.startswith(BASE_PATH):
+            return FakeResponse(
+                404, b'{"summary": "Not found.", "status_code": 404}'
+            )
+        path = split.path[len(BASE_PATH) :]
+
+        headers, limited_for = self._rate_limit(path)
+        if limited_for is not None:
+            headers["Retry-After"] = str(max(1, round(limited_for)))
+            return FakeResponse(
+                429,
+                json.dumps(
+                    {
+                        "summary": "Rate limit exceeded",
+                        "detail": (
+                            f"Try again in {headers['Retry-After']} seconds"
+                        ),
+                        "status_code": 429,
+                    }
+                ).encode(),
+                {"Content-Type": "application/json", **headers},
+            )
+
+        if failed:
+            return FakeResponse(
+                503,
+                json.dumps(
+                    {
+                        "summary": "Service temporarily unavailable",
+                        "status_code": 503,
+                    }
+                ).encode(),
+            )
+
+        response = self.api.handle(
+            method, path, dict(parse_qsl(split.query)), body
+        )
+        if headers:
+            response = FakeResponse(
+                response.status_code,
+                response.body,
+                {**response.headers, **headers},
+            )
+        return response
+
+    def _rate_limit(self, path: str) -> Tuple[Dict[str, str], Optional[float]]:
+        behaviour = self.behaviour
+        headers: Dict[str, str] = {}
+        limited_for = None
+        buckets = rate_limit_buckets(path)
+        limits = [
+            (buckets[0], behaviour.rate_limit, GENERAL_HEADERS),
+            *[
+                (bucket, behaviour.account_rate_limit, ACCOUNT_HEADERS)
+                for bucket in buckets[1:]
+            ],
+        ]
+
+        with self._lock:
+            for bucket, limit, names in limits:
+                if limit is None or bucket.startswith("token"):
+                    continue
+                window = self._windows.get(bucket)
+                if window is None:
+                    window = _Window(limit, behaviour.rate_limit_window)
+                    self._windows[bucket] = window
+                allowed, remaining, reset = window.hit()
+                headers[names[0][1]] = str(limit)
+                headers[names[1][1]] = str(remaining)
+                headers[names[2][1]] = str(max(1, round(reset)))
+                if not allowed:
+                    limited_for = max(limited_for or 0, reset)
+
+        return headers, limited_for
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _serve(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                response = server.serve(self.command, self.path, body)
+
+                self.send_response(response.status_code)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,5 @@
+from .base import Transport
+from .httpx_transport import HttpxTransport
+from .memory import InMemoryTransport
+from .requests_transport import RequestsTransport
+from .urllib3_transport import Urllib3Transport
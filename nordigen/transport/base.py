@@ -0,0 +1,96 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Mapping, Optional, Union
+
+from requests.models import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+
+class Transport(ABC):
+    """
+    Sends HTTP requests of NordigenClient.
+
+    Every transport returns requests.Response and raises
+    requests.ConnectionError or requests.Timeout on network failures, so
+    error handling and retries behave the same for every HTTP stack.
+    """
+
+    @abstractmethod
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict] = None,
+        data: Union[bytes, str, None] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> Response:
+        """
+        Send single request.
+
+        Args:
+            method (str): HTTP method
+            url (str): request url without query string
+            headers (Dict[str, str]): request headers
+            params (Optional[Dict], optional): query parameters
+            data (Union[bytes, str, None], optional): encoded request body
+            timeout (Optional[float], optional): timeout in seconds
+            stream (bool, optional): do not read response body upfront
+
+        Returns:
+            Response: HTTP response
+        """
+
+    def prewarm(self, url: str, timeout: Optional[float] = None) -> None:
+        """
+        Open pooled connection to host of url.
+
+        Args:
+            url (str): url to send HEAD request to
+            timeout (Optional[float], optional): timeout in seconds
+        """
+        self.send("HEAD", url, {}, timeout=timeout)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+
+
+def build_response(
+    method: str,
+    url: str,
+    status_code: int,
+    headers: Union[Mapping[str, str], Iterable],
+    content: Optional[bytes] = None,
+    raw=None,
+    body: Union[bytes, str, None] = None,
+) -> Response:
+    """
+    Build requests.Response from response of other HTTP stack.
+
+    Args:
+        method (str): HTTP method
+        url (str): request url
+        status_code (int): response status code
+        headers (Union[Mapping[str, str], Iterable]): response headers
+        content (Optional[bytes], optional): response body read upfront
+        raw (optional): file-like response body for streaming
+        body (Union[bytes, str, None], optional): request body
+
+    Returns:
+        Response: HTTP response
+    """
+    request = PreparedRequest()
+    request.method = method
+    request.url = url
+    request.body = body
+
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response.request = request
+    response.raw = raw
+    if content is not None:
+        response._content = content
+        response._content_consumed = True
+    return response
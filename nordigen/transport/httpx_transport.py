@@ -0,0 +1,96 @@
+from typing import Dict, Iterator, Optional, Union
+
+import requests
+from requests.models import Response
+
+from nordigen.transport.base import Transport, build_response
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class _StreamedBody:
+    """File-like view of streamed httpx response consumed by requests."""
+
+    def __init__(self, response: "httpx.Response") -> None:
+        self._response = response
+
+    def stream(
+        self, chunk_size: int, decode_content: bool = True
+    ) -> Iterator[bytes]:
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(error) from error
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(error) from error
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class HttpxTransport(Transport):
+    """
+    Transport sending requests through httpx.Client, optionally
+    multiplexing requests over HTTP/2 connections.
+
+    Requires httpx, HTTP/2 requires `pip install httpx[http2]`.
+
+    Attributes
+    ---------
+    client (httpx.Client): Pooled httpx client
+    """
+
+    def __init__(self, pool_maxsize: int = 10, http2: bool = False) -> None:
+        if httpx is None:
+            raise ImportError(
+                "HttpxTransport requires httpx. "
+                "Install it with `pip install nordigen[async]`"
+            )
+        self.client = httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize,
+            ),
+        )
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict] = None,
+        data: Union[bytes, str, None] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> Response:
+        request = self.client.build_request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            content=data,
+            timeout=timeout,
+        )
+        try:
+            response = self.client.send(request, stream=stream)
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(error) from error
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(error) from error
+
+        return build_response(
+            method,
+            str(request.url),
+            response.status_code,
+            response.headers.multi_items(),
+            content=None if stream else response.content,
+            raw=_StreamedBody(response) if stream else None,
+            body=data,
+        )
+
+    def close(self) -> None:
+        self.client.close()
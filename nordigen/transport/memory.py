@@ -0,0 +1,57 @@
+from typing import Dict, Optional, Union
+from urllib.parse import urlencode, urlsplit
+
+from requests.models import Response
+
+from nordigen.transport.base import Transport, build_response
+
+
+class InMemoryTransport(Transport):
+    """
+    Transport serving requests from FakeBankAccountDataAPI in process,
+    for tests and benchmarks without network or HTTP stack.
+
+    Attributes
+    ---------
+    api (FakeBankAccountDataAPI): API stand-in
+    base_path (str): Path of API base url
+    """
+
+    def __init__(self, api=None, base_path: str = "/api/v2/") -> None:
+        from nordigen.testing.fake_api import FakeBankAccountDataAPI
+
+        self.api = api or FakeBankAccountDataAPI()
+        self.base_path = base_path.rstrip("/") + "/"
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict] = None,
+        data: Union[bytes, str, None] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> Response:
+        body = data.encode() if isinstance(data, str) else data
+        path = urlsplit(url).path
+        if params:
+            url = f"{url}?{urlencode(params, doseq=True)}"
+
+        result = self.api.handle(
+            method,
+            path[len(self.base_path) :],
+            {key: str(value) for key, value in (params or {}).items()},
+            body or b"",
+        )
+        return build_response(
+            method,
+            url,
+            result.status_code,
+            result.headers,
+            content=result.body,
+            body=body,
+        )
+
+    def prewarm(self, url: str, timeout: Optional[float] = None) -> None:
+        pass
@@ -0,0 +1,57 @@
+from typing import Dict, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+
+from nordigen.transport.base import Transport
+
+
+class RequestsTransport(Transport):
+    """
+    Transport sending requests through pooled requests.Session.
+
+    Attributes
+    ---------
+    session (requests.Session): Session with mounted pooled adapters
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections, pool_maxsize=pool_maxsize
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict] = None,
+        data: Union[bytes, str, None] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> Response:
+        kwargs = {"url": url, "headers": headers}
+        if stream:
+            kwargs["stream"] = True
+        if method in ("POST", "PUT"):
+            kwargs["data"] = data
+        else:
+            kwargs["params"] = params
+        return getattr(self.session, method.lower())(**kwargs, timeout=timeout)
+
+    def prewarm(self, url: str, timeout: Optional[float] = None) -> None:
+        self.session.head(url, timeout=timeout)
+
+    def close(self) -> None:
+        self.session.close()
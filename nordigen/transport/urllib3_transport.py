@@ -0,0 +1,72 @@
+from typing import Dict, Optional, Union
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.models import Response
+
+from nordigen.transport.base import Transport, build_response
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport sending requests through urllib3 pool manager directly,
+    skipping requests session and adapter overhead.
+
+    Attributes
+    ---------
+    pool (urllib3.PoolManager): Pooled connections
+    """
+
+    def __init__(
+        self, pool_connections: int = 10, pool_maxsize: int = 10
+    ) -> None:
+        self.pool = urllib3.PoolManager(
+            num_pools=pool_connections, maxsize=pool_maxsize
+        )
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict] = None,
+        data: Union[bytes, str, None] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> Response:
+        if params:
+            url = f"{url}?{urlencode(params, doseq=True)}"
+        body = data.encode() if isinstance(data, str) else data
+        headers = {"Accept-Encoding": "gzip, deflate", **headers}
+
+        try:
+            response = self.pool.request(
+                method,
+                url,
+                headers=headers,
+                body=body,
+                timeout=urllib3.Timeout(connect=timeout, read=timeout),
+                retries=False,
+                redirect=False,
+                preload_content=not stream,
+            )
+        except urllib3.exceptions.NewConnectionError as error:
+            raise requests.ConnectionError(error) from error
+        except urllib3.exceptions.TimeoutError as error:
+            raise requests.Timeout(error) from error
+        except urllib3.exceptions.HTTPError as error:
+            raise requests.ConnectionError(error) from error
+
+        return build_response(
+            method,
+            url,
+            response.status,
+            response.headers,
+            content=None if stream else response.data,
+            raw=response,
+            body=body,
+        )
+
+    def close(self) -> None:
+        self.pool.clear()
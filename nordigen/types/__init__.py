@@ -1,13 +1,18 @@
+from nordigen.types.frame import TransactionFrame
 from nordigen.types.http_enums import HTTPMethod
 from nordigen.types.types import (
     AccountBalances,
     AccountData,
     AccountDetails,
+    AccountSnapshot,
+    AccountsSnapshot,
     AgreementsList,
     EnduserAgreement,
     Institutions,
+    OnboardingResult,
     Requisition,
     RequisitionDto,
     RequisitionList,
+    SessionRequest,
     TokenType,
 )
@@ -0,0 +1,292 @@
+from array import array
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# ISO 4217 currencies which minor unit is not 1/100
+CURRENCY_EXPONENTS: Dict[str, int] = {
+    "BHD": 3,
+    "BIF": 0,
+    "CLF": 4,
+    "CLP": 0,
+    "DJF": 0,
+    "GNF": 0,
+    "IQD": 3,
+    "ISK": 0,
+    "JOD": 3,
+    "JPY": 0,
+    "KMF": 0,
+    "KRW": 0,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "PYG": 0,
+    "RWF": 0,
+    "TND": 3,
+    "UGX": 0,
+    "UYI": 0,
+    "UYW": 4,
+    "VND": 0,
+    "VUV": 0,
+    "XAF": 0,
+    "XOF": 0,
+    "XPF": 0,
+}
+STATUSES = ("booked", "pending")
+# Stored in date columns when date is absent, exported as NaT
+MISSING_DATE = -(2**31)
+_EPOCH = date(1970, 1, 1).toordinal()
+
+Row = Union[Dict, Tuple[str, Dict]]
+
+
+def to_minor_units(amount: str, exponent: int) -> int:
+    """
+    Parse decimal amount string to integer minor units.
+
+    Args:
+        amount (str): amount, e.g "-328.18"
+        exponent (int): number of minor unit digits of currency
+
+    Raises:
+        ValueError: If amount has more significant fraction digits than
+            currency allows
+
+    Returns:
+        int: amount in minor units, e.g -32818
+    """
+    whole, _, fraction = amount.strip().partition(".")
+    fraction = fraction.rstrip("0")
+    if len(fraction) > exponent:
+        raise ValueError(f"Amount {amount} exceeds currency precision")
+
+    negative = whole.startswith("-")
+    units = int(whole.lstrip("+-") or "0") * 10**exponent
+    if fraction:
+        units += int(fraction.ljust(exponent, "0"))
+    return -units if negative else units
+
+
+class TransactionFrame:
+    """
+    Compact columnar representation of Berlin Group transactions.
+
+    Amounts are stored as integer minor units, dates as days since epoch
+    and currencies as indexes into `currencies`. All columns are parsed in
+    a single pass over transactions.
+
+    Attributes
+    ---------
+    transaction_id (List[Optional[str]]): transactionId or
+        internalTransactionId
+    status (array): index into STATUSES
+    amount (array): amount in minor units of its currency
+    currency (array): index into `currencies`
+    currencies (List[str]): interned currency codes
+    booking_date (array): days since epoch, MISSING_DATE if absent
+    value_date (array): days since epoch, MISSING_DATE if absent
+    """
+
+    def __init__(self) -> None:
+        self.transaction_id: List[Optional[str]] = []
+        self.status = array("b")
+        self.amount = array("q")
+        self.currency = array("H")
+        self.currencies: List[str] = []
+        self.booking_date = array("i")
+        self.value_date = array("i")
+
+    def __len__(self) -> int:
+        return len(self.amount)
+
+    @classmethod
+    def from_response(cls, response: Dict) -> "TransactionFrame":
+        """
+        Create frame from get_transactions response.
+
+        Args:
+            response (Dict): get_transactions response
+
+        Returns:
+            TransactionFrame: frame with booked and pending transactions
+        """
+        transactions = response["transactions"]
+        return cls.from_transactions(
+            (status, transaction)
+            for status in STATUSES
+            for transaction in transactions.get(status, [])
+        )
+
+    @classmethod
+    def from_transactions(cls, rows: Iterable[Row]) -> "TransactionFrame":
+        """
+        Create frame from transactions.
+
+        Args:
+            rows (Iterable[Row]): transactions or (status, transaction)
+                tuples as yielded by AccountApi.iter_transactions.
+                Transactions without status are considered booked.
+
+        Returns:
+            TransactionFrame: parsed frame
+        """
+        frame = cls()
+        currency_index: Dict[str, int] = {}
+        exponents: List[int] = []
+        dates: Dict[Optional[str], int] = {None: MISSING_DATE}
+        status_index = {status: index for index, status in enumerate(STATUSES)}
+
+        # Bind appends once, they are called for every transaction
+        ids = frame.transaction_id.append
+        statuses = frame.status.append
+        amounts = frame.amount.append
+        currencies = frame.currency.append
+        booking_dates = frame.booking_date.append
+        value_dates = frame.value_date.append
+
+        for row in rows:
+            status, transaction = (
+                row if isinstance(row, tuple) else ("booked", row)
+            )
+            money = transaction["transactionAmount"]
+
+            code = currency_index.get(money["currency"])
+            if code is None:
+                code = currency_index[money["currency"]] = len(
+                    frame.currencies
+                )
+                frame.currencies.append(money["currency"])
+                exponents.append(CURRENCY_EXPONENTS.get(money["currency"], 2))
+
+            booking_date = transaction.get("bookingDate")
+            if booking_date not in dates:
+                dates[booking_date] = (
+                    date.fromisoformat(booking_date).toordinal() - _EPOCH
+                )
+            value_date = transaction.get("valueDate")
+            if value_date not in dates:
+                dates[value_date] = (
+                    date.fromisoformat(value_date).toordinal() - _EPOCH
+                )
+
+            ids(
+                transaction.get("transactionId")
+                or transaction.get("internalTransactionId")
+            )
+            statuses(status_index[status])
+            amounts(to_minor_units(money["amount"], exponents[code]))
+            currencies(code)
+            booking_dates(dates[booking_date])
+            value_dates(dates[value_date])
+
+        return frame
+
+    def totals(self) -> Dict[str, int]:
+        """
+        Sum amounts by currency.
+
+        Returns:
+            Dict[str, int]: total in minor units by currency code
+        """
+        totals = [0] * len(self.currencies)
+        for code, amount in zip(self.currency, self.amount):
+            totals[code] += amount
+        return dict(zip(self.currencies, totals))
+
+    def to_numpy(self) -> Dict:
+        """
+        Export columns as NumPy arrays without copying numeric columns.
+
+        Dates are exported as datetime64[D] with NaT for missing dates.
+
+        Raises:
+            ImportError: If numpy is not installed
+
+        Returns:
+            Dict: column name to numpy array
+        """
+        try:
+            import numpy as np
+        except ImportError as error:
+            raise ImportError(
+                "TransactionFrame.to_numpy requires numpy"
+            ) from error
+
+        def dates(column: array):
+            days = np.frombuffer(column, dtype=np.int32).astype(np.int64)
+            days[days == MISSING_DATE] = np.iinfo(np.int64).min
+            return days.astype("datetime64[D]")
+
+        return {
+            "transaction_id": np.array(self.transaction_id, dtype=object),
+            "status": np.array(STATUSES)[
+                np.frombuffer(self.status, dtype=np.int8)
+            ],
+            "amount": np.frombuffer(self.amount, dtype=np.int64),
+            "currency": np.array(self.currencies or [""], dtype=object)[
+                np.frombuffer(self.currency, dtype=np.uint16)
+            ],
+            "booking_date": dates(self.booking_date),
+            "value_date": dates(self.value_date),
+        }
+
+    def to_pandas(self):
+        """
+        Export frame as pandas DataFrame with categorical currency.
+
+        Raises:
+            ImportError: If pandas is not installed
+
+        Returns:
+            pandas.DataFrame: transactions data frame
+        """
+        try:
+            import pandas as pd
+        except ImportError as error:
+            raise ImportError(
+                "TransactionFrame.to_pandas requires pandas"
+            ) from error
+
+        columns = self.to_numpy()
+        columns["status"] = pd.Categorical(columns["status"], STATUSES)
+        columns["currency"] = pd.Categorical.from_codes(
+            list(self.currency), self.currencies
+        )
+        return pd.DataFrame(columns)
+
+    def to_arrow(self):
+        """
+        Export frame as pyarrow Table with dictionary encoded currency.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+
+        Returns:
+            pyarrow.Table: transactions table
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as error:
+            raise ImportError(
+                "TransactionFrame.to_arrow requires pyarrow"
+            ) from error
+
+        def dates(column: array):
+            return pa.array(
+                [None if day == MISSING_DATE else day for day in column],
+                type=pa.date32(),
+            )
+
+        return pa.table(
+            {
+                "transaction_id": pa.array(self.transaction_id, pa.string()),
+                "status": pa.DictionaryArray.from_arrays(
+                    pa.array(self.status, pa.int8()), list(STATUSES)
+                ),
+                "amount": pa.array(self.amount, pa.int64()),
+                "currency": pa.DictionaryArray.from_arrays(
+                    pa.array(self.currency, pa.uint16()), self.currencies
+                ),
+                "booking_date": dates(self.booking_date),
+                "value_date": dates(self.value_date),
+            }
+        )
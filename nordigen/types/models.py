@@ -0,0 +1,211 @@
+import json
+import re
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Union
+
+_UNSET = object()
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parse API timestamp, e.g "2022-02-22T10:37:34.556Z".
+
+    Args:
+        value (str): ISO 8601 timestamp
+
+    Returns:
+        datetime: timezone aware datetime if offset is present
+    """
+    value = value.replace("Z", "+00:00")
+    # fromisoformat before Python 3.11 accepts only 3 or 6 fraction digits
+    value = _FRACTION.sub(
+        lambda match: "." + match.group(1)[:6].ljust(6, "0"), value, 1
+    )
+    return datetime.fromisoformat(value)
+
+
+class Field:
+    """
+    Model attribute parsed from raw response data on first access.
+
+    Attributes
+    ---------
+    keys (Tuple[str, ...]): Response keys tried in order, nested keys are
+        separated by dot
+    parser (Callable): Converts raw value, not called for None
+    """
+
+    def __init__(
+        self, *keys: str, parser: Optional[Callable[[Any], Any]] = None
+    ) -> None:
+        self.keys = keys
+        self.parser = parser
+        self.slot = None
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+        if not self.keys:
+            self.keys = (name,)
+
+    def _lookup(self, data: Dict) -> Any:
+        for key in self.keys:
+            value = data
+            for part in key.split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            if value is not None:
+                return value
+        return None
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self._lookup(instance.raw)
+            if value is not None and self.parser:
+                value = self.parser(value)
+            self.slot.__set__(instance, value)
+            return value
+
+
+class _ModelMeta(type):
+    """Generate a slot for every Field of a model."""
+
+    def __new__(mcs, name, bases, namespace):
+        fields = [
+            key for key, value in namespace.items() if isinstance(value, Field)
+        ]
+        namespace["__slots__"] = tuple(namespace.get("__slots__", ())) + tuple(
+            f"_{field}_value" for field in fields
+        )
+        cls = super().__new__(mcs, name, bases, namespace)
+        for field in fields:
+            namespace[field].slot = cls.__dict__[f"_{field}_value"]
+        return cls
+
+
+class Model(metaclass=_ModelMeta):
+    """
+    Base of slotted response models.
+
+    Model keeps raw response bytes or dict and parses fields on first
+    access. Item access is delegated to raw data, so models can be used
+    in place of response dicts.
+    """
+
+    __slots__ = ("_bytes", "_data")
+
+    def __init__(
+        self, data: Optional[Dict] = None, raw: Optional[bytes] = None
+    ) -> None:
+        self._data = data
+        self._bytes = raw
+
+    @classmethod
+    def from_json(
+        cls, content: Union[bytes, str]
+    ) -> Union["Model", List["Model"]]:
+        """
+        Create model from response body without decoding it.
+
+        List responses are decoded and every item wrapped in a model.
+
+        Args:
+            content (Union[bytes, str]): response body
+
+        Returns:
+            Union[Model, List[Model]]: model or list of models
+        """
+        if content.lstrip()[:1] in (b"[", "["):
+            return [cls(item) for item in json.loads(content)]
+        return cls(raw=content)
+
+    @property
+    def raw(self) -> Dict:
+        """
+        Get raw response data, body is decoded on first access.
+
+        Returns:
+            Dict: response data
+        """
+        if self._data is None:
+            self._data = json.loads(self._bytes)
+            self._bytes = None
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.raw.get(key, default)
+
+    def to_dict(self) -> Dict:
+        return self.raw
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.raw!r})"
+
+
+def _models(model: type) -> Callable[[List[Dict]], List[Model]]:
+    return lambda items: [model(item) for item in items]
+
+
+class InstitutionModel(Model):
+    id = Field()
+    name = Field()
+    bic = Field()
+    transaction_total_days = Field(parser=int)
+    countries = Field()
+    logo = Field()
+
+
+class EnduserAgreementModel(Model):
+    id = Field()
+    created = Field(parser=parse_datetime)
+    institution_id = Field()
+    max_historical_days = Field(parser=int)
+    access_valid_for_days = Field(parser=int)
+    access_scope = Field()
+    accepted = Field(parser=parse_datetime)
+
+
+class RequisitionModel(Model):
+    id = Field()
+    created = Field(parser=parse_datetime)
+    redirect = Field()
+    status = Field()
+    institution_id = Field()
+    agreement = Field()
+    reference = Field()
+    accounts = Field()
+    user_language = Field()
+    link = Field()
+
+
+class AccountDataModel(Model):
+    id = Field()
+    created = Field(parser=parse_datetime)
+    last_accessed = Field(
+        "last_accessed", "lastAccessed", parser=parse_datetime
+    )
+    iban = Field()
+    bban = Field()
+    institution_id = Field("institution_id", "institutionId")
+    status = Field()
+    owner_name = Field()
+
+
+class BalanceModel(Model):
+    amount = Field("balanceAmount.amount", parser=Decimal)
+    currency = Field("balanceAmount.currency")
+    balance_type = Field("balanceType")
+    credit_limit_included = Field("creditLimitIncluded")
+    reference_date = Field("referenceDate", parser=date.fromisoformat)
+    last_change_date_time = Field("lastChangeDateTime", parser=parse_datetime)
+
+
+class AccountBalancesModel(Model):
+    balances = Field(parser=_models(BalanceModel))
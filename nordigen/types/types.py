@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, NamedTuple, Optional, TypedDict
 
 
 class TokenType(TypedDict):
@@ -60,6 +60,20 @@ class RequisitionDto:
     requisition_id: str
 
 
+class SessionRequest(NamedTuple):
+    institution_id: str
+    reference_id: str
+    redirect_uri: str
+
+
+@dataclass
+class OnboardingResult:
+    sessions: Dict[str, RequisitionDto]
+    errors: Dict[str, Exception]
+    resumed: int = 0
+    elapsed: float = 0.0
+
+
 class Balances(TypedDict):
     amount: str
     currency: str
@@ -93,3 +107,26 @@ class AccountInfo(TypedDict):
 
 class AccountDetails(TypedDict):
     account: AccountInfo
+
+
+@dataclass
+class AccountSnapshot:
+    id: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class AccountsSnapshot:
+    accounts: Dict[str, AccountSnapshot]
+    elapsed: float
+
+    @property
+    def failed(self) -> List[AccountSnapshot]:
+        return [
+            account for account in self.accounts.values() if not account.ok
+        ]
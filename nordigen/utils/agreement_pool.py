@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    Final,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from requests.exceptions import HTTPError
+
+    from nordigen.api import AgreementsApi, RequisitionsApi
+    from nordigen.types.types import EnduserAgreement
+
+DEFAULT_SCOPE: Final = ("balances", "details", "transactions")
+# Client errors after which requisition could still have been created
+UNCERTAIN_STATUSES: Final = frozenset({408, 409})
+
+AgreementKey = Tuple[str, int, int, Tuple[str, ...]]
+
+
+def agreement_key(
+    institution_id: str,
+    max_historical_days: int = 90,
+    access_valid_for_days: int = 90,
+    access_scope: Optional[Sequence[str]] = None,
+) -> AgreementKey:
+    """
+    Build key of interchangeable agreements.
+
+    Returns:
+        AgreementKey: institution, history days, access days and sorted scope
+    """
+    return (
+        institution_id,
+        int(max_historical_days),
+        int(access_valid_for_days),
+        tuple(sorted(access_scope or DEFAULT_SCOPE)),
+    )
+
+
+def agreement_reusable(error: HTTPError) -> bool:
+    """
+    Tell whether agreement can be returned to pool after its requisition
+    failed with error.
+
+    Only client errors which do not concern the agreement prove that
+    requisition was not created and agreement is still valid. Server
+    errors may come after requisition was created, errors about the
+    agreement (expired, other institution or scope) would fail again.
+
+    Args:
+        error (HTTPError): error raised by create_requisition
+
+    Returns:
+        bool: True if agreement can be handed out again
+    """
+    response = error.response
+    if response is None:
+        return False
+    status = response.status_code
+    if not 400 <= status < 500 or status in UNCERTAIN_STATUSES:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    return "agreement" not in str(body).lower()
+
+
+class AgreementPool:
+    """
+    Index of unaccepted agreements not linked to any requisition, so
+    onboarding reuses a compatible agreement instead of creating one.
+
+    Existing agreements are loaded in bulk on first use. Agreement handed
+    out by acquire() leaves the pool, release() puts it back when its
+    requisition could not be created.
+
+    Attributes
+    ---------
+    agreements (AgreementsApi): Agreements api
+    requisitions (RequisitionsApi): Requisitions api, used to skip
+        agreements already linked to requisition
+    reused (int): Number of agreements handed out from pool
+    created (int): Number of agreements created because none was reusable
+    """
+
+    def __init__(
+        self, agreements: AgreementsApi, requisitions: RequisitionsApi
+    ) -> None:
+        self.agreements = agreements
+        self.requisitions = requisitions
+        self._available: Dict[AgreementKey, Deque[str]] = defaultdict(deque)
+        self._loaded = False
+        self._lock = Lock()
+        self._load_lock = Lock()
+        self.reused = 0
+        self.created = 0
+
+    def load(self) -> None:
+        """Index reusable agreements of all pages."""
+        linked = {
+            requisition.get("agreement")
+            for requisition in self.requisitions.iter_requisitions()
+        }
+        available: Dict[AgreementKey, Deque[str]] = defaultdict(deque)
+        for agreement in self.agreements.iter_agreements():
+            if agreement.get("accepted") or agreement["id"] in linked:
+                continue
+            available[self._key(agreement)].append(agreement["id"])
+
+        with self._lock:
+            self._available = available
+            self._loaded = True
+
+    @staticmethod
+    def _key(agreement: EnduserAgreement) -> AgreementKey:
+        return agreement_key(
+            agreement["institution_id"],
+            agreement.get("max_historical_days", 90),
+            agreement.get("access_valid_for_days", 90),
+            agreement.get("access_scope"),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(ids) for ids in self._available.values())
+
+    def acquire(
+        self,
+        institution_id: str,
+        max_historical_days: int = 90,
+        access_valid_for_days: int = 90,
+        access_scope: Optional[Sequence[str]] = None,
+    ) -> str:
+        """
+        Take compatible agreement from pool or create new one.
+
+        Args:
+            institution_id (str): institution id
+            max_historical_days (int, optional): Defaults to 90.
+            access_valid_for_days (int, optional): Defaults to 90.
+            access_scope (Sequence[str], optional): Defaults to balances,
+                details and transactions
+
+        Returns:
+            str: agreement id
+        """
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self.load()
+
+        key = agreement_key(
+            institution_id,
+            max_historical_days,
+            access_valid_for_days,
+            access_scope,
+        )
+        with self._lock:
+            ids = self._available.get(key)
+            if ids:
+                self.reused += 1
+                return ids.popleft()
+
+        agreement = self.agreements.create_agreement(
+            institution_id=institution_id,
+            max_historical_days=max_historical_days,
+            access_valid_for_days=access_valid_for_days,
+            access_scope=list(access_scope) if access_scope else None,
+        )
+        with self._lock:
+            self.created += 1
+        return agreement["id"]
+
+    def release(
+        self,
+        agreement_id: str,
+        institution_id: str,
+        max_historical_days: int = 90,
+        access_valid_for_days: int = 90,
+        access_scope: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        Return unused agreement to pool.
+
+        Args:
+            agreement_id (str): agreement id from acquire()
+            institution_id (str): institution id
+            max_historical_days (int, optional): Defaults to 90.
+            access_valid_for_days (int, optional): Defaults to 90.
+            access_scope (Sequence[str], optional): Defaults to balances,
+                details and transactions
+        """
+        key = agreement_key(
+            institution_id,
+            max_historical_days,
+            access_valid_for_days,
+            access_scope,
+        )
+        with self._lock:
+            self._available[key].append(agreement_id)
+
+    def discard(self, agreement_ids: Iterable[str]) -> None:
+        """
+        Remove agreements from pool, e.g after they were accepted or deleted.
+
+        Args:
+            agreement_ids (Iterable[str]): agreement ids
+        """
+        discarded = set(agreement_ids)
+        with self._lock:
+            for ids in self._available.values():
+                kept = [id for id in ids if id not in discarded]
+                ids.clear()
+                ids.extend(kept)
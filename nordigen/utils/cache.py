@@ -0,0 +1,311 @@
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from threading import Lock
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from nordigen.utils.endpoints import (
+    endpoint_path,
+    endpoint_template,
+    request_key,
+)
+
+# Seconds responses of rarely changing endpoints are cached for
+DEFAULT_TTLS: Dict[str, float] = {
+    "accounts/{id}/": 3600,
+    "accounts/{id}/details/": 6 * 3600,
+    "accounts/premium/{id}/details": 6 * 3600,
+    "institutions": 24 * 3600,
+    "institutions/": 24 * 3600,
+    "institutions/{id}/": 24 * 3600,
+    "agreements/enduser/{id}": 300,
+}
+
+Entry = Tuple[bytes, float]
+
+
+@lru_cache(maxsize=1024)
+def cache_scope(base_url: str, secret_id: str) -> str:
+    """
+    Build cache key prefix of client, so clients of different API hosts
+    or credentials sharing one backend never see each other's responses.
+
+    Args:
+        base_url (str): API base url
+        secret_id (str): secret id, only its hash is part of the scope
+
+    Returns:
+        str: scope, e.g "https://example.com/api/v2 5e8a2f0c1b9d7e34"
+    """
+    digest = hashlib.sha256(secret_id.encode()).hexdigest()[:16]
+    return f"{base_url} {digest}"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class MemoryCacheBackend:
+    """
+    In-memory LRU cache backend.
+
+    Attributes
+    ---------
+    max_entries (int): Maximum number of cached responses
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Entry]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, content: bytes, expires_at: float) -> int:
+        """
+        Store response.
+
+        Returns:
+            int: number of evicted entries
+        """
+        with self._lock:
+            self._entries[key] = (content, expires_at)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend:
+    """
+    SQLite cache backend, cached responses survive process restarts and
+    can be shared between processes.
+
+    Attributes
+    ---------
+    path (str): Database file path
+    max_entries (int): Maximum number of cached responses
+    """
+
+    def __init__(
+        self, path: str = "nordigen-cache.db", max_entries: int = 10000
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, content BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT content, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None:
+                self._connection.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        return (bytes(row[0]), row[1]) if row else None
+
+    def set(self, key: str, content: bytes, expires_at: float) -> int:
+        """
+        Store response.
+
+        Returns:
+            int: number of evicted entries
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, content, expires_at, time.time()),
+            )
+            evicted = self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        return evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key = ?", (key,)
+            )
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+
+class ResponseCache:
+    """
+    Cache of GET responses of slowly changing endpoints.
+
+    Responses are keyed by client scope, endpoint and parameters and cached
+    for the TTL of their endpoint template. Endpoints without TTL are not
+    cached.
+    Successful writes invalidate cached responses of the same resource.
+
+    Attributes
+    ---------
+    backend (MemoryCacheBackend | SQLiteCacheBackend): Storage backend
+    ttls (Mapping[str, float]): Seconds to cache responses by endpoint
+        template, e.g {"accounts/{id}/details/": 3600}
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = ttls
+        self._clock = clock
+        self._stats = CacheStats()
+        self._lock = Lock()
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        """
+        Get TTL of endpoint.
+
+        Args:
+            endpoint (str): endpoint relative to base url
+
+        Returns:
+            Optional[float]: seconds or None if endpoint is not cached
+        """
+        return self.ttls.get(endpoint_template(endpoint))
+
+    @staticmethod
+    def _key(scope: str, endpoint: str, params: Optional[Mapping]) -> str:
+        key = request_key(endpoint, params)
+        return f"{scope} {key}" if scope else key
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + value)
+
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Mapping] = None,
+        scope: str = "",
+    ) -> Optional[bytes]:
+        """
+        Get cached response body.
+
+        Args:
+            endpoint (str): endpoint relative to base url
+            params (Mapping, optional): query parameters
+            scope (str, optional): client scope built by cache_scope
+
+        Returns:
+            Optional[bytes]: response body or None on miss
+        """
+        if self.ttl(endpoint) is None:
+            return None
+
+        key = self._key(scope, endpoint, params)
+        entry = self.backend.get(key)
+        if entry is not None and entry[1] > self._clock():
+            self._count(hits=1)
+            return entry[0]
+
+        if entry is not None:
+            self.backend.delete(key)
+        self._count(misses=1)
+        return None
+
+    def set(
+        self,
+        endpoint: str,
+        params: Optional[Mapping],
+        content: bytes,
+        scope: str = "",
+    ) -> None:
+        """
+        Cache response body if endpoint has TTL.
+
+        Args:
+            endpoint (str): endpoint relative to base url
+            params (Mapping, optional): query parameters
+            content (bytes): response body
+            scope (str, optional): client scope built by cache_scope
+        """
+        ttl = self.ttl(endpoint)
+        if ttl is None:
+            return
+        evicted = self.backend.set(
+            self._key(scope, endpoint, params), content, self._clock() + ttl
+        )
+        if evicted:
+            self._count(evictions=evicted)
+
+    def invalidate(self, endpoint: str, scope: str = "") -> None:
+        """
+        Drop cached responses of resource modified by endpoint.
+
+        Args:
+            endpoint (str): endpoint of successful write,
+                e.g "agreements/enduser/{id}/accept/"
+            scope (str, optional): client scope built by cache_scope
+        """
+        segments = endpoint_path(endpoint).strip("/").split("/")
+        template = endpoint_template(endpoint).strip("/").split("/")
+        if "{id}" in template:
+            segments = segments[: template.index("{id}") + 1]
+        prefix = self._key(scope, "/".join(segments), None)
+        self.backend.delete_prefix(prefix)
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Get hit and miss counters.
+
+        Returns:
+            CacheStats: copy of counters
+        """
+        with self._lock:
+            return replace(self._stats)
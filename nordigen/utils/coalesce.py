@@ -0,0 +1,72 @@
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalesceStats:
+    calls: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into one.
+
+    First caller of a key executes the call, callers arriving while it is
+    in flight wait for it and receive the same result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._stats = CoalesceStats()
+
+    def do(self, key: Hashable, call: Callable[[], T]) -> T:
+        """
+        Execute call unless identical call is already in flight.
+
+        Args:
+            key (Hashable): call identity
+            call (Callable[[], T]): function to execute
+
+        Returns:
+            T: result of the call
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self._stats.calls += 1
+            else:
+                self._stats.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = call()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    @property
+    def stats(self) -> CoalesceStats:
+        """
+        Get call counters.
+
+        Returns:
+            CoalesceStats: copy of counters
+        """
+        with self._lock:
+            return replace(self._stats)
@@ -0,0 +1,81 @@
+import json
+from typing import Any, Callable, Dict, Final, Union
+
+# Codecs in order of preference when picking automatically
+PREFERENCE: Final = ("orjson", "ujson", "json")
+
+
+class JsonCodec:
+    """
+    JSON encoder and decoder working on raw bytes.
+
+    Attributes
+    ---------
+    name (str): Name of underlying library
+    """
+
+    name = "json"
+
+    def dumps(self, data: Any) -> Union[bytes, str]:
+        return json.dumps(data)
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        # json.loads detects UTF-8/16/32 of bytes without charset guessing
+        return json.loads(content)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self.dumps = ujson.dumps
+        self.loads = ujson.loads
+
+
+CODECS: Final[Dict[str, Callable[[], JsonCodec]]] = {
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec,
+    "json": JsonCodec,
+}
+
+
+def get_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """
+    Resolve codec by name.
+
+    Args:
+        codec (Union[str, JsonCodec]): "orjson", "ujson", "json", "auto" for
+            fastest installed library or codec instance
+
+    Raises:
+        ValueError: codec is not supported
+        ImportError: codec library is not installed
+
+    Returns:
+        JsonCodec: codec instance
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    if codec == "auto":
+        for name in PREFERENCE:
+            try:
+                return CODECS[name]()
+            except ImportError:
+                continue
+
+    if codec not in CODECS:
+        raise ValueError(f'Codec "{codec}" is not supported')
+    return CODECS[codec]()
@@ -0,0 +1,66 @@
+from typing import Final, Mapping, Optional
+from urllib.parse import urlencode
+
+# Path segments of API endpoints, any other segment is an identifier
+STATIC_SEGMENTS: Final = frozenset(
+    {
+        "accept",
+        "accounts",
+        "agreements",
+        "balances",
+        "details",
+        "enduser",
+        "institutions",
+        "new",
+        "premium",
+        "refresh",
+        "requisitions",
+        "token",
+        "transactions",
+    }
+)
+
+
+def endpoint_path(endpoint: str) -> str:
+    """
+    Strip query string from endpoint.
+
+    Args:
+        endpoint (str): endpoint relative to base url
+
+    Returns:
+        str: endpoint path
+    """
+    return endpoint.split("?", 1)[0]
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replace identifiers in endpoint with placeholder.
+
+    Args:
+        endpoint (str): endpoint relative to base url,
+            e.g "accounts/1d2b827b/transactions/"
+
+    Returns:
+        str: endpoint template, e.g "accounts/{id}/transactions/"
+    """
+    return "/".join(
+        segment if not segment or segment in STATIC_SEGMENTS else "{id}"
+        for segment in endpoint_path(endpoint).split("/")
+    )
+
+
+def request_key(endpoint: str, params: Optional[Mapping] = None) -> str:
+    """
+    Build identity of GET request.
+
+    Args:
+        endpoint (str): endpoint relative to base url
+        params (Mapping, optional): query parameters
+
+    Returns:
+        str: request key, e.g "GET accounts/{id}/details/"
+    """
+    query = urlencode(sorted((params or {}).items()))
+    return f"GET {endpoint}?{query}" if query else f"GET {endpoint}"
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Final,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from nordigen.types.frame import Row
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+if TYPE_CHECKING:
+    from nordigen import NordigenClient
+
+# Flattened Berlin Group transaction fields, nested fields joined with "."
+CSV_COLUMNS: Final = (
+    "account_id",
+    "status",
+    "transactionId",
+    "internalTransactionId",
+    "entryReference",
+    "endToEndId",
+    "mandateId",
+    "bookingDate",
+    "valueDate",
+    "bookingDateTime",
+    "valueDateTime",
+    "transactionAmount.amount",
+    "transactionAmount.currency",
+    "creditorName",
+    "creditorAccount.iban",
+    "creditorAccount.bban",
+    "creditorAccount.pan",
+    "creditorAccount.maskedPan",
+    "creditorAgent",
+    "ultimateCreditor",
+    "debtorName",
+    "debtorAccount.iban",
+    "debtorAccount.bban",
+    "debtorAccount.pan",
+    "debtorAccount.maskedPan",
+    "debtorAgent",
+    "ultimateDebtor",
+    "remittanceInformationUnstructured",
+    "remittanceInformationUnstructuredArray",
+    "remittanceInformationStructured",
+    "bankTransactionCode",
+    "proprietaryBankTransactionCode",
+    "purposeCode",
+    "additionalInformation",
+    "currencyExchange",
+    "balanceAfterTransaction.balanceAmount.amount",
+    "balanceAfterTransaction.balanceAmount.currency",
+    "balanceAfterTransaction.balanceType",
+)
+COMPRESSIONS: Final = ("gzip", "zstd")
+
+
+def open_output(path: str, compression: Optional[str] = "auto") -> IO[bytes]:
+    """
+    Open binary file for writing, optionally compressed.
+
+    Args:
+        path (str): file path
+        compression (Optional[str], optional): "gzip", "zstd", None or
+            "auto" to pick by .gz or .zst suffix. Defaults to "auto".
+
+    Raises:
+        ValueError: unknown compression
+        ImportError: zstd compression without zstandard installed
+
+    Returns:
+        IO[bytes]: writable file
+    """
+    if compression == "auto":
+        suffix = str(path).rsplit(".", 1)[-1]
+        compression = {"gz": "gzip", "zst": "zstd"}.get(suffix)
+
+    if compression is None:
+        return open(path, "wb")
+    if compression == "gzip":
+        return gzip.open(path, "wb")
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError(
+                "zstd compression requires zstandard. "
+                "Install it with `pip install nordigen[zstd]`"
+            )
+        return zstandard.ZstdCompressor().stream_writer(open(path, "wb"))
+    raise ValueError(
+        f'Unknown compression "{compression}", expected one of {COMPRESSIONS}'
+    )
+
+
+def _split(row: Row) -> Tuple[str, dict]:
+    return row if isinstance(row, tuple) else ("booked", row)
+
+
+class NdjsonTransactionWriter:
+    """
+    Write transactions to NDJSON as they are iterated, one
+    {"account_id", "status", "transaction"} document per line.
+
+    Attributes
+    ---------
+    file (IO[bytes]): Binary output file, not closed by writer
+    count (int): Number of transactions written
+    """
+
+    def __init__(self, file: IO[bytes]) -> None:
+        self.file = file
+        self.count = 0
+
+    def write(
+        self, rows: Iterable[Row], account_id: Optional[str] = None
+    ) -> int:
+        """
+        Write transactions of account.
+
+        Args:
+            rows (Iterable[Row]): transactions or (status, transaction)
+                tuples as yielded by AccountApi.iter_transactions
+            account_id (Optional[str], optional): account id of transactions
+
+        Returns:
+            int: number of transactions written
+        """
+        count = 0
+        write = self.file.write
+        for row in rows:
+            status, transaction = _split(row)
+            write(
+                json.dumps(
+                    {
+                        "account_id": account_id,
+                        "status": status,
+                        "transaction": transaction,
+                    }
+                ).encode()
+                + b"\n"
+            )
+            count += 1
+        self.count += count
+        return count
+
+    def close(self) -> None:
+        self.file.flush()
+
+
+class CsvTransactionWriter:
+    """
+    Write transactions to CSV as they are iterated. Header is written
+    first and every row has the same columns, missing fields are empty and
+    list or object fields are JSON encoded.
+
+    Attributes
+    ---------
+    file (IO[bytes]): Binary output file, not closed by writer
+    columns (Sequence[str]): Column names, nested fields joined with "."
+    count (int): Number of transactions written
+    """
+
+    def __init__(
+        self, file: IO[bytes], columns: Sequence[str] = CSV_COLUMNS
+    ) -> None:
+        self.file = file
+        self.columns = columns
+        self.count = 0
+        self._paths: List[Tuple[str, ...]] = [
+            tuple(column.split(".")) for column in columns
+        ]
+        self._text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._text)
+        self._writer.writerow(columns)
+
+    def _row(
+        self, account_id: Optional[str], status: str, transaction: dict
+    ) -> list:
+        values = []
+        for path in self._paths:
+            if path == ("account_id",):
+                value = account_id
+            elif path == ("status",):
+                value = status
+            else:
+                value = transaction
+                for key in path:
+                    value = value.get(key) if isinstance(value, dict) else None
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value)
+            values.append(value)
+        return values
+
+    def write(
+        self, rows: Iterable[Row], account_id: Optional[str] = None
+    ) -> int:
+        """
+        Write transactions of account.
+
+        Args:
+            rows (Iterable[Row]): transactions or (status, transaction)
+                tuples as yielded by AccountApi.iter_transactions
+            account_id (Optional[str], optional): account id of transactions
+
+        Returns:
+            int: number of transactions written
+        """
+        count = 0
+        writerow = self._writer.writerow
+        for row in rows:
+            writerow(self._row(account_id, *_split(row)))
+            count += 1
+        self.count += count
+        return count
+
+    def close(self) -> None:
+        self._text.flush()
+        self._text.detach()
+
+
+WRITERS: Final = {
+    "ndjson": NdjsonTransactionWriter,
+    "csv": CsvTransactionWriter,
+}
+
+
+def export_transactions(
+    client: NordigenClient,
+    account_ids: Iterable[str],
+    path: str,
+    format: str = "ndjson",
+    compression: Optional[str] = "auto",
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> int:
+    """
+    Stream transactions of accounts into one NDJSON or CSV file.
+
+    Transactions are decoded from response and written one by one, so
+    memory usage does not depend on length of transaction histories.
+
+    Args:
+        client (NordigenClient): client with access token
+        account_ids (Iterable[str]): account ids
+        path (str): output file path
+        format (str, optional): "ndjson" or "csv". Defaults to "ndjson".
+        compression (Optional[str], optional): "gzip", "zstd", None or
+            "auto" to pick by file suffix. Defaults to "auto".
+        date_from (Optional[str], optional): date_from. Defaults to None.
+        date_to (Optional[str], optional): date_to. Defaults to None.
+
+    Raises:
+        ValueError: unknown format or compression
+
+    Returns:
+        int: number of transactions written
+    """
+    if format not in WRITERS:
+        raise ValueError(
+            f'Unknown format "{format}", expected one of {tuple(WRITERS)}'
+        )
+
+    with open_output(path, compression) as file:
+        writer = WRITERS[format](file)
+        try:
+            for account_id in account_ids:
+                account = client.account_api(account_id)
+                writer.write(
+                    account.iter_transactions(date_from, date_to), account_id
+                )
+        finally:
+            writer.close()
+    return writer.count
@@ -0,0 +1,266 @@
+import time
+from bisect import bisect_left
+from threading import Lock, Thread
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from nordigen.types.types import Institutions
+
+
+class _Index(NamedTuple):
+    loaded_at: float
+    by_id: Dict[str, Institutions]
+    by_bic: Dict[str, List[Institutions]]
+    by_name: Dict[str, List[Institutions]]
+    names: List[Tuple[str, str]]
+
+
+def _build_index(
+    institutions: Iterable[Institutions], loaded_at: float
+) -> _Index:
+    by_id: Dict[str, Institutions] = {}
+    by_bic: Dict[str, List[Institutions]] = {}
+    by_name: Dict[str, List[Institutions]] = {}
+
+    for institution in institutions:
+        by_id[institution["id"]] = institution
+        if institution.get("bic"):
+            by_bic.setdefault(institution["bic"].upper(), []).append(
+                institution
+            )
+        by_name.setdefault(institution["name"].casefold(), []).append(
+            institution
+        )
+
+    names = sorted(
+        (name, institution["id"])
+        for name, institutions in by_name.items()
+        for institution in institutions
+    )
+    return _Index(loaded_at, by_id, by_bic, by_name, names)
+
+
+class InstitutionCatalog:
+    """
+    In-process catalog of institutions of all countries.
+
+    Catalog is loaded with a single request and indexed by id, BIC and
+    case-folded name. Data older than `ttl` is served while it is being
+    refreshed in background, data older than `ttl + stale_ttl` is
+    refreshed before it is returned.
+
+    Attributes
+    ---------
+    fetch (Callable[[], List[Institutions]]): Loads all institutions
+    ttl (float): Seconds catalog is considered fresh
+    stale_ttl (float): Seconds stale catalog can be served while refreshing
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], List[Institutions]],
+        ttl: float = 3600,
+        stale_ttl: float = 86400,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._index: Optional[_Index] = None
+        self._lock = Lock()
+        self._refreshing = False
+
+    def refresh(self) -> None:
+        """Load institutions and rebuild index."""
+        self._index = _build_index(self._fetch(), self._clock())
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            self._refreshing = False
+
+    def _current(self) -> _Index:
+        index = self._index
+        age = None if index is None else self._clock() - index.loaded_at
+
+        if age is None or age >= self.ttl + self.stale_ttl:
+            with self._lock:
+                # Catalog could have been loaded while waiting for the lock
+                if self._index is index:
+                    self.refresh()
+                return self._index
+
+        if age >= self.ttl:
+            with self._lock:
+                if not self._refreshing:
+                    self._refreshing = True
+                    Thread(
+                        target=self._refresh_in_background, daemon=True
+                    ).start()
+
+        return index
+
+    @staticmethod
+    def _in_country(
+        institutions: Iterable[Institutions], country: Optional[str]
+    ) -> List[Institutions]:
+        if not country:
+            return list(institutions)
+        country = country.upper()
+        return [
+            institution
+            for institution in institutions
+            if country in institution.get("countries", [])
+        ]
+
+    def get(self, id: str) -> Optional[Institutions]:
+        """
+        Get institution by id.
+
+        Args:
+            id (str): institution id
+
+        Returns:
+            Optional[Institutions]: institution or None if not found
+        """
+        return self._current().by_id.get(id)
+
+    def institutions(
+        self, country: Optional[str] = None
+    ) -> List[Institutions]:
+        """
+        Get institutions in the order they were returned by the API.
+
+        Args:
+            country (str, optional): Two-character country code
+
+        Returns:
+            List[Institutions]: institutions of country or all countries
+        """
+        return self._in_country(self._current().by_id.values(), country)
+
+    def find_by_bic(
+        self, bic: str, country: Optional[str] = None
+    ) -> List[Institutions]:
+        """
+        Find institutions by BIC.
+
+        Args:
+            bic (str): BIC code
+            country (str, optional): Two-character country code
+
+        Returns:
+            List[Institutions]: matching institutions
+        """
+        matches = self._current().by_bic.get(bic.upper(), [])
+        return self._in_country(matches, country)
+
+    def find_by_name(
+        self, name: str, country: Optional[str] = None
+    ) -> List[Institutions]:
+        """
+        Find institutions by exact case-insensitive name.
+
+        Args:
+            name (str): institution name
+            country (str, optional): Two-character country code
+
+        Returns:
+            List[Institutions]: matching institutions
+        """
+        matches = self._current().by_name.get(name.casefold(), [])
+        return self._in_country(matches, country)
+
+    def search(
+        self, prefix: str, country: Optional[str] = None
+    ) -> List[Institutions]:
+        """
+        Find institutions which name starts with prefix.
+
+        Args:
+            prefix (str): case-insensitive name prefix
+            country (str, optional): Two-character country code
+
+        Returns:
+            List[Institutions]: matching institutions ordered by name
+        """
+        index = self._current()
+        prefix = prefix.casefold()
+        matches = []
+        position = bisect_left(index.names, (prefix, ""))
+
+        while position < len(index.names):
+            name, id = index.names[position]
+            if not name.startswith(prefix):
+                break
+            matches.append(index.by_id[id])
+            position += 1
+
+        return self._in_country(matches, country)
+
+    def find_id(self, name: str, country: Optional[str] = None) -> str:
+        """
+        Get institution id by name.
+
+        Exact name matches are preferred over prefix matches, substring
+        match is used as a fallback.
+
+        Args:
+            name (str): institution name
+            country (str, optional): Two-character country code
+
+        Raises:
+            ValueError: If institution with given name is not found
+
+        Returns:
+            str: Institution id
+        """
+        matches = self.find_by_name(name, country) or self.search(
+            name, country
+        )
+        if not matches:
+            needle = name.casefold()
+            matches = self._in_country(
+                (
+                    institution
+                    for institution in self._current().by_id.values()
+                    if needle in institution["name"].casefold()
+                ),
+                country,
+            )
+
+        if not matches:
+            raise ValueError(f"Institution: {name} is not found")
+
+        return matches[0]["id"]
+
+    def find_ids(
+        self, names: Iterable[str], country: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get ids of many institutions at once.
+
+        Args:
+            names (Iterable[str]): institution names
+            country (str, optional): Two-character country code
+
+        Returns:
+            Dict[str, Optional[str]]: name to institution id, None if
+                institution is not found
+        """
+        ids = {}
+        for name in names:
+            try:
+                ids[name] = self.find_id(name, country)
+            except ValueError:
+                ids[name] = None
+        return ids
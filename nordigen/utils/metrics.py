@@ -0,0 +1,442 @@
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from requests.models import Response
+
+from nordigen.utils.endpoints import endpoint_path, endpoint_template
+
+if TYPE_CHECKING:
+    from nordigen import NordigenClient
+
+HOOK_EVENTS: Final = ("before_request", "after_response", "on_error")
+
+# Latency histogram bucket upper bounds in seconds
+LATENCY_BUCKETS: Final = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass
+class RequestEvent:
+    """
+    Single request attempt passed to hooks.
+
+    Attributes
+    ---------
+    method (str): HTTP method
+    endpoint (str): endpoint relative to base url
+    attempt (int): attempt number, 0 for first attempt
+    elapsed (float): attempt duration in seconds, set after attempt
+    status (Optional[int]): response status code
+    error (Optional[Exception]): exception raised by transport
+    """
+
+    method: str
+    endpoint: str
+    attempt: int = 0
+    elapsed: float = 0.0
+    status: Optional[int] = None
+    error: Optional[Exception] = None
+
+    @property
+    def template(self) -> str:
+        return endpoint_template(self.endpoint)
+
+
+def request_bytes(response: Response) -> Tuple[int, int]:
+    """
+    Get size of request body and response body.
+
+    Streamed response bodies are not read, Content-Length is used instead.
+
+    Args:
+        response (Response): HTTP response
+
+    Returns:
+        Tuple[int, int]: bytes sent and bytes received
+    """
+    body = getattr(response.request, "body", None)
+    sent = len(body) if isinstance(body, (bytes, str)) else 0
+    if response._content_consumed:
+        content = response.content
+        received = len(content) if isinstance(content, bytes) else 0
+    else:
+        received = int(response.headers.get("Content-Length") or 0)
+    return sent, received
+
+
+@dataclass
+class Histogram:
+    """Cumulative latency histogram with fixed buckets."""
+
+    bounds: Tuple[float, ...] = LATENCY_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate quantile as upper bound of bucket containing it.
+
+        Args:
+            q (float): quantile, from 0 to 1
+
+        Returns:
+            float: latency in seconds, inf if beyond largest bucket
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+@dataclass
+class EndpointMetrics:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    latency: Histogram = field(default_factory=Histogram)
+
+
+class MetricsCollector:
+    """
+    Collect per endpoint template latency, status codes, transferred bytes
+    and retries of client requests.
+
+    Metrics are keyed by method, endpoint template and institution. Account
+    requests are attributed to institution registered with label_accounts().
+
+    Attributes
+    ---------
+    buckets (Tuple[float, ...]): Latency histogram bucket bounds in seconds
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._metrics: Dict[Tuple[str, str, str], EndpointMetrics] = {}
+        self._institutions: Dict[str, str] = {}
+        self._lock = Lock()
+
+    def install(self, client: NordigenClient) -> None:
+        """
+        Register collector hooks on client.
+
+        Args:
+            client (NordigenClient): client to collect metrics of
+        """
+        client.register_hook("before_request", self.before_request)
+        client.register_hook("after_response", self.after_response)
+        client.register_hook("on_error", self.on_error)
+
+    def label_accounts(self, institutions: Mapping[str, str]) -> None:
+        """
+        Attribute requests of accounts to institutions.
+
+        Args:
+            institutions (Mapping[str, str]): institution id by account id
+        """
+        with self._lock:
+            self._institutions.update(institutions)
+
+    def _institution(self, endpoint: str) -> str:
+        parts = endpoint_path(endpoint).strip("/").split("/")
+        if parts[0] == "institutions" and len(parts) > 1:
+            return parts[1]
+        if parts[0] == "accounts" and len(parts) > 1:
+            id = (
+                parts[2]
+                if parts[1] == "premium" and len(parts) > 2
+                else parts[1]
+            )
+            return self._institutions.get(id, "")
+        return ""
+
+    def _entry(self, event: RequestEvent) -> EndpointMetrics:
+        key = (event.method, event.template, self._institution(event.endpoint))
+        entry = self._metrics.get(key)
+        if entry is None:
+            entry = self._metrics[key] = EndpointMetrics(
+                latency=Histogram(self.buckets)
+            )
+        return entry
+
+    def before_request(self, event: RequestEvent) -> None:
+        if event.attempt:
+            with self._lock:
+                self._entry(event).retries += 1
+
+    def after_response(self, event: RequestEvent, response: Response) -> None:
+        sent, received = request_bytes(response)
+        with self._lock:
+            entry = self._entry(event)
+            entry.requests += 1
+            entry.statuses[event.status] += 1
+            entry.bytes_sent += sent
+            entry.bytes_received += received
+            entry.latency.observe(event.elapsed)
+            if event.status >= 400:
+                entry.errors += 1
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            entry = self._entry(event)
+            entry.requests += 1
+            entry.errors += 1
+            entry.statuses[type(event.error).__name__] += 1
+            entry.latency.observe(event.elapsed)
+
+    def items(self) -> Iterator[Tuple[Tuple[str, str, str], EndpointMetrics]]:
+        """
+        Iterate over copies of collected metrics.
+
+        Returns:
+            Iterator[Tuple[Tuple[str, str, str], EndpointMetrics]]: metrics
+                keyed by method, endpoint template and institution
+        """
+        with self._lock:
+            items = [
+                (
+                    key,
+                    EndpointMetrics(
+                        requests=entry.requests,
+                        errors=entry.errors,
+                        retries=entry.retries,
+                        bytes_sent=entry.bytes_sent,
+                        bytes_received=entry.bytes_received,
+                        statuses=Counter(entry.statuses),
+                        latency=Histogram(
+                            entry.latency.bounds,
+                            list(entry.latency.counts),
+                            entry.latency.total,
+                            entry.latency.count,
+                        ),
+                    ),
+                )
+                for key, entry in self._metrics.items()
+            ]
+        return iter(items)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Get collected metrics, slowest endpoints first.
+
+        Returns:
+            List[Dict[str, Any]]: metrics per method, endpoint template
+                and institution
+        """
+        rows = []
+        for (method, template, institution), entry in self.items():
+            latency = entry.latency
+            rows.append(
+                {
+                    "method": method,
+                    "endpoint": template,
+                    "institution": institution or None,
+                    "requests": entry.requests,
+                    "errors": entry.errors,
+                    "retries": entry.retries,
+                    "statuses": dict(entry.statuses),
+                    "bytes_sent": entry.bytes_sent,
+                    "bytes_received": entry.bytes_received,
+                    "latency": {
+                        "mean": (
+                            latency.total / latency.count
+                            if latency.count
+                            else 0.0
+                        ),
+                        "p50": latency.quantile(0.5),
+                        "p95": latency.quantile(0.95),
+                        "p99": latency.quantile(0.99),
+                    },
+                }
+            )
+        return sorted(
+            rows, key=lambda row: row["latency"]["mean"], reverse=True
+        )
+
+    def reset(self) -> None:
+        """Drop collected metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def to_prometheus(self, prefix: str = "nordigen") -> str:
+        """
+        Render metrics in Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): metric name prefix
+
+        Returns:
+            str: exposition text
+        """
+        items = [
+            (
+                _labels(
+                    method=method, endpoint=template, institution=institution
+                ),
+                entry,
+            )
+            for (method, template, institution), entry in self.items()
+        ]
+        # Samples of every metric family follow its TYPE line contiguously
+        lines = [f"# TYPE {prefix}_request_duration_seconds histogram"]
+        for labels, entry in items:
+            cumulative = 0
+            for bound, count in zip(
+                entry.latency.bounds, entry.latency.counts
+            ):
+                cumulative += count
+                lines.append(
+                    f"{prefix}_request_duration_seconds_bucket"
+                    f'{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines += [
+                f"{prefix}_request_duration_seconds_bucket"
+                f'{{{labels},le="+Inf"}} {entry.latency.count}',
+                f"{prefix}_request_duration_seconds_sum{{{labels}}} "
+                f"{entry.latency.total}",
+                f"{prefix}_request_duration_seconds_count{{{labels}}} "
+                f"{entry.latency.count}",
+            ]
+
+        lines.append(f"# TYPE {prefix}_responses_total counter")
+        for labels, entry in items:
+            for status, count in entry.statuses.items():
+                lines.append(
+                    f"{prefix}_responses_total"
+                    f'{{{labels},status="{status}"}} {count}'
+                )
+
+        for name, attribute in (
+            ("retries_total", "retries"),
+            ("sent_bytes_total", "bytes_sent"),
+            ("received_bytes_total", "bytes_received"),
+        ):
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, entry in items:
+                lines.append(
+                    f"{prefix}_{name}{{{labels}}} {getattr(entry, attribute)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(
+        f'{name}="{_escape(value)}"' for name, value in labels.items()
+    )
+
+
+class OpenTelemetryRecorder:
+    """
+    Record client requests with OpenTelemetry instruments.
+
+    Attributes
+    ---------
+    meter (opentelemetry.metrics.Meter): Meter creating instruments
+    """
+
+    def __init__(self, meter) -> None:
+        self.meter = meter
+        self._duration = meter.create_histogram(
+            "nordigen.request.duration",
+            unit="s",
+            description="Duration of request attempts",
+        )
+        self._responses = meter.create_counter(
+            "nordigen.responses",
+            description="Responses by status code",
+        )
+        self._retries = meter.create_counter(
+            "nordigen.retries",
+            description="Retried request attempts",
+        )
+        self._received = meter.create_counter(
+            "nordigen.received",
+            unit="By",
+            description="Response body bytes",
+        )
+
+    def install(self, client: NordigenClient) -> None:
+        """
+        Register recorder hooks on client.
+
+        Args:
+            client (NordigenClient): client to record requests of
+        """
+        client.register_hook("before_request", self.before_request)
+        client.register_hook("after_response", self.after_response)
+        client.register_hook("on_error", self.on_error)
+
+    @staticmethod
+    def _attributes(event: RequestEvent) -> Dict[str, str]:
+        return {"http.method": event.method, "http.route": event.template}
+
+    def before_request(self, event: RequestEvent) -> None:
+        if event.attempt:
+            self._retries.add(1, self._attributes(event))
+
+    def after_response(self, event: RequestEvent, response: Response) -> None:
+        attributes = self._attributes(event)
+        self._duration.record(event.elapsed, attributes)
+        self._received.add(request_bytes(response)[1], attributes)
+        self._responses.add(
+            1, {**attributes, "http.status_code": event.status}
+        )
+
+    def on_error(self, event: RequestEvent) -> None:
+        attributes = self._attributes(event)
+        self._duration.record(event.elapsed, attributes)
+        self._responses.add(
+            1, {**attributes, "error.type": type(event.error).__name__}
+        )
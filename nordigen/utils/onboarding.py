@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple, Union
+
+from requests.models import HTTPError
+
+from nordigen.types.types import (
+    OnboardingResult,
+    RequisitionDto,
+    SessionRequest,
+)
+from nordigen.utils.agreement_pool import agreement_reusable
+
+if TYPE_CHECKING:
+    from nordigen import NordigenClient
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    reference_id TEXT PRIMARY KEY,
+    institution_id TEXT NOT NULL,
+    agreement_id TEXT NOT NULL,
+    requisition_id TEXT,
+    link TEXT
+);
+"""
+
+
+@dataclass
+class OnboardingState:
+    reference_id: str
+    institution_id: str
+    agreement_id: str
+    requisition_id: Optional[str] = None
+    link: Optional[str] = None
+
+
+class SQLiteOnboardingStore:
+    """
+    Local SQLite store of bulk onboarding progress. Agreements and
+    requisitions are recorded as soon as they are created, so interrupted
+    runs resume without creating them again.
+
+    Attributes
+    ---------
+    path (str): Database file path, ":memory:" for in-memory store
+    """
+
+    def __init__(self, path: str = "nordigen-onboarding.db") -> None:
+        self.path = path
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+    def load(self) -> Dict[str, OnboardingState]:
+        """
+        Get recorded progress.
+
+        Returns:
+            Dict[str, OnboardingState]: progress by reference id
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT reference_id, institution_id, agreement_id, "
+                "requisition_id, link FROM sessions"
+            ).fetchall()
+        return {row[0]: OnboardingState(*row) for row in rows}
+
+    def save_agreement(
+        self, reference_id: str, institution_id: str, agreement_id: str
+    ) -> None:
+        """
+        Record created agreement.
+
+        Args:
+            reference_id (str): requisition reference id
+            institution_id (str): institution id
+            agreement_id (str): created agreement id
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sessions "
+                "(reference_id, institution_id, agreement_id) "
+                "VALUES (?, ?, ?)",
+                (reference_id, institution_id, agreement_id),
+            )
+
+    def save_requisition(
+        self, reference_id: str, session: RequisitionDto
+    ) -> None:
+        """
+        Record created requisition.
+
+        Args:
+            reference_id (str): requisition reference id
+            session (RequisitionDto): created requisition
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE sessions SET requisition_id = ?, link = ? "
+                "WHERE reference_id = ?",
+                (session.requisition_id, session.link, reference_id),
+            )
+
+    def close(self) -> None:
+        """Close database connection."""
+        self._connection.close()
+
+
+def initialize_sessions(
+    client: NordigenClient,
+    session_requests: Iterable[Union[SessionRequest, Tuple[str, str, str]]],
+    max_historical_days: int = 90,
+    access_valid_for_days: int = 90,
+    account_selection: bool = False,
+    store: Optional[SQLiteOnboardingStore] = None,
+) -> OnboardingResult:
+    """
+    Create agreements and requisitions of many end users concurrently.
+
+    Requisition of end user is created as soon as its agreement is, while
+    agreements of other end users are still in flight. Requests run on the
+    client worker pool and pass the client rate limiter.
+
+    Args:
+        client (NordigenClient): client
+        session_requests (Iterable[Union[SessionRequest, Tuple]]):
+            institution id, reference id and redirect uri of every end user
+        max_historical_days (int, optional): agreement max historical days
+        access_valid_for_days (int, optional): agreement access days
+        account_selection (bool, optional): requisition account selection
+        store (Optional[SQLiteOnboardingStore], optional): progress store
+            to resume interrupted runs from
+
+    Returns:
+        OnboardingResult: sessions and errors by reference id
+    """
+    started = time.perf_counter()
+    executor = client.executor
+    progress = store.load() if store else {}
+    queue = deque(SessionRequest(*request) for request in session_requests)
+    pending: Dict[Future, Tuple[str, SessionRequest]] = {}
+    window = 2 * client._max_workers
+    result = OnboardingResult(sessions={}, errors={})
+
+    def create_agreement(request: SessionRequest) -> str:
+        return client._obtain_agreement(
+            request.institution_id, max_historical_days, access_valid_for_days
+        )
+
+    def create_requisition(
+        request: SessionRequest, agreement_id: str
+    ) -> RequisitionDto:
+        try:
+            requisition = client.requisition.create_requisition(
+                redirect_uri=request.redirect_uri,
+                reference_id=request.reference_id,
+                institution_id=request.institution_id,
+                agreement=agreement_id,
+                account_selection=account_selection,
+            )
+        except HTTPError as error:
+            if (
+                client.agreement_pool is not None
+                and store is None
+                and agreement_reusable(error)
+            ):
+                client.agreement_pool.release(
+                    agreement_id,
+                    request.institution_id,
+                    max_historical_days,
+                    access_valid_for_days,
+                )
+            raise
+        return RequisitionDto(
+            link=requisition["link"], requisition_id=requisition["id"]
+        )
+
+    def start(request: SessionRequest) -> None:
+        state = progress.get(request.reference_id)
+        if state is None:
+            pending[executor.submit(create_agreement, request)] = (
+                "agreement",
+                request,
+            )
+            return
+
+        result.resumed += 1
+        if state.requisition_id:
+            result.sessions[request.reference_id] = RequisitionDto(
+                link=state.link, requisition_id=state.requisition_id
+            )
+        else:
+            pending[
+                executor.submit(
+                    create_requisition, request, state.agreement_id
+                )
+            ] = ("requisition", request)
+
+    def record(stage: str, request: SessionRequest, value) -> None:
+        if stage == "agreement":
+            if store:
+                store.save_agreement(
+                    request.reference_id, request.institution_id, value
+                )
+        else:
+            if store:
+                store.save_requisition(request.reference_id, value)
+            result.sessions[request.reference_id] = value
+
+    try:
+        while queue or pending:
+            while queue and len(pending) < window:
+                start(queue.popleft())
+            if not pending:
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, request = pending.pop(future)
+                try:
+                    value = future.result()
+                except Exception as error:
+                    result.errors[request.reference_id] = error
+                    continue
+
+                record(stage, request, value)
+                if stage == "agreement":
+                    pending[
+                        executor.submit(create_requisition, request, value)
+                    ] = ("requisition", request)
+    finally:
+        # Record requests still in flight when interrupted, so resumed
+        # runs do not create them again
+        for future, (stage, request) in pending.items():
+            if not future.cancel() and future.exception() is None:
+                record(stage, request, future.result())
+
+    result.elapsed = time.perf_counter() - started
+    return result
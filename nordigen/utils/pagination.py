@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qs, urlparse
+
+
+def next_page(url: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    Parse limit and offset from `next` url of a paginated response.
+
+    Args:
+        url (Optional[str]): next page url
+
+    Returns:
+        Optional[Tuple[int, int]]: limit and offset or None on last page
+    """
+    if not url:
+        return None
+
+    query = parse_qs(urlparse(url).query)
+    return int(query["limit"][0]), int(query.get("offset", ["0"])[0])
+
+
+def paginate(
+    fetch: Callable[[int, int], Dict],
+    limit: int = 100,
+    offset: int = 0,
+    prefetch: bool = False,
+) -> Iterator[Any]:
+    """
+    Iterate over results of all pages following `next` links.
+
+    Args:
+        fetch (Callable[[int, int], Dict]): fetches page by limit and offset
+        limit (int, optional): page size. Defaults to 100.
+        offset (int, optional): offset of the first page. Defaults to 0.
+        prefetch (bool, optional): fetch next page in background while
+            current page is consumed. Defaults to False.
+
+    Yields:
+        Any: page results one by one
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = fetch(limit, offset)
+        while True:
+            following = next_page(page.get("next"))
+            pending: Optional[Future] = None
+            if following and executor:
+                pending = executor.submit(fetch, *following)
+
+            yield from page["results"]
+
+            if not following:
+                return
+            page = pending.result() if pending else fetch(*following)
+    finally:
+        if executor:
+            executor.shutdown(wait=False)
+
+
+async def apaginate(
+    fetch: Callable[[int, int], Awaitable[Dict]],
+    limit: int = 100,
+    offset: int = 0,
+    prefetch: bool = False,
+) -> AsyncIterator[Any]:
+    """
+    Asyncio counterpart of paginate.
+
+    Args:
+        fetch (Callable[[int, int], Awaitable[Dict]]): fetches page by limit
+            and offset
+        limit (int, optional): page size. Defaults to 100.
+        offset (int, optional): offset of the first page. Defaults to 0.
+        prefetch (bool, optional): fetch next page in background task while
+            current page is consumed. Defaults to False.
+
+    Yields:
+        Any: page results one by one
+    """
+    page = await fetch(limit, offset)
+    pending: Optional[asyncio.Task] = None
+    try:
+        while True:
+            following = next_page(page.get("next"))
+            if following and prefetch:
+                pending = asyncio.ensure_future(fetch(*following))
+
+            for result in page["results"]:
+                yield result
+
+            if not following:
+                return
+            page = await pending if pending else await fetch(*following)
+            pending = None
+    finally:
+        if pending:
+            pending.cancel()
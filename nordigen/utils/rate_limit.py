@@ -0,0 +1,207 @@
+import time
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Callable, Dict, List, Mapping, Optional
+
+GENERAL_HEADERS = (
+    ("HTTP_X_RATELIMIT_LIMIT", "X-RateLimit-Limit"),
+    ("HTTP_X_RATELIMIT_REMAINING", "X-RateLimit-Remaining"),
+    ("HTTP_X_RATELIMIT_RESET", "X-RateLimit-Reset"),
+)
+ACCOUNT_HEADERS = (
+    (
+        "HTTP_X_RATELIMIT_ACCOUNT_SUCCESS_LIMIT",
+        "X-RateLimit-Account-Success-Limit",
+    ),
+    (
+        "HTTP_X_RATELIMIT_ACCOUNT_SUCCESS_REMAINING",
+        "X-RateLimit-Account-Success-Remaining",
+    ),
+    (
+        "HTTP_X_RATELIMIT_ACCOUNT_SUCCESS_RESET",
+        "X-RateLimit-Account-Success-Reset",
+    ),
+)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when request would wait longer than allowed for rate limit."""
+
+    def __init__(self, bucket: str, retry_after: float) -> None:
+        super().__init__(
+            f'Rate limit for "{bucket}" is exhausted, '
+            f"retry after {retry_after:.0f} seconds"
+        )
+        self.bucket = bucket
+        self.retry_after = retry_after
+
+
+@dataclass
+class RateLimitBudget:
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset_at: Optional[float]
+
+
+def rate_limit_buckets(endpoint: str) -> List[str]:
+    """
+    Get rate limit buckets request to endpoint counts against.
+
+    Every request counts against its endpoint family, account data
+    requests also count against per account and scope limit.
+
+    Args:
+        endpoint (str): endpoint relative to base url
+
+    Returns:
+        List[str]: bucket names, e.g ["accounts", "accounts/{id}/balances"]
+    """
+    parts = endpoint.split("?", 1)[0].strip("/").split("/")
+    buckets = [parts[0]]
+
+    if parts[0] == "accounts":
+        if len(parts) > 1 and parts[1] == "premium":
+            parts = parts[:1] + parts[2:]
+        if len(parts) > 2:
+            buckets.append(f"accounts/{parts[1]}/{parts[2]}")
+
+    return buckets
+
+
+def _header(headers: Mapping, names) -> Optional[int]:
+    for name in names:
+        value = headers.get(name)
+        if isinstance(value, (str, int)):
+            try:
+                return int(value)
+            except ValueError:
+                pass
+    return None
+
+
+class RateLimiter:
+    """
+    Client side rate limiter driven by API rate limit headers.
+
+    Remaining budget and reset time is recorded per endpoint family and
+    per account scope. Requests are delayed until reset when budget is
+    exhausted instead of being rejected with 429.
+
+    Attributes
+    ---------
+    max_wait (float): Maximum seconds to wait for budget reset, requests
+        which would wait longer raise RateLimitExceeded
+    """
+
+    def __init__(
+        self,
+        max_wait: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = Lock()
+        self._budgets: Dict[str, RateLimitBudget] = {}
+
+    def _wait(self, bucket: str) -> float:
+        budget = self._budgets.get(bucket)
+        if budget is None or budget.remaining is None:
+            return 0
+
+        now = self._clock()
+        if budget.reset_at is not None and budget.reset_at <= now:
+            # Budget has been reset, wait for the next response to learn it
+            budget.remaining = None
+            return 0
+
+        if budget.remaining > 0 or budget.reset_at is None:
+            return 0
+
+        return budget.reset_at - now
+
+    def acquire(self, endpoint: str) -> None:
+        """
+        Reserve request in every bucket of endpoint, wait for reset if
+        budget is exhausted. Budget is only taken once every bucket has
+        some left, so waiting requests do not hold budget of other buckets.
+
+        Args:
+            endpoint (str): endpoint relative to base url
+
+        Raises:
+            RateLimitExceeded: If budget resets later than max_wait
+        """
+        buckets = rate_limit_buckets(endpoint)
+        while True:
+            with self._lock:
+                wait, bucket = max(
+                    (self._wait(bucket), bucket) for bucket in buckets
+                )
+                if wait <= 0:
+                    for bucket in buckets:
+                        budget = self._budgets.get(bucket)
+                        if budget is not None and budget.remaining:
+                            budget.remaining -= 1
+                    return
+            if wait > self.max_wait:
+                raise RateLimitExceeded(bucket, wait)
+            self._sleep(wait)
+
+    def update(
+        self,
+        endpoint: str,
+        status_code: int,
+        headers: Mapping,
+    ) -> None:
+        """
+        Record budget from response headers.
+
+        Args:
+            endpoint (str): endpoint relative to base url
+            status_code (int): response status code
+            headers (Mapping): response headers
+        """
+        buckets = rate_limit_buckets(endpoint)
+        now = self._clock()
+        limits = [(buckets[0], GENERAL_HEADERS)]
+        if len(buckets) > 1:
+            limits.append((buckets[1], ACCOUNT_HEADERS))
+
+        with self._lock:
+            for bucket, names in limits:
+                limit, remaining, reset = (
+                    _header(headers, name) for name in names
+                )
+                if remaining is None and reset is None:
+                    continue
+                self._budgets[bucket] = RateLimitBudget(
+                    limit=limit,
+                    remaining=remaining,
+                    reset_at=None if reset is None else now + reset,
+                )
+
+            if status_code == 429:
+                retry_after = _header(headers, ("Retry-After",))
+                # Without headers it is unknown which bucket is exhausted
+                bucket = buckets[-1]
+                budget = self._budgets.setdefault(
+                    bucket, RateLimitBudget(None, 0, None)
+                )
+                budget.remaining = 0
+                if retry_after is not None:
+                    budget.reset_at = now + retry_after
+
+    def state(self) -> Dict[str, RateLimitBudget]:
+        """
+        Get current budget of every known bucket.
+
+        Returns:
+            Dict[str, RateLimitBudget]: copy of budgets by bucket name
+        """
+        with self._lock:
+            return {
+                bucket: replace(budget)
+                for bucket, budget in self._budgets.items()
+            }
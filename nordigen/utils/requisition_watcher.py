@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+from requests.models import HTTPError
+
+from nordigen.utils.pagination import paginate
+
+if TYPE_CHECKING:
+    from nordigen.api import RequisitionsApi
+    from nordigen.types.types import Requisition
+
+# Requisition status does not change anymore
+TERMINAL_STATUSES: Final = frozenset({"LN", "RJ", "EX", "SU"})
+# End user is going through the bank flow right now
+ACTIVE_STATUSES: Final = frozenset({"GC", "UA", "SA", "GA"})
+
+
+@dataclass
+class StatusChange:
+    id: str
+    previous: Optional[str]
+    status: str
+    requisition: Requisition
+
+
+@dataclass
+class _Watched:
+    id: str
+    status: Optional[str]
+    added_at: float
+    next_poll: float
+    interval: float
+
+
+class RequisitionWatcher:
+    """
+    Track status of many requisitions with adaptive polling.
+
+    Requisitions whose end user is in the bank flow are polled often,
+    idle ones back off exponentially and ones older than stale_after are
+    polled at max_interval. When a paginated sweep of all requisitions
+    takes fewer requests than fetching due requisitions one by one, the
+    sweep is used. Requisitions are unwatched once they reach terminal
+    status.
+
+    Attributes
+    ---------
+    requisitions (RequisitionsApi): Requisitions api
+    min_interval (float): Poll interval of requisitions in bank flow
+    idle_interval (float): Initial poll interval of requisitions which
+        link was not opened yet
+    max_interval (float): Maximum poll interval
+    backoff (float): Interval multiplier after poll without change
+    stale_after (float): Age in seconds after which requisition is polled
+        at max_interval
+    page_size (int): Page size of sweep
+    executor (Optional[Executor]): Fetches requisitions one by one
+        concurrently if set, e.g client.executor
+    clock (Callable[[], float]): Monotonic clock, injectable for tests
+    sleep (Callable[[float], None]): Sleep function, injectable for tests
+    requests (int): Number of requests sent
+    errors (int): Number of failed requisition requests and sweeps,
+        requisitions which could not be fetched back off and are polled
+        again later
+    """
+
+    def __init__(
+        self,
+        requisitions: RequisitionsApi,
+        min_interval: float = 5,
+        idle_interval: float = 30,
+        max_interval: float = 600,
+        backoff: float = 2,
+        stale_after: float = 86400,
+        page_size: int = 100,
+        executor: Optional[Executor] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.requisitions = requisitions
+        self.min_interval = min_interval
+        self.idle_interval = idle_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.stale_after = stale_after
+        self.page_size = page_size
+        self.executor = executor
+        self._clock = clock
+        self._sleep = sleep
+        self._watched: Dict[str, _Watched] = {}
+        self._listeners: List[Callable[[StatusChange], None]] = []
+        self._total: Optional[int] = None
+        self._lock = Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        return len(self._watched)
+
+    def watch(self, ids: Iterable[str]) -> None:
+        """
+        Start tracking requisitions, they are polled on next poll().
+
+        Args:
+            ids (Iterable[str]): requisition ids
+        """
+        now = self._clock()
+        with self._lock:
+            for id in ids:
+                if id not in self._watched:
+                    self._watched[id] = _Watched(
+                        id, None, now, now, self.min_interval
+                    )
+
+    def unwatch(self, id: str) -> None:
+        """
+        Stop tracking requisition.
+
+        Args:
+            id (str): requisition id
+        """
+        with self._lock:
+            self._watched.pop(id, None)
+
+    def on_change(self, callback: Callable[[StatusChange], None]) -> None:
+        """
+        Register callback run for every status change.
+
+        Args:
+            callback (Callable[[StatusChange], None]): callback
+        """
+        self._listeners.append(callback)
+
+    def _interval(self, item: _Watched, changed: bool, now: float) -> float:
+        if now - item.added_at >= self.stale_after:
+            return self.max_interval
+        if changed:
+            return (
+                self.min_interval
+                if item.status in ACTIVE_STATUSES
+                else self.idle_interval
+            )
+        return min(self.max_interval, item.interval * self.backoff)
+
+    def _use_sweep(self, due: int) -> bool:
+        # Called with lock held
+        total = self._total if self._total is not None else len(self._watched)
+        return math.ceil(max(total, 1) / self.page_size) < due
+
+    def poll(self) -> List[StatusChange]:
+        """
+        Poll requisitions that are due and report status changes.
+
+        Returns:
+            List[StatusChange]: changes in order they were observed
+        """
+        now = self._clock()
+        with self._lock:
+            due = [
+                id
+                for id, item in self._watched.items()
+                if item.next_poll <= now
+            ]
+            if not due:
+                return []
+            watched = set(self._watched)
+            use_sweep = self._use_sweep(len(due))
+
+        failed: Set[str] = set()
+        if use_sweep:
+            try:
+                fetched = self._sweep(watched)
+            except Exception:
+                fetched, failed = {}, set(due)
+                with self._lock:
+                    self.errors += 1
+        else:
+            fetched = {}
+            results = (
+                self.executor.map(self._get, due)
+                if self.executor
+                else map(self._get, due)
+            )
+            for id, result in zip(due, results):
+                if not isinstance(result, Exception):
+                    fetched[id] = result
+                elif not _is_not_found(result):
+                    failed.add(id)
+            with self._lock:
+                self.requests += len(due)
+                self.errors += len(failed)
+
+        return self._update(fetched, set(due), failed, now)
+
+    def _get(self, id: str) -> Union[Requisition, Exception]:
+        try:
+            return self.requisitions.get_requisition_by_id(id)
+        except Exception as error:
+            return error
+
+    def _sweep(self, watched: Set[str]) -> Dict[str, Requisition]:
+        fetched = {}
+        count = 0
+
+        def get_page(limit: int, offset: int):
+            with self._lock:
+                self.requests += 1
+            return self.requisitions.get_requisitions(
+                limit=limit, offset=offset
+            )
+
+        for requisition in paginate(get_page, self.page_size):
+            count += 1
+            if requisition["id"] in watched:
+                fetched[requisition["id"]] = requisition
+        with self._lock:
+            self._total = count
+        return fetched
+
+    def _update(
+        self,
+        fetched: Dict[str, Requisition],
+        due: Set[str],
+        failed: Set[str],
+        now: float,
+    ) -> List[StatusChange]:
+        changes = []
+        with self._lock:
+            for id in failed:
+                item = self._watched.get(id)
+                if item is not None:
+                    item.interval = min(
+                        self.max_interval, item.interval * self.backoff
+                    )
+                    item.next_poll = now + item.interval
+
+            for id, requisition in fetched.items():
+                item = self._watched.get(id)
+                if item is None:
+                    continue
+
+                status = requisition["status"]
+                changed = status != item.status
+                if changed:
+                    changes.append(
+                        StatusChange(id, item.status, status, requisition)
+                    )
+                    item.status = status
+                elif id not in due:
+                    # Seen by sweep before it was due, keep schedule
+                    continue
+
+                if status in TERMINAL_STATUSES:
+                    del self._watched[id]
+                    continue
+                item.interval = self._interval(item, changed, now)
+                item.next_poll = now + item.interval
+
+            # Due requisitions missing from sweep or not found were deleted
+            for id in due - fetched.keys() - failed:
+                self._watched.pop(id, None)
+
+        for change in changes:
+            for listener in self._listeners:
+                listener(change)
+        return changes
+
+    def next_poll_in(self) -> Optional[float]:
+        """
+        Get seconds until next requisition is due.
+
+        Returns:
+            Optional[float]: seconds, None if nothing is watched
+        """
+        with self._lock:
+            if not self._watched:
+                return None
+            next_poll = min(item.next_poll for item in self._watched.values())
+        return max(0.0, next_poll - self._clock())
+
+    def run(self, timeout: Optional[float] = None) -> None:
+        """
+        Poll until every requisition reaches terminal status or timeout.
+
+        Args:
+            timeout (Optional[float], optional): seconds to run at most
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            self.poll()
+            delay = self.next_poll_in()
+            if delay is None:
+                return
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= delay:
+                    return
+            self._sleep(delay)
+
+    async def events(self) -> AsyncIterator[StatusChange]:
+        """
+        Poll in worker thread and yield status changes until every
+        requisition reaches terminal status.
+
+        Returns:
+            AsyncIterator[StatusChange]: status changes
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            for change in await loop.run_in_executor(None, self.poll):
+                yield change
+            delay = self.next_poll_in()
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+
+
+def _is_not_found(error: Exception) -> bool:
+    return (
+        isinstance(error, HTTPError)
+        and error.response is not None
+        and error.response.status_code == 404
+    )
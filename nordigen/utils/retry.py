@@ -0,0 +1,216 @@
+import random
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Callable, Collection, Mapping, Optional
+
+import requests
+from requests.models import Response
+
+from nordigen.types.http_enums import HTTPMethod
+
+IDEMPOTENT_METHODS = (HTTPMethod.GET, HTTPMethod.DELETE)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@dataclass
+class RetryStats:
+    requests: int = 0
+    retries: int = 0
+    budget_exhausted: int = 0
+
+
+class RetryBudget:
+    """
+    Global retry budget shared by all calls of a client.
+
+    Every call deposits `ratio` tokens and every retry withdraws one, so
+    retries are limited to a fraction of traffic during an outage.
+
+    Attributes
+    ---------
+    ratio (float): Tokens deposited per call
+    max_tokens (float): Maximum number of stored tokens
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = Lock()
+
+    def deposit(self) -> None:
+        """Deposit tokens for a new call."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Withdraw token for a retry.
+
+        Returns:
+            bool: True if retry is allowed
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def parse_retry_after(headers: Mapping) -> Optional[float]:
+    """
+    Parse Retry-After header.
+
+    Args:
+        headers (Mapping): response headers
+
+    Returns:
+        Optional[float]: seconds to wait or None if header is absent
+    """
+    value = headers.get("Retry-After")
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Retry policy for idempotent requests.
+
+    GET, DELETE and token requests are retried on connection errors and
+    transient status codes with exponential backoff and full jitter.
+    Retry-After header takes precedence over backoff.
+
+    Attributes
+    ---------
+    max_retries (int): Maximum retries of a single call
+    backoff_base (float): Backoff of the first retry in seconds
+    backoff_max (float): Maximum backoff and Retry-After in seconds
+    retry_statuses (Collection[int]): Status codes to retry
+    budget (RetryBudget): Global retry budget, unlimited if None
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+        retry_statuses: Collection[int] = RETRY_STATUSES,
+        budget: Optional[RetryBudget] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.budget = budget
+        self.sleep = sleep
+        self._stats = RetryStats()
+        self._lock = Lock()
+
+    @staticmethod
+    def is_idempotent(method: HTTPMethod, endpoint: str) -> bool:
+        """
+        Check if request can be safely retried.
+
+        Args:
+            method (HTTPMethod): request method
+            endpoint (str): endpoint relative to base url
+
+        Returns:
+            bool: True for GET, DELETE and token requests
+        """
+        return method in IDEMPOTENT_METHODS or endpoint.startswith("token/")
+
+    def start(self) -> None:
+        """Record new call."""
+        with self._lock:
+            self._stats.requests += 1
+        if self.budget:
+            self.budget.deposit()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get full jitter backoff.
+
+        Args:
+            attempt (int): number of retries already performed
+
+        Returns:
+            float: seconds to wait
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def delay(
+        self,
+        attempt: int,
+        method: HTTPMethod,
+        endpoint: str,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether failed attempt should be retried.
+
+        Args:
+            attempt (int): number of retries already performed
+            method (HTTPMethod): request method
+            endpoint (str): endpoint relative to base url
+            response (Response, optional): unsuccessful response
+            error (Exception, optional): connection error
+
+        Returns:
+            Optional[float]: seconds to wait before retry, None to give up
+        """
+        if attempt >= self.max_retries:
+            return None
+        if not self.is_idempotent(method, endpoint):
+            return None
+
+        if error is not None:
+            if not isinstance(
+                error, (requests.ConnectionError, requests.Timeout)
+            ):
+                return None
+            delay = self.backoff(attempt)
+        else:
+            if response.status_code not in self.retry_statuses:
+                return None
+            retry_after = parse_retry_after(response.headers)
+            if retry_after is not None and retry_after > self.backoff_max:
+                return None
+            delay = (
+                self.backoff(attempt) if retry_after is None else retry_after
+            )
+
+        if self.budget and not self.budget.withdraw():
+            with self._lock:
+                self._stats.budget_exhausted += 1
+            return None
+
+        with self._lock:
+            self._stats.retries += 1
+        return delay
+
+    @property
+    def stats(self) -> RetryStats:
+        """
+        Get retry counters.
+
+        Returns:
+            RetryStats: copy of counters
+        """
+        with self._lock:
+            return replace(self._stats)
@@ -0,0 +1,125 @@
+import codecs
+import json
+import re
+from typing import Any, Collection, Iterable, Iterator, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+Path = Tuple[str, ...]
+
+
+class _Scanner:
+    """Incremental JSON scanner over a stream of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes], targets: Collection[Path]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._targets = targets
+        self._exhausted = False
+        self.buffer = ""
+        self.position = 0
+
+    def _more(self) -> bool:
+        """Drop consumed input and append next chunk to the buffer."""
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buffer = self.buffer[self.position :] + text
+                self.position = 0
+                return True
+
+        if not self._exhausted:
+            self._exhausted = True
+            tail = self._decoder.decode(b"", final=True)
+            self.buffer = self.buffer[self.position :] + tail
+            self.position = 0
+            return bool(tail)
+        return False
+
+    def _peek(self) -> str:
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._more():
+                raise ValueError("Unexpected end of JSON stream")
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Expecting '{char}' at position {self.position}")
+        self.position += 1
+
+    def _decode(self) -> Any:
+        """Decode complete value at current position."""
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self._more():
+                    continue
+                raise
+
+            # Value touching end of buffer could be truncated, e.g number
+            if end < len(self.buffer) or not self._more():
+                self.position = end
+                return value
+
+    def value(self, path: Path) -> Iterator[Tuple[Path, Any]]:
+        char = self._peek()
+        if char == "{":
+            self.position += 1
+            yield from self._object(path)
+        elif char == "[" and path in self._targets:
+            self.position += 1
+            yield from self._items(path)
+        else:
+            self._decode()
+
+    def _object(self, path: Path) -> Iterator[Tuple[Path, Any]]:
+        while True:
+            char = self._peek()
+            if char == "}":
+                self.position += 1
+                return
+            if char == ",":
+                self.position += 1
+                continue
+            key = self._decode()
+            self._expect(":")
+            yield from self.value(path + (key,))
+
+    def _items(self, path: Path) -> Iterator[Tuple[Path, Any]]:
+        while True:
+            char = self._peek()
+            if char == "]":
+                self.position += 1
+                return
+            if char == ",":
+                self.position += 1
+                continue
+            yield path, self._decode()
+
+
+def iter_json_items(
+    chunks: Iterable[bytes], paths: Collection[Path]
+) -> Iterator[Tuple[Path, Any]]:
+    """
+    Incrementally decode items of JSON arrays from a stream of bytes.
+
+    Only one array item is kept in memory at a time. Arrays outside of
+    requested paths are decoded and discarded.
+
+    Args:
+        chunks (Iterable[bytes]): response body chunks
+        paths (Collection[Path]): key paths of arrays to decode,
+            e.g [("transactions", "booked")]
+
+    Raises:
+        ValueError: If stream is not a valid JSON document
+
+    Yields:
+        Tuple[Path, Any]: array path and decoded item
+    """
+    targets = {tuple(path) for path in paths}
+    yield from _Scanner(chunks, targets).value(())
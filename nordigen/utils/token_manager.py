@@ -0,0 +1,101 @@
+import time
+from threading import Lock
+from typing import Callable, Optional
+
+from requests.models import HTTPError
+
+from nordigen.types.types import TokenType
+
+
+class TokenManager:
+    """
+    Track access and refresh token expiry and refresh access token
+    shortly before it expires.
+
+    Only one refresh runs at a time, concurrent callers wait for it and
+    reuse its result.
+
+    Attributes
+    ---------
+    refresh_margin (int): Seconds before expiry when token is refreshed
+    clock (Callable[[], float]): Monotonic clock, injectable for tests
+    """
+
+    def __init__(
+        self,
+        refresh_margin: int = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.refresh_margin = refresh_margin
+        self._clock = clock
+        self._lock = Lock()
+        self.refresh_token: Optional[str] = None
+        self.access_expires_at: Optional[float] = None
+        self.refresh_expires_at: Optional[float] = None
+
+    def update(self, token: TokenType) -> None:
+        """
+        Record token returned from token/new/ or token/refresh/ endpoint.
+
+        Args:
+            token (TokenType): token response
+        """
+        now = self._clock()
+        self.access_expires_at = now + token["access_expires"]
+        if token.get("refresh"):
+            self.refresh_token = token["refresh"]
+            self.refresh_expires_at = now + token["refresh_expires"]
+
+    def forget_access(self) -> None:
+        """Stop tracking access token set from outside of the manager."""
+        self.access_expires_at = None
+
+    def _expires_soon(self, expires_at: Optional[float]) -> bool:
+        return (
+            expires_at is not None
+            and expires_at - self.refresh_margin <= self._clock()
+        )
+
+    @property
+    def needs_refresh(self) -> bool:
+        """
+        Check if access token is about to expire.
+
+        Returns:
+            bool: True if access token expires within refresh margin
+        """
+        return self._expires_soon(self.access_expires_at)
+
+    def ensure_fresh(
+        self,
+        exchange: Callable[[str], TokenType],
+        generate: Callable[[], TokenType],
+    ) -> None:
+        """
+        Refresh access token if it is about to expire.
+
+        Refresh token is exchanged for a new access token, new token pair
+        is generated when refresh token is expired or rejected.
+
+        Args:
+            exchange (Callable[[str], TokenType]): exchanges refresh token
+            generate (Callable[[], TokenType]): generates new token pair
+        """
+        if not self.needs_refresh:
+            return
+
+        with self._lock:
+            # Token could have been refreshed while waiting for the lock
+            if not self.needs_refresh:
+                return
+
+            if self.refresh_token and not self._expires_soon(
+                self.refresh_expires_at
+            ):
+                try:
+                    exchange(self.refresh_token)
+                    return
+                except HTTPError:
+                    pass
+
+            generate()
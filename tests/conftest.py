@@ -3,10 +3,27 @@ from unittest.mock import patch
 import pytest
 
 from nordigen import NordigenClient
+from nordigen.testing import FakeBankAccountDataAPI
+from nordigen.transport import InMemoryTransport
 
 from .mocks import mocked_token
 
 
+class FakeClock:
+    """Manually advanced clock, fake sleep advances it too."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
 @pytest.fixture(scope="module")
 def client():
     """
@@ -16,8 +33,52 @@ def client():
         [NordigenClient]: NordigenClient instance
     """
     nordigen = NordigenClient(secret_id="SECRET_ID", secret_key="SECRET_KEY")
-    with patch("requests.post") as mock_request:
+    with patch("requests.Session.post") as mock_request:
         mock_request.return_value.json.return_value = mocked_token
         response = nordigen.generate_token()
         nordigen.token = response["access"]
         yield nordigen
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_api() -> FakeBankAccountDataAPI:
+    """In-process API stand-in."""
+    return FakeBankAccountDataAPI()
+
+
+@pytest.fixture
+def create_fake_client(fake_api):
+    """
+    Factory of clients served by fake_api, with access token.
+
+    Yields:
+        Callable[..., NordigenClient]: creates client with given options
+    """
+    clients = []
+
+    def create(**options) -> NordigenClient:
+        client = NordigenClient(
+            secret_key="SECRET_KEY",
+            secret_id="SECRET_ID",
+            transport=InMemoryTransport(fake_api),
+            **options,
+        )
+        client.generate_token()
+        clients.append(client)
+        return client
+
+    yield create
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def fake_client(create_fake_client) -> NordigenClient:
+    """Client served by fake_api, with access token."""
+    return create_fake_client()
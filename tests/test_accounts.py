@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 from unittest.mock import patch
 from nordigen.nordigen import NordigenClient
@@ -59,7 +60,7 @@ class TestAccountApi:
         Args:
             account (AccountApi): AccountApi instance
         """
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             mock_request.return_value.json.return_value = {
                 "id": self.account_id,
                 "created": "2022-02-22T10:37:34.556Z",
@@ -76,7 +77,7 @@ class TestAccountApi:
         Args:
             account (AccountApi): AccountApi instance
         """
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             mock_request.return_value.json.return_value = {
                 "balances": self.mocked_data["balances"]
             }
@@ -90,7 +91,7 @@ class TestAccountApi:
         Args:
             account (AccountApi): AccountApi instance
         """
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             mock_request.return_value.json.return_value = self.mocked_data["details"]
             response = account.get_details()
             assert response["account"]["iban"] == self.iban
@@ -102,7 +103,7 @@ class TestAccountApi:
         Args:
             account (AccountApi): [description]
         """
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             mock_request.return_value.json.return_value = {
                 "transactions": self.mocked_data["transactions"]
             }
@@ -122,7 +123,7 @@ class TestAccountApi:
             )
 
     def test_get_premium_details(self, account: AccountApi, client):
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             mock_request.return_value.json.return_value = self.mocked_data["details"]
             response = account.get_premium_details(country="LV")
             assert response["account"]["iban"] == self.iban
@@ -142,7 +143,7 @@ class TestAccountApi:
             account (AccountApi): AccountApi instance
             client (NordigenClient): NordigenClient instance
         """
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             mock_request.return_value.json.return_value = {
                 "transactions": self.mocked_data["transactions"]
             }
@@ -161,3 +162,50 @@ class TestAccountApi:
                 },
                 timeout = 10,
             )
+
+    def test_iter_transactions(
+        self, account: AccountApi, client: NordigenClient
+    ):
+        """
+        Test streaming transactions from chunked response.
+
+        Args:
+            account (AccountApi): AccountApi instance
+            client (NordigenClient): NordigenClient instance
+        """
+        body = json.dumps({
+            "transactions": {
+                "booked": [
+                    {
+                        "transactionId": str(i),
+                        "transactionAmount": {"amount": "1.10"},
+                    }
+                    for i in range(3)
+                ],
+                "pending": [{"transactionAmount": {"amount": "-5"}}],
+            },
+            "last_updated": "2022-02-22T10:37:34.556Z",
+        }).encode()
+
+        with patch("requests.Session.get") as mock_request:
+            mock_request.return_value.iter_content.return_value = (
+                body[i:i + 16] for i in range(0, len(body), 16)
+            )
+            transactions = list(
+                account.iter_transactions(date_from="2021-12-01")
+            )
+
+            assert [status for status, _ in transactions] == [
+                "booked", "booked", "booked", "pending"
+            ]
+            assert transactions[2][1]["transactionId"] == "2"
+            assert transactions[3][1]["transactionAmount"]["amount"] == "-5"
+            url = f"{client.base_url}/accounts/{self.account_id}/transactions/"
+            mock_request.assert_called_once_with(
+                url=url,
+                headers=client._headers,
+                params={"date_from": "2021-12-01"},
+                timeout=10,
+                stream=True,
+            )
+            mock_request.return_value.close.assert_called_once()
@@ -28,7 +28,7 @@ class TestAgreementApi:
         Args:
             agreement (AgreementsApi): AgreementsApi instance
         """
-        with patch("requests.get") as mocked_request:
+        with patch("requests.Session.get") as mocked_request:
             mocked_request.return_value.json.return_value = generate_mock(
                 self.agreement_id
             )
@@ -44,7 +44,7 @@ class TestAgreementApi:
         Args:
             agreement (AgreementsApi): AgreementsApi instance
         """
-        with patch("requests.delete") as mock_request:
+        with patch("requests.Session.delete") as mock_request:
             mock_request.return_value.json.return_value = {
                 "summary": "End User Agreement deleted"
             }
@@ -60,7 +60,7 @@ class TestAgreementApi:
         Args:
             agreemen (AgreementsApi): AgreementsApi instance
         """
-        with patch("requests.put") as mock_request:
+        with patch("requests.Session.put") as mock_request:
             mock_request.return_value.json.return_value = {
                 "id": self.agreement_id,
                 "accepted": True,
@@ -88,7 +88,7 @@ class TestAgreementApi:
             "access_scope": ["balances", "details", "transactions"],
             "institution_id": self.institution_id,
         }
-        with patch("requests.post") as mock_request:
+        with patch("requests.Session.post") as mock_request:
             mock_request.return_value.json.return_value = {
                 "id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
                 "created": "2022-02-22T10:20:10.977Z",
@@ -119,7 +119,7 @@ class TestAgreementApi:
             agreement (AgreementsApi): Agreement instance
             client: (NordigenClient): NordigenClient instance
         """
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             mock_request.return_value.json.return_value = generate_mock(
                 self.agreement_id
             )
@@ -130,3 +130,30 @@ class TestAgreementApi:
                 headers=client._headers,
                 params={"limit": 100, "offset": 0},
             )
+
+    def test_iter_agreements(
+        self, agreement: AgreementsApi, client: NordigenClient
+    ):
+        """
+        Test iterate over agreements of all pages.
+
+        Args:
+            agreement (AgreementsApi): Agreement instance
+            client: (NordigenClient): NordigenClient instance
+        """
+        with patch("requests.Session.get") as mock_request:
+            first, last = mock.MagicMock(), mock.MagicMock()
+            first.json.return_value = {
+                "next": (
+                    f"{client.base_url}/agreements/enduser/?limit=1&offset=1"
+                ),
+                "results": [{"id": "1"}],
+            }
+            last.json.return_value = {"next": None, "results": [{"id": "2"}]}
+            mock_request.side_effect = [first, last]
+
+            response = list(agreement.iter_agreements(limit=1, prefetch=True))
+            assert [item["id"] for item in response] == ["1", "2"]
+            assert mock_request.call_args.kwargs["params"] == {
+                "limit": 1, "offset": 1
+            }
@@ -0,0 +1,76 @@
+from unittest import mock
+
+import pytest
+from requests.exceptions import HTTPError, Timeout
+
+from nordigen import NordigenClient
+
+INSTITUTION_ID = "REVOLUT_REVOGB21"
+
+
+def rejected(status_code: int, body: dict) -> HTTPError:
+    """Build error of create_requisition response."""
+    response = mock.Mock(status_code=status_code)
+    response.json.return_value = body
+    return HTTPError(
+        {"response": body, "status": status_code}, response=response
+    )
+
+
+class TestAgreementPool:
+    """Test reuse of compatible agreements."""
+
+    @pytest.fixture
+    def fake_client(self, create_fake_client) -> NordigenClient:
+        return create_fake_client(reuse_agreements=True)
+
+    def test_reuse(self, fake_client, fake_api):
+        """Test only unaccepted, unlinked, compatible agreements are reused."""
+        agreement = fake_client.agreement
+        reusable = agreement.create_agreement(INSTITUTION_ID)["id"]
+        agreement.create_agreement(INSTITUTION_ID, max_historical_days=30)
+        agreement.create_agreement(INSTITUTION_ID, access_scope=["balances"])
+        accepted = agreement.create_agreement(INSTITUTION_ID)["id"]
+        fake_api.agreements[accepted]["accepted"] = "2022-02-22T10:20:10.977Z"
+        linked = agreement.create_agreement(INSTITUTION_ID)["id"]
+        fake_client.requisition.create_requisition(
+            "https://gocardless.com", "linked", INSTITUTION_ID, linked
+        )
+
+        session = fake_client.initialize_session(
+            "https://gocardless.com", INSTITUTION_ID, "reference-1"
+        )
+        fake_client.initialize_session(
+            "https://gocardless.com", INSTITUTION_ID, "reference-2"
+        )
+
+        requisition = fake_api.requisitions[session.requisition_id]
+        assert requisition["agreement"] == reusable
+        assert fake_client.agreement_pool.reused == 1
+        assert fake_client.agreement_pool.created == 1
+        assert len(fake_client.agreement_pool) == 2
+
+    @pytest.mark.parametrize("error, reused", [
+        (rejected(400, {"reference": {"summary": "Invalid reference"}}), 1),
+        (rejected(429, {"summary": "Rate limit exceeded"}), 1),
+        (rejected(400, {"agreement": {"summary": "Agreement expired"}}), 0),
+        (rejected(409, {"summary": "Conflict"}), 0),
+        (rejected(503, {"summary": "Service unavailable"}), 0),
+        (Timeout(), 0),
+    ])
+    def test_release_on_failure(self, fake_client, fake_api, error, reused):
+        """Test agreement returns to pool only when it is still usable."""
+        with mock.patch.object(
+            fake_client.requisition, "create_requisition", side_effect=error
+        ):
+            with pytest.raises(type(error)):
+                fake_client.initialize_session(
+                    "https://gocardless.com", INSTITUTION_ID, "reference"
+                )
+
+        fake_client.initialize_session(
+            "https://gocardless.com", INSTITUTION_ID, "reference"
+        )
+
+        assert fake_client.agreement_pool.reused == reused
+        assert len(fake_api.agreements) == 2 - reused
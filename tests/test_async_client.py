@@ -0,0 +1,200 @@
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+from requests.models import HTTPError
+
+from nordigen import AsyncNordigenClient
+
+from .mocks import generate_mock, mocked_token
+
+httpx = pytest.importorskip("httpx")
+
+
+class TestAsyncClient:
+    """Test AsyncNordigenClient."""
+
+    requisition_id = "d49dffbb-01dc-498c-a674-8cb725aad14a"
+
+    @staticmethod
+    def create_client(handler) -> AsyncNordigenClient:
+        """
+        Create async client that serves requests with handler.
+
+        Args:
+            handler (Callable): httpx mock transport handler
+
+        Returns:
+            AsyncNordigenClient: client instance
+        """
+        client = AsyncNordigenClient(
+            secret_id="SECRET_ID", secret_key="SECRET_KEY"
+        )
+        client._session = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return client
+
+    def test_generate_token(self):
+        """Test token generation."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=mocked_token)
+
+        async def run():
+            async with self.create_client(handler) as client:
+                response = await client.generate_token()
+                return client, response
+
+        client, response = asyncio.run(run())
+        assert response["access"] == "access_token"
+        assert client.token == "access_token"
+        assert requests[0].url.path.endswith("/token/new/")
+        assert json.loads(requests[0].content) == {
+            "secret_key": "SECRET_KEY",
+            "secret_id": "SECRET_ID",
+        }
+
+    def test_api_methods_are_awaitable(self):
+        """Test shared API classes return awaitables."""
+        def handler(request):
+            assert request.headers["Authorization"] == "Bearer token"
+            if "institutions" in request.url.path:
+                return httpx.Response(
+                    200, json=[{"id": "REVOLUT_REVOGB21", "name": "Revolut"}]
+                )
+            return httpx.Response(200, json=generate_mock(self.requisition_id))
+
+        async def run():
+            async with self.create_client(handler) as client:
+                client.token = "token"
+                return await asyncio.gather(
+                    client.requisition.get_requisitions(),
+                    client.account_api("id").get_balances(),
+                    client.institution.get_institution_id_by_name(
+                        "GB", "revolut"
+                    ),
+                )
+
+        requisitions, balances, institution_id = asyncio.run(run())
+        assert requisitions["results"][1]["id"] == self.requisition_id
+        assert balances["count"] == 2
+        assert institution_id == "REVOLUT_REVOGB21"
+
+    def test_concurrency_is_limited(self):
+        """Test semaphore bounds requests in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with self.create_client(handler) as client:
+                client._max_concurrency = 3
+                await asyncio.gather(
+                    *(client.account_api(str(i)).get_details()
+                      for i in range(10))
+                )
+
+        asyncio.run(run())
+        assert peak == 3
+
+    def test_initialize_session(self):
+        """Test agreement and requisition are created."""
+        def handler(request):
+            if "agreements" in request.url.path:
+                return httpx.Response(201, json={"id": "agreement"})
+            body = json.loads(request.content)
+            assert body["agreement"] == "agreement"
+            return httpx.Response(
+                201, json={"id": self.requisition_id, "link": "link"}
+            )
+
+        async def run():
+            async with self.create_client(handler) as client:
+                return await client.initialize_session(
+                    redirect_uri="https://gocardless.com",
+                    institution_id="REVOLUT_REVOGB21",
+                    reference_id="reference",
+                )
+
+        session = asyncio.run(run())
+        assert session.requisition_id == self.requisition_id
+        assert session.link == "link"
+
+    def test_error_raises_http_error(self):
+        """Test unsuccessful responses raise HTTPError."""
+        def handler(request):
+            return httpx.Response(401, json={"detail": "Invalid token"})
+
+        async def run():
+            async with self.create_client(handler) as client:
+                await client.account_api("id").get_details()
+
+        with pytest.raises(HTTPError) as context:
+            asyncio.run(run())
+        assert context.value.args[0]["status"] == 401
+
+    def test_unsupported_options(self):
+        """Test NordigenClient only options are rejected."""
+        with pytest.raises(ValueError, match="retry_policy"):
+            AsyncNordigenClient(
+                "SECRET_KEY", "SECRET_ID", retry_policy=object()
+            )
+        with pytest.raises(TypeError):
+            AsyncNordigenClient("SECRET_KEY", "SECRET_ID", unknown=True)
+
+    def test_no_institution_catalog(self):
+        """Test synchronous institution catalog is not created."""
+        target = "nordigen.api.institutions.InstitutionCatalog"
+        with mock.patch(target) as catalog:
+            client = AsyncNordigenClient("SECRET_KEY", "SECRET_ID")
+
+        catalog.assert_not_called()
+        assert client.institution.catalog is None
+        asyncio.run(client.aclose())
+
+    def test_iterators(self):
+        """Test iter methods of shared API classes are async iterators."""
+        def handler(request):
+            if "transactions" in request.url.path:
+                return httpx.Response(200, json={"transactions": {
+                    "booked": [{"transactionId": "1"}],
+                    "pending": [{"transactionId": "2"}],
+                }})
+            offset = int(request.url.params.get("offset", 0))
+            return httpx.Response(200, json={
+                "count": 2,
+                "next": None if offset else "https://api/?limit=1&offset=1",
+                "results": [{"id": str(offset)}],
+            })
+
+        async def run():
+            async with self.create_client(handler) as client:
+                client.token = "token"
+                requisitions = client.requisition.iter_requisitions(
+                    limit=1, prefetch=True
+                )
+                agreements = client.agreement.iter_agreements(limit=1)
+                transactions = client.account_api("id").iter_transactions()
+                return (
+                    [requisition["id"] async for requisition in requisitions],
+                    [agreement["id"] async for agreement in agreements],
+                    [
+                        (status, transaction["transactionId"])
+                        async for status, transaction in transactions
+                    ],
+                )
+
+        requisitions, agreements, transactions = asyncio.run(run())
+        assert requisitions == agreements == ["0", "1"]
+        assert transactions == [("booked", "1"), ("pending", "2")]
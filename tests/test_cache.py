@@ -0,0 +1,141 @@
+from unittest.mock import patch
+
+import pytest
+
+from nordigen import NordigenClient
+from nordigen.utils.cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+    cache_scope,
+)
+from nordigen.utils.endpoints import endpoint_template
+
+
+def test_endpoint_template():
+    """Test identifiers are replaced in endpoint templates."""
+    assert endpoint_template("accounts/abc/transactions/") == (
+        "accounts/{id}/transactions/"
+    )
+    assert endpoint_template("accounts/premium/abc/details") == (
+        "accounts/premium/{id}/details"
+    )
+    assert endpoint_template("institutions/?country=LV") == "institutions/"
+    assert endpoint_template("agreements/enduser/abc/accept/") == (
+        "agreements/enduser/{id}/accept/"
+    )
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+class TestResponseCache:
+    """Test response cache with every backend."""
+
+    @pytest.fixture
+    def cache(self, backend, clock) -> ResponseCache:
+        if backend == "memory":
+            storage = MemoryCacheBackend(max_entries=2)
+        else:
+            storage = SQLiteCacheBackend(":memory:", max_entries=2)
+        clock.now = 1000.0
+        return ResponseCache(storage, clock=clock)
+
+    def test_ttl_expiry(self, cache: ResponseCache):
+        """Test responses are served until TTL expires."""
+        cache.set("accounts/abc/details/", {}, b"details")
+        assert cache.get("accounts/abc/details/") == b"details"
+
+        cache._clock.now += 6 * 3600
+        assert cache.get("accounts/abc/details/") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_uncached_endpoints(self, cache: ResponseCache):
+        """Test endpoints without TTL are not cached."""
+        cache.set("accounts/abc/transactions/", {}, b"transactions")
+        assert cache.get("accounts/abc/transactions/") is None
+        assert cache.stats.misses == 0
+
+    def test_lru_eviction(self, cache: ResponseCache):
+        """Test least recently used response is evicted."""
+        cache.set("institutions/a/", {}, b"a")
+        cache._clock.now += 1
+        cache.set("institutions/b/", {}, b"b")
+        cache._clock.now += 1
+        assert cache.get("institutions/a/") == b"a"
+        cache._clock.now += 1
+        cache.set("institutions/c/", {}, b"c")
+
+        assert cache.get("institutions/b/") is None
+        assert cache.get("institutions/a/") == b"a"
+        assert cache.stats.evictions == 1
+
+    def test_params_and_invalidation(self, cache: ResponseCache):
+        """Test parameters are part of key and writes invalidate."""
+        cache.set("accounts/premium/abc/details", {"country": "LV"}, b"LV")
+        assert cache.get("accounts/premium/abc/details") is None
+        assert cache.get(
+            "accounts/premium/abc/details", {"country": "LV"}
+        ) == b"LV"
+
+        cache.set("agreements/enduser/abc", {}, b"agreement")
+        cache.invalidate("agreements/enduser/abc/accept/")
+        assert cache.get("agreements/enduser/abc") is None
+
+    def test_scopes(self, cache: ResponseCache):
+        """Test entries and invalidation are limited to their scope."""
+        one = cache_scope("https://api", "one")
+        two = cache_scope("https://api", "two")
+        cache.set("agreements/enduser/abc", {}, b"one", one)
+        cache.set("agreements/enduser/abc", {}, b"two", two)
+        assert cache.get("agreements/enduser/abc") is None
+
+        cache.invalidate("agreements/enduser/abc/accept/", one)
+        assert cache.get("agreements/enduser/abc", {}, one) is None
+        assert cache.get("agreements/enduser/abc", {}, two) == b"two"
+
+
+class TestClientCache:
+    """Test NordigenClient response cache."""
+
+    @patch("requests.Session.get")
+    def test_cached_requests(self, mock_request):
+        """Test cached endpoints are requested once."""
+        mock_request.return_value.content = b'{"account": {"iban": "LT"}}'
+        client = NordigenClient(
+            secret_id="SECRET_ID", secret_key="SECRET_KEY",
+            cache=ResponseCache(),
+        )
+        account = client.account_api("abc")
+
+        assert account.get_details() == {"account": {"iban": "LT"}}
+        assert account.get_details() == {"account": {"iban": "LT"}}
+        assert mock_request.call_count == 1
+        assert client.cache.stats.hits == 1
+
+        mock_request.return_value.json.return_value = {}
+        account.get_transactions()
+        account.get_transactions()
+        assert mock_request.call_count == 3
+
+    @patch("requests.Session.get")
+    def test_clients_sharing_cache(self, mock_request):
+        """Test clients of other credentials or hosts do not share entries."""
+        mock_request.return_value.content = b'{"account": {"iban": "LT"}}'
+        cache = ResponseCache(SQLiteCacheBackend(":memory:"))
+        clients = [
+            NordigenClient(
+                secret_id=secret_id, secret_key="SECRET_KEY",
+                base_url=base_url, cache=cache,
+            )
+            for secret_id, base_url in (
+                ("SECRET_ID", "https://one/api/v2"),
+                ("OTHER_SECRET_ID", "https://one/api/v2"),
+                ("SECRET_ID", "https://two/api/v2"),
+            )
+        ]
+
+        for client in clients + clients:
+            client.account_api("abc").get_details()
+
+        assert mock_request.call_count == 3
+        assert cache.stats.hits == 3
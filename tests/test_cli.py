@@ -0,0 +1,161 @@
+import gzip
+import json
+from unittest import mock
+
+import pytest
+
+from nordigen.api import AccountApi
+from nordigen.cli import Checkpoint, _Output, main, sync
+from nordigen.testing import FakeBankAccountDataAPI, FakeServer
+
+
+def read_records(output, part):
+    (path,) = output.glob(f"{part}-*.ndjson.gz")
+    with gzip.open(path, "rt") as file:
+        return [json.loads(line) for line in file]
+
+
+def read_checkpoint(output, run="*"):
+    (path,) = output.glob(f"{run}.checkpoint")
+    lines = path.read_text().splitlines()[1:]
+    return [json.loads(line)["account_id"] for line in lines]
+
+
+def fail_account(id):
+    """Make transactions of account fail after first transaction."""
+    iter_transactions = AccountApi.iter_transactions
+
+    def transactions(account, *args):
+        for index, item in enumerate(iter_transactions(account, *args)):
+            if account._AccountApi__id == id and index == 1:
+                raise ConnectionError("unreachable")
+            yield item
+
+    return mock.patch.object(AccountApi, "iter_transactions", transactions)
+
+
+class TestSyncCommand:
+    """Test sync command line tool."""
+
+    def test_requisitions(self, tmp_path, monkeypatch, capsys):
+        """Test accounts of requisitions are synced, bad ones reported."""
+        monkeypatch.setenv("SECRET_ID", "SECRET_ID")
+        monkeypatch.setenv("SECRET_KEY", "SECRET_KEY")
+        with FakeServer(FakeBankAccountDataAPI(transactions=5)) as server:
+            server.api.handle("POST", "requisitions/", {}, b"{}")
+            (requisition,) = server.api.requisitions.values()
+            code = main([
+                "sync", "--requisitions", requisition["id"], "missing",
+                "--output", str(tmp_path), "--workers", "2",
+                "--base-url", server.base_url,
+            ])
+
+        assert code == 1
+        assert "requisition missing:" in capsys.readouterr().err
+        accounts = sorted(requisition["accounts"])
+        balances = read_records(tmp_path, "balances")
+        assert sorted(record["account_id"] for record in balances) == accounts
+        assert "balances" in balances[0]["data"]
+        transactions = read_records(tmp_path, "transactions")
+        statuses = {record["status"] for record in transactions}
+        assert statuses == {"booked", "pending"}
+        assert sorted(read_checkpoint(tmp_path)) == accounts
+
+    def test_runs_are_independent(self, fake_client, fake_api, tmp_path):
+        """Test new run with other parameters does not skip accounts."""
+        first = sync(fake_client, ["a", "b"], tmp_path, parts=["balances"])
+        with mock.patch("time.strftime", return_value="second"):
+            second = sync(
+                fake_client, ["a", "b"], tmp_path, parts=["transactions"],
+                date_from="2022-01-01",
+            )
+
+        assert (first.accounts, second.accounts, second.skipped) == (2, 2, 0)
+        # Fake accounts have 2 pending transactions besides booked ones
+        assert second.records == 2 * (fake_api.transactions + 2)
+        assert sorted(read_checkpoint(tmp_path, "second")) == ["a", "b"]
+
+    def test_resume(self, fake_client, fake_api, tmp_path, capsys):
+        """Test resumed run syncs only failed accounts, no partial lines."""
+        with fail_account("broken"):
+            first = sync(fake_client, ["ok", "broken"], tmp_path)
+
+        assert (first.accounts, first.failed) == (1, 1)
+        assert "broken: unreachable" in capsys.readouterr().err
+        transactions = read_records(tmp_path, "transactions")
+        assert [record["account_id"] for record in transactions] == (
+            ["ok"] * (fake_api.transactions + 2)
+        )
+
+        resumed = sync(fake_client, ["ok", "broken"], tmp_path, run=first.run)
+
+        assert (resumed.accounts, resumed.skipped) == (1, 1)
+        for part in ("metadata", "details", "balances"):
+            records = read_records(tmp_path, part)
+            accounts = [record["account_id"] for record in records]
+            assert accounts == ["ok", "broken"]
+        transactions = read_records(tmp_path, "transactions")
+        assert len(transactions) == 2 * (fake_api.transactions + 2)
+        assert read_checkpoint(tmp_path) == ["ok", "broken"]
+
+        with pytest.raises(ValueError):
+            sync(
+                fake_client, ["ok"], tmp_path, parts=["details"], run=first.run
+            )
+
+    def test_resume_killed_run(self, create_fake_client, tmp_path):
+        """Test data written after last checkpoint is dropped on resume."""
+        client = create_fake_client(max_workers=1)
+        add = Checkpoint.add
+
+        def kill(checkpoint, account_id, sizes):
+            if account_id == "b":
+                raise SystemExit("killed")
+            add(checkpoint, account_id, sizes)
+
+        with mock.patch("time.strftime", return_value="run"):
+            with mock.patch.object(Checkpoint, "add", kill):
+                with pytest.raises(SystemExit):
+                    sync(client, ["a", "b"], tmp_path, parts=["details"])
+        # Killed while writing data of next account
+        with open(tmp_path / "details-run.ndjson.gz", "ab") as file:
+            file.write(gzip.compress(b'{"account_id": "c"}\n')[:20])
+        with pytest.raises(EOFError):
+            read_records(tmp_path, "details")
+        with open(tmp_path / "run.checkpoint", "a") as file:
+            file.write('{"account_id": "c", "si')
+
+        resumed = sync(
+            client, ["a", "b", "c"], tmp_path, parts=["details"], run="run"
+        )
+
+        assert (resumed.accounts, resumed.skipped) == (2, 1)
+        records = read_records(tmp_path, "details")
+        assert [record["account_id"] for record in records] == ["a", "b", "c"]
+
+    def test_failed_write_is_rolled_back(self, fake_client, tmp_path):
+        """Test parts written before failed write of account are dropped."""
+        append = _Output.append
+
+        def fail(output, spool):
+            if output._file.name.endswith("balances-run.ndjson.gz"):
+                raise OSError("disk full")
+            append(output, spool)
+
+        with mock.patch("time.strftime", return_value="run"):
+            with mock.patch.object(_Output, "append", fail):
+                failed = sync(fake_client, ["a"], tmp_path)
+            resumed = sync(fake_client, ["a"], tmp_path, run="run")
+
+        assert (failed.failed, resumed.accounts) == (1, 1)
+        # Metadata and details were written before balances failed
+        assert len(read_records(tmp_path, "metadata")) == 1
+        assert len(read_records(tmp_path, "details")) == 1
+
+    def test_missing_credentials(self, tmp_path, monkeypatch):
+        """Test command exits when credentials are not set."""
+        monkeypatch.delenv("SECRET_ID", raising=False)
+        monkeypatch.delenv("SECRET_KEY", raising=False)
+
+        with pytest.raises(SystemExit):
+            main(["sync", "--accounts", "a", "--output", str(tmp_path)])
@@ -20,7 +20,7 @@ class TestClient(unittest.TestCase):
         )
         self.url = self.client.base_url
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_generate_token(self, mock_request):
         """Test token generation."""
         payload = {
@@ -42,7 +42,7 @@ class TestClient(unittest.TestCase):
         assert response["access"] == mocked_token["access"]
         assert self.client.token == "access_token"
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_exchange_token(self, mock_request):
         """Test token exchange."""
         mock_request.return_value.json.return_value = {
@@ -54,7 +54,7 @@ class TestClient(unittest.TestCase):
         assert self.client.token == "new_access_token"
         assert response["access"] == "new_access_token"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_request(self, mock_request):
         """
         Test request with GET.
@@ -75,7 +75,7 @@ class TestClient(unittest.TestCase):
             in mock_request.call_args_list
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_post_request(self, mock_request):
         """
         Test request with POST.
@@ -108,3 +108,84 @@ class TestClient(unittest.TestCase):
         """Test token setter."""
         self.client.token = "Token"
         assert self.client._headers["Authorization"] == "Bearer Token"
+
+    def test_api_classes_share_session(self):
+        """Test API classes send requests through the client session."""
+        adapter = self.client._session.get_adapter(self.url)
+        assert adapter._pool_maxsize == 10
+
+        with patch("requests.Session.get") as mock_request:
+            mock_request.return_value.json.return_value = []
+            self.client.institution.get_institutions()
+            self.client.account_api("id").get_balances()
+            assert mock_request.call_count == 2
+
+    def test_pool_options(self):
+        """Test connection pool configuration."""
+        client = NordigenClient(
+            secret_id="SECRET_ID",
+            secret_key="SECRET_KEY",
+            pool_connections=2,
+            pool_maxsize=32,
+            keep_alive=False,
+        )
+        adapter = client._session.get_adapter(client.base_url)
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 32
+        assert client._headers["Connection"] == "close"
+
+    @patch("requests.Session.head")
+    def test_prewarm(self, mock_request):
+        """Test connections are opened on initialization."""
+        NordigenClient(
+            secret_id="SECRET_ID", secret_key="SECRET_KEY", prewarm=3
+        )
+        assert mock_request.call_count == 3
+
+    @patch("requests.Session.close")
+    def test_context_manager_closes_session(self, mock_close):
+        """Test session is closed when leaving context manager."""
+        with NordigenClient(
+            secret_id="SECRET_ID", secret_key="SECRET_KEY"
+        ) as client:
+            assert isinstance(client, NordigenClient)
+        mock_close.assert_called_once()
+
+    @patch("requests.Session.get")
+    def test_fetch_accounts(self, mock_request):
+        """Test bulk account fetch collects per part errors."""
+        def response(url, **kwargs):
+            mocked = mock.MagicMock()
+            mocked.ok = not url.endswith("bad/balances/")
+            mocked.status_code = 200 if mocked.ok else 429
+            mocked.json.return_value = {"url": url}
+            return mocked
+
+        mock_request.side_effect = response
+        snapshot = self.client.fetch_accounts(
+            ["good", "bad"],
+            parts=["metadata", "balances", "transactions"],
+            date_from="2022-01-01",
+        )
+
+        assert mock_request.call_count == 6
+        assert snapshot.elapsed > 0
+        good = snapshot.accounts["good"]
+        assert good.ok
+        assert good.data["metadata"]["url"] == f"{self.url}/accounts/good/"
+        assert mock.call(
+            url=f"{self.url}/accounts/good/transactions/",
+            headers=self.client._headers,
+            params={"date_from": "2022-01-01"},
+            timeout=10,
+        ) in mock_request.call_args_list
+
+        bad = snapshot.accounts["bad"]
+        assert set(bad.data) == {"metadata", "transactions"}
+        assert bad.errors["balances"].args[0]["status"] == 429
+        assert snapshot.failed == [bad]
+
+    def test_fetch_accounts_unknown_part(self):
+        """Test unknown parts are rejected."""
+        with self.assertRaises(ValueError):
+            self.client.fetch_accounts(["id"], parts=["owner"])
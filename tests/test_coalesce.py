@@ -0,0 +1,80 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest import mock
+from unittest.mock import patch
+
+import pytest
+
+from nordigen import NordigenClient
+from nordigen.utils.coalesce import SingleFlight
+
+
+class TestSingleFlight:
+    """Test single-flight call coalescing."""
+
+    def test_concurrent_calls_are_coalesced(self):
+        """Test callers in flight share one call."""
+        group = SingleFlight()
+        release = Event()
+        call = mock.Mock(side_effect=lambda: release.wait() and "result")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(group.do, "key", call) for _ in range(4)
+            ]
+            while group.stats.coalesced < 3:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == ["result"] * 4
+        call.assert_called_once()
+        assert group.stats.calls == 1
+
+        assert group.do("key", lambda: "again") == "again"
+
+    def test_exception_is_shared(self):
+        """Test waiting callers receive leader exception."""
+        group = SingleFlight()
+        release = Event()
+
+        def fail():
+            release.wait()
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(group.do, "key", fail) for _ in range(2)
+            ]
+            while group.stats.coalesced < 1:
+                time.sleep(0.001)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+
+
+class TestClientCoalesce:
+    """Test NordigenClient coalesces identical GET requests."""
+
+    @patch("requests.Session.get")
+    def test_identical_requests_share_call(self, mock_request):
+        """Test concurrent identical requests send one HTTP request."""
+        def response(**kwargs):
+            time.sleep(0.05)
+            return mock.Mock(ok=True, content=b'{"balances": []}')
+
+        mock_request.side_effect = response
+        client = NordigenClient(
+            secret_id="SECRET_ID", secret_key="SECRET_KEY", coalesce=True
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda _: client.account_api("id").get_balances(), range(4)
+            ))
+
+        assert mock_request.call_count == 1
+        assert results == [{"balances": []}] * 4
+        assert results[0] is not results[1]
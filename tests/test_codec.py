@@ -0,0 +1,48 @@
+from unittest import mock
+
+import pytest
+
+from nordigen import NordigenClient
+from nordigen.testing import install_fake_api
+from nordigen.utils.codec import JsonCodec, UjsonCodec, get_codec
+
+
+class TestCodec:
+    """Test pluggable JSON codec."""
+
+    def test_get_codec(self):
+        """Test codec is resolved by name."""
+        codec = JsonCodec()
+
+        assert get_codec(codec) is codec
+        assert get_codec("json").name == "json"
+        assert get_codec("auto").name in ("orjson", "ujson", "json")
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_auto_falls_back(self):
+        """Test auto picks next codec when library is missing."""
+        with mock.patch.dict("sys.modules", {"orjson": None}):
+            assert get_codec("auto").name in ("ujson", "json")
+        with mock.patch.dict("sys.modules", {"ujson": None}):
+            with pytest.raises(ImportError):
+                UjsonCodec()
+
+    def test_client_uses_codec(self):
+        """Test request bodies are encoded and responses decoded by codec."""
+        codec = mock.Mock(spec=JsonCodec, wraps=JsonCodec())
+        client = NordigenClient(
+            secret_key="SECRET_KEY", secret_id="SECRET_ID", codec=codec
+        )
+        install_fake_api(client)
+
+        token = client.generate_token()
+        institutions = client.institution.get_institutions("LV")
+
+        codec.dumps.assert_called_once_with(
+            {"secret_key": "SECRET_KEY", "secret_id": "SECRET_ID"}
+        )
+        assert codec.loads.call_count == 2
+        assert isinstance(codec.loads.call_args.args[0], bytes)
+        assert token["access"] == client.token
+        assert institutions[0]["id"]
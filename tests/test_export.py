@@ -0,0 +1,115 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from nordigen.utils.export import (
+    CSV_COLUMNS,
+    CsvTransactionWriter,
+    NdjsonTransactionWriter,
+    export_transactions,
+    open_output,
+)
+
+TRANSACTION = {
+    "transactionId": "2020103000624289-1",
+    "bookingDate": "2020-10-30",
+    "valueDate": "2020-10-30",
+    "transactionAmount": {"amount": "-15.00", "currency": "EUR"},
+    "creditorAccount": {"iban": "GL0865354374424724"},
+    "remittanceInformationUnstructuredArray": ["first", "second"],
+}
+
+
+class TestTransactionWriters:
+    """Test streaming transaction writers."""
+
+    def test_ndjson(self):
+        """Test every transaction is written as one line."""
+        file = io.BytesIO()
+        writer = NdjsonTransactionWriter(file)
+
+        rows = [("pending", TRANSACTION), TRANSACTION]
+        written = writer.write(rows, "account")
+
+        lines = [json.loads(line) for line in file.getvalue().splitlines()]
+        assert written == writer.count == 2
+        assert [line["status"] for line in lines] == ["pending", "booked"]
+        assert lines[0] == {
+            "account_id": "account",
+            "status": "pending",
+            "transaction": TRANSACTION,
+        }
+
+    def test_csv_columns(self):
+        """Test nested fields are flattened into stable columns."""
+        file = io.BytesIO()
+        writer = CsvTransactionWriter(file)
+        writer.write([("booked", TRANSACTION)], "account")
+        writer.write([("booked", {
+            "transactionAmount": {"amount": "1", "currency": "GBP"},
+            "debtorAccount": {"bban": "BARC12345612345678"},
+            "creditorAccount": {"maskedPan": "123456xxxxxx1234"},
+        })])
+        writer.close()
+
+        text = io.StringIO(file.getvalue().decode())
+        header, first, second = csv.reader(text)
+        assert header == list(CSV_COLUMNS)
+        first, second = dict(zip(header, first)), dict(zip(header, second))
+        assert first["account_id"] == "account"
+        assert first["transactionAmount.amount"] == "-15.00"
+        assert first["creditorAccount.iban"] == "GL0865354374424724"
+        remittance = first["remittanceInformationUnstructuredArray"]
+        assert json.loads(remittance) == ["first", "second"]
+        assert first["debtorName"] == ""
+        assert second["transactionAmount.currency"] == "GBP"
+        assert second["debtorAccount.bban"] == "BARC12345612345678"
+        assert second["creditorAccount.maskedPan"] == "123456xxxxxx1234"
+        assert not file.closed
+
+    def test_unknown_compression(self, tmp_path):
+        """Test unknown compression is rejected."""
+        with pytest.raises(ValueError):
+            open_output(str(tmp_path / "out"), "brotli")
+
+
+class TestExportTransactions:
+    """Test exporting transactions of many accounts."""
+
+    def test_gzip_ndjson(self, fake_client, fake_api, tmp_path):
+        """Test gzip compression is picked by file suffix."""
+        path = str(tmp_path / "transactions.ndjson.gz")
+
+        count = export_transactions(fake_client, ["first", "second"], path)
+
+        with gzip.open(path, "rt") as file:
+            lines = [json.loads(line) for line in file]
+        assert count == len(lines) == 2 * (fake_api.transactions + 2)
+        assert {line["account_id"] for line in lines} == {"first", "second"}
+
+    def test_zstd_csv(self, fake_client, fake_api, tmp_path):
+        """Test CSV export with zstd compression."""
+        zstandard = pytest.importorskip("zstandard")
+        path = str(tmp_path / "transactions.csv.zst")
+
+        count = export_transactions(fake_client, ["first"], path, format="csv")
+
+        with open(path, "rb") as file:
+            reader = zstandard.ZstdDecompressor().stream_reader(file)
+            text = reader.read().decode()
+        rows = list(csv.DictReader(io.StringIO(text)))
+        assert count == len(rows) == fake_api.transactions + 2
+        assert rows[0]["transactionAmount.currency"] == "EUR"
+
+    def test_unknown_format(self, fake_client, tmp_path):
+        """Test unknown format is rejected before file is created."""
+        path = tmp_path / "transactions.xml"
+
+        with pytest.raises(ValueError):
+            export_transactions(
+                fake_client, ["first"], str(path), format="xml"
+            )
+        assert not path.exists()
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from requests.exceptions import HTTPError
+
+from benchmarks import bench_client
+from nordigen import NordigenClient
+from nordigen.testing import FakeBankAccountDataAPI, install_fake_api
+from nordigen.types.http_enums import HTTPMethod
+
+
+class TestFakeApi:
+    """Test in-process API stand-in."""
+
+    @pytest.fixture
+    def client(self) -> NordigenClient:
+        client = NordigenClient(secret_key="SECRET_KEY", secret_id="SECRET_ID")
+        install_fake_api(client, FakeBankAccountDataAPI(transactions=5))
+        client.generate_token()
+        return client
+
+    def test_session_flow(self, client):
+        """Test requisition and account data are served without network."""
+        session = client.initialize_session(
+            institution_id="REVOLUT_REVOGB21",
+            redirect_uri="https://gocardless.com",
+            reference_id="reference",
+        )
+        requisition = client.requisition.get_requisition_by_id(
+            session.requisition_id
+        )
+        account = client.account_api(requisition["accounts"][0])
+
+        assert len(requisition["accounts"]) == 2
+        assert account.get_metadata()["id"] == requisition["accounts"][0]
+        transactions = account.get_transactions()["transactions"]
+        assert len(transactions["booked"]) == 5
+        assert sum(1 for _ in account.iter_transactions()) == (
+            len(transactions["booked"]) + len(transactions["pending"])
+        )
+
+    def test_unknown_endpoint(self, client):
+        """Test unknown endpoint responds with 404."""
+        with pytest.raises(HTTPError) as error:
+            client.request(HTTPMethod.GET, "unknown/")
+        assert error.value.response.status_code == 404
+
+
+class TestBenchmarks:
+    """Test microbenchmark runner."""
+
+    def test_run_and_compare(self, tmp_path):
+        """Test benchmarks run offline and regressions are detected."""
+        baseline = tmp_path / "baseline.json"
+        arguments = ["-k", "institutions", "--min-time", "0"]
+        assert bench_client.main(
+            arguments + ["--save", "--baseline", str(baseline)]
+        ) == 0
+
+        stored = json.loads(baseline.read_text())
+        assert set(stored) == {
+            "institutions.get_institutions",
+            "institutions.get_institution_by_id",
+            "institutions.get_institution_id_by_name",
+        }
+
+        for result in stored.values():
+            result["ops_per_sec"] *= 1000
+        baseline.write_text(json.dumps(stored))
+        assert bench_client.main(
+            arguments + ["--baseline", str(baseline)]
+        ) == 1
@@ -0,0 +1,73 @@
+import pytest
+
+from nordigen.types.frame import (
+    MISSING_DATE,
+    TransactionFrame,
+    to_minor_units,
+)
+
+response = {
+    "transactions": {
+        "booked": [
+            {
+                "transactionId": "1",
+                "bookingDate": "2022-01-02",
+                "valueDate": "2022-01-02",
+                "transactionAmount": {"amount": "-328.18", "currency": "EUR"},
+            },
+            {
+                "internalTransactionId": "2",
+                "bookingDate": "2022-01-03",
+                "transactionAmount": {"amount": "1000", "currency": "JPY"},
+            },
+        ],
+        "pending": [
+            {"transactionAmount": {"amount": "0.50", "currency": "EUR"}},
+        ],
+    }
+}
+
+
+def test_to_minor_units():
+    """Test decimal amounts are converted to minor units."""
+    assert to_minor_units("-328.18", 2) == -32818
+    assert to_minor_units("-0.01", 2) == -1
+    assert to_minor_units("12", 2) == 1200
+    assert to_minor_units("1.500", 3) == 1500
+    assert to_minor_units("10.5000", 2) == 1050
+    with pytest.raises(ValueError):
+        to_minor_units("1.005", 2)
+
+
+def test_from_response():
+    """Test columns are parsed in a single pass."""
+    frame = TransactionFrame.from_response(response)
+
+    assert len(frame) == 3
+    assert frame.transaction_id == ["1", "2", None]
+    assert list(frame.status) == [0, 0, 1]
+    assert list(frame.amount) == [-32818, 1000, 50]
+    assert frame.currencies == ["EUR", "JPY"]
+    assert list(frame.currency) == [0, 1, 0]
+    assert list(frame.booking_date) == [18994, 18995, MISSING_DATE]
+    assert frame.totals() == {"EUR": -32768, "JPY": 1000}
+
+
+def test_from_transactions_stream():
+    """Test frame accepts (status, transaction) tuples."""
+    frame = TransactionFrame.from_transactions(
+        [("pending", response["transactions"]["booked"][0])]
+    )
+    assert list(frame.status) == [1]
+
+
+def test_to_numpy():
+    """Test NumPy export."""
+    np = pytest.importorskip("numpy")
+    columns = TransactionFrame.from_response(response).to_numpy()
+
+    assert columns["amount"].dtype == np.int64
+    assert list(columns["currency"]) == ["EUR", "JPY", "EUR"]
+    assert list(columns["status"]) == ["booked", "booked", "pending"]
+    assert columns["booking_date"][0] == np.datetime64("2022-01-02")
+    assert np.isnat(columns["booking_date"][2])
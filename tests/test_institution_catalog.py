@@ -0,0 +1,92 @@
+import time
+from unittest import mock
+
+import pytest
+
+from nordigen.utils.institution_catalog import InstitutionCatalog
+
+institutions = [
+    {
+        "id": "REVOLUT_REVOGB21",
+        "name": "Revolut",
+        "bic": "REVOGB21",
+        "countries": ["GB", "LV"],
+    },
+    {
+        "id": "REVOLUT_BUSINESS_REVOGB21",
+        "name": "Revolut Business",
+        "bic": "REVOGB21",
+        "countries": ["GB"],
+    },
+    {
+        "id": "CITADELE_PARXLV22",
+        "name": "Citadele",
+        "bic": "PARXLV22",
+        "countries": ["LV"],
+    },
+]
+
+
+class TestInstitutionCatalog:
+    """Test institution catalog."""
+
+    @pytest.fixture
+    def catalog(self, clock) -> InstitutionCatalog:
+        """Returns catalog with mocked fetch."""
+        fetch = mock.Mock(return_value=institutions)
+        return InstitutionCatalog(
+            fetch=fetch, ttl=10, stale_ttl=100, clock=clock
+        )
+
+    def test_lookups(self, catalog: InstitutionCatalog):
+        """Test id, BIC, name and prefix lookups."""
+        assert catalog.get("CITADELE_PARXLV22")["name"] == "Citadele"
+        assert catalog.get("UNKNOWN") is None
+        assert len(catalog.find_by_bic("revogb21")) == 2
+        assert catalog.find_by_bic("revogb21", country="LV") == [
+            institutions[0]
+        ]
+        assert catalog.find_by_name("REVOLUT") == [institutions[0]]
+        assert catalog.institutions() == institutions
+        assert catalog.institutions("lv") == [institutions[0], institutions[2]]
+        assert [i["id"] for i in catalog.search("rev")] == [
+            "REVOLUT_REVOGB21",
+            "REVOLUT_BUSINESS_REVOGB21",
+        ]
+        catalog._fetch.assert_called_once()
+
+    def test_find_ids(self, catalog: InstitutionCatalog):
+        """Test bulk lookup with exact, prefix and substring matches."""
+        ids = catalog.find_ids(
+            ["revolut business", "Citad", "business", "Swedbank"]
+        )
+        assert ids == {
+            "revolut business": "REVOLUT_BUSINESS_REVOGB21",
+            "Citad": "CITADELE_PARXLV22",
+            "business": "REVOLUT_BUSINESS_REVOGB21",
+            "Swedbank": None,
+        }
+        with pytest.raises(ValueError):
+            catalog.find_id("Revolut Business", country="LV")
+
+    def test_stale_while_revalidate(self, catalog: InstitutionCatalog):
+        """Test stale catalog is served while it is refreshed."""
+        catalog.get("REVOLUT_REVOGB21")
+        catalog._clock.now = 50
+        catalog._fetch.return_value = institutions[:1]
+
+        assert catalog.get("CITADELE_PARXLV22") is not None
+        for _ in range(100):
+            if catalog._fetch.call_count == 2 and not catalog._refreshing:
+                break
+            time.sleep(0.01)
+        assert catalog.get("CITADELE_PARXLV22") is None
+
+    def test_expired_catalog_is_reloaded(self, catalog: InstitutionCatalog):
+        """Test catalog older than stale ttl is reloaded synchronously."""
+        catalog.get("REVOLUT_REVOGB21")
+        catalog._clock.now = 110
+        catalog._fetch.return_value = institutions[:1]
+
+        assert catalog.get("CITADELE_PARXLV22") is None
+        assert catalog._fetch.call_count == 2
@@ -66,17 +66,18 @@ class TestInstitutionsAPI(unittest.TestCase):
         assert response["id"] == "CITADELE_PARXLV22"
         assert response["name"] == "Citadele"
 
-    @patch.object(InstitutionsApi, "get_institution_id_by_name")
-    def test_get_institution_id_by_name(self, mock_response: Mock):
-        """
-        Test get institution id by institution name.
-
-        Args:
-            mock_response (Mock): mocked method 'get_institution_id_by_name'
-        """
-        mock_response.return_value = "REVOLUT_REVOGB21"
-        response = self.mock_institution.get_institution_id_by_name(
-            institution="Revolut", country="LV"
-        )
+    def test_get_institution_id_by_name(self):
+        """Test first substring match in API order is served from catalog."""
+        self.mock_client.request.return_value = [
+            {"id": "BUSINESS", "name": "Swedbank Biz", "countries": ["LV"]},
+            {"id": "SWEDBANK", "name": "Swedbank", "countries": ["LV", "EE"]},
+            {"id": "CITADELE", "name": "Citadele", "countries": ["LV"]},
+        ]
+        find = self.mock_institution.get_institution_id_by_name
 
-        assert response == "REVOLUT_REVOGB21"
+        assert find(institution="swedbank", country="LV") == "BUSINESS"
+        assert find(institution="Swedbank", country="EE") == "SWEDBANK"
+        assert find(institution="dele", country="LV") == "CITADELE"
+        self.mock_client.request.assert_called_once()
+        with self.assertRaises(ValueError):
+            find(institution="Citadele", country="EE")
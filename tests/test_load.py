@@ -0,0 +1,53 @@
+import pytest
+import requests
+
+from nordigen.testing import FakeServer, ServerBehaviour
+from nordigen.testing.loadtest import LoadReport, run_load
+
+
+class TestFakeServer:
+    """Test local API stand-in server."""
+
+    def test_rate_limit(self):
+        """Test requests over limit are rejected with rate limit headers."""
+        behaviour = ServerBehaviour(rate_limit=2, rate_limit_window=60)
+        with FakeServer(behaviour=behaviour) as server:
+            url = f"{server.base_url}/institutions/?country=LV"
+            responses = [requests.get(url) for _ in range(3)]
+
+        statuses = [response.status_code for response in responses]
+        assert statuses == [200, 200, 429]
+        assert responses[1].headers["X-RateLimit-Remaining"] == "0"
+        assert int(responses[2].headers["Retry-After"]) > 0
+
+    def test_error_rate(self):
+        """Test simulated failures respond with 503."""
+        with FakeServer(behaviour=ServerBehaviour(error_rate=1)) as server:
+            response = requests.get(f"{server.base_url}/institutions/")
+
+        assert response.status_code == 503
+
+
+class TestLoadDriver:
+    """Test load driver."""
+
+    @pytest.mark.parametrize("mode", ["sequential", "threaded", "async"])
+    def test_run_load(self, mode):
+        """Test every account fetches its metadata, details and data."""
+        with FakeServer() as server:
+            report = run_load(
+                server.base_url, accounts=3, mode=mode, concurrency=2
+            )
+
+        assert report.requests == 12
+        assert report.errors == 0
+        assert report.throughput > 0
+
+    def test_percentile(self):
+        """Test nearest rank percentiles."""
+        latencies = [i / 100 for i in range(1, 101)]
+        report = LoadReport("sequential", 1, 1.0, latencies)
+
+        assert report.percentile(50) == 0.5
+        assert report.percentile(99) == 0.99
+        assert report.summary()["p95"] == 0.95
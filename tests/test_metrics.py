@@ -0,0 +1,137 @@
+from unittest import mock
+
+import pytest
+import requests
+
+from nordigen import NordigenClient
+from nordigen.testing import install_fake_api
+from nordigen.types.http_enums import HTTPMethod
+from nordigen.utils.metrics import (
+    Histogram,
+    MetricsCollector,
+    OpenTelemetryRecorder
+)
+from nordigen.utils.retry import RetryPolicy
+
+ACCOUNT_ID = "1d2b827b-9ca2-4adb-b4c3-0deb76a0ac50"
+
+
+class TestMetrics:
+    """Test request hooks and metrics collector."""
+
+    @pytest.fixture
+    def client(self) -> NordigenClient:
+        client = NordigenClient(
+            secret_key="SECRET_KEY",
+            secret_id="SECRET_ID",
+            metrics=MetricsCollector(),
+        )
+        install_fake_api(client)
+        client.generate_token()
+        return client
+
+    def test_stats_by_endpoint_template(self, client):
+        """Test requests are grouped by endpoint template and institution."""
+        client.metrics.label_accounts({ACCOUNT_ID: "REVOLUT_REVOGB21"})
+        client.account_api(ACCOUNT_ID).get_transactions()
+        client.account_api("other").get_transactions()
+        with pytest.raises(requests.HTTPError):
+            client.request(HTTPMethod.GET, "unknown/")
+
+        stats = {
+            (row["endpoint"], row["institution"]): row
+            for row in client.stats()
+        }
+        labelled = stats[("accounts/{id}/transactions/", "REVOLUT_REVOGB21")]
+        assert labelled["requests"] == 1
+        assert labelled["statuses"] == {200: 1}
+        assert labelled["bytes_received"] > 0
+        assert labelled["latency"]["p50"] > 0
+        assert stats[("accounts/{id}/transactions/", None)]["requests"] == 1
+        assert stats[("{id}/", None)]["errors"] == 1
+        assert stats[("token/new/", None)]["bytes_sent"] > 0
+
+        text = client.metrics.to_prometheus()
+        assert (
+            'nordigen_responses_total{method="GET",'
+            'endpoint="accounts/{id}/transactions/",'
+            'institution="REVOLUT_REVOGB21",status="200"} 1'
+        ) in text
+
+        # Every family is one contiguous group directly after its TYPE line
+        families = []
+        for line in text.splitlines():
+            if line.startswith("# TYPE "):
+                families.append(line.split()[2])
+            else:
+                name = line.split("{")[0]
+                assert name.startswith(families[-1])
+        assert len(families) == len(set(families)) == 5
+
+    def test_prometheus_label_escaping(self, client):
+        """Test quotes, backslashes and newlines in labels are escaped."""
+        client.metrics.label_accounts({ACCOUNT_ID: 'BANK "A"\\\nB'})
+        client.account_api(ACCOUNT_ID).get_transactions()
+
+        text = client.metrics.to_prometheus()
+        assert 'institution="BANK \\"A\\"\\\\\\nB"' in text
+        assert '\nB"' not in text
+
+    def test_hooks_on_retried_error(self):
+        """Test hooks run for every attempt and retries are counted."""
+        collector = MetricsCollector()
+        client = NordigenClient(
+            secret_key="SECRET_KEY",
+            secret_id="SECRET_ID",
+            metrics=collector,
+            retry_policy=RetryPolicy(max_retries=2, sleep=lambda delay: None),
+        )
+        before = mock.Mock()
+        client.register_hook("before_request", before)
+
+        with mock.patch(
+            "requests.Session.get",
+            side_effect=requests.ConnectionError("reset"),
+        ):
+            with pytest.raises(requests.ConnectionError):
+                client.request(HTTPMethod.GET, "institutions/")
+
+        attempts = [call.args[0].attempt for call in before.call_args_list]
+        assert attempts == [0, 1, 2]
+        [row] = client.stats()
+        assert row["retries"] == 2
+        assert row["errors"] == 3
+        assert row["statuses"] == {"ConnectionError": 3}
+
+    def test_unknown_hook(self):
+        """Test registering unknown hook fails."""
+        client = NordigenClient(secret_key="SECRET_KEY", secret_id="SECRET_ID")
+        with pytest.raises(ValueError):
+            client.register_hook("on_success", print)
+        assert client.stats() == []
+
+    def test_histogram_quantile(self):
+        """Test quantile is upper bound of containing bucket."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 5):
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.75) == 1.0
+        assert histogram.quantile(1) == float("inf")
+
+    def test_opentelemetry_recorder(self):
+        """Test requests are recorded with OpenTelemetry instruments."""
+        meter = mock.Mock()
+        client = NordigenClient(secret_key="SECRET_KEY", secret_id="SECRET_ID")
+        install_fake_api(client)
+        OpenTelemetryRecorder(meter).install(client)
+
+        client.institution.get_institutions("LV")
+
+        histogram = meter.create_histogram.return_value
+        histogram.record.assert_called_once()
+        assert histogram.record.call_args.args[1] == {
+            "http.method": "GET", "http.route": "institutions/"
+        }
+
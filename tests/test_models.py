@@ -0,0 +1,101 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+from unittest.mock import patch
+
+import pytest
+
+from nordigen import NordigenClient
+from nordigen.types.models import (
+    AccountBalancesModel,
+    AccountDataModel,
+    Field,
+    InstitutionModel,
+    Model,
+    RequisitionModel,
+    parse_datetime,
+)
+
+account = {
+    "id": "1d2b827b-9ca2-4adb-b4c3-0deb76a0ac50",
+    "created": "2022-02-22T10:37:34.556Z",
+    "last_accessed": "2022-02-22T10:37:34.556123Z",
+    "iban": "LT213250024324970797",
+}
+
+
+class TestModels:
+    """Test lazily parsed response models."""
+
+    def test_parse_datetime(self):
+        """Test API timestamps are parsed."""
+        assert parse_datetime("2022-02-22T10:37:34.5Z") == datetime(
+            2022, 2, 22, 10, 37, 34, 500000, tzinfo=timezone.utc
+        )
+        assert parse_datetime("2022-02-22T10:37:34").tzinfo is None
+
+    def test_fields_are_parsed_from_bytes(self):
+        """Test fields are parsed from raw body on first access."""
+        model = AccountDataModel.from_json(json.dumps(account).encode())
+
+        assert model.id == account["id"]
+        assert model.last_accessed.microsecond == 556123
+        assert model.created.tzinfo == timezone.utc
+        assert model.bban is None
+        assert model["iban"] == account["iban"]
+        assert not hasattr(model, "__dict__")
+        with pytest.raises(AttributeError):
+            model.unknown = True
+
+    def test_fields_are_parsed_once(self):
+        """Test parsed values are cached in slots."""
+        parser = mock.Mock(side_effect=int)
+
+        class Counter(Model):
+            value = Field("nested.value", parser=parser)
+
+        model = Counter({"nested": {"value": "5"}})
+        assert model.value == 5
+        assert model.value == 5
+        parser.assert_called_once_with("5")
+
+    def test_nested_models(self):
+        """Test list fields are wrapped in models."""
+        model = AccountBalancesModel({
+            "balances": [{
+                "balanceAmount": {"amount": "657.49", "currency": "EUR"},
+                "balanceType": "expected",
+                "referenceDate": "2022-01-01",
+            }]
+        })
+        balance = model.balances[0]
+        assert balance.amount == Decimal("657.49")
+        assert balance.currency == "EUR"
+        assert balance.reference_date.year == 2022
+
+    def test_list_response(self):
+        """Test list responses are wrapped item by item."""
+        models = InstitutionModel.from_json(
+            b'[{"id": "REVOLUT_REVOGB21", "transaction_total_days": "730"}]'
+        )
+        assert models[0].transaction_total_days == 730
+
+
+class TestClientModels:
+    """Test NordigenClient opt-in models."""
+
+    @patch("requests.Session.get")
+    def test_response_models(self, mock_request):
+        """Test models are returned only when enabled."""
+        mock_request.return_value.content = b'{"id": "req", "status": "LN"}'
+        mock_request.return_value.json.return_value = {"id": "req"}
+
+        client = NordigenClient(secret_id="SECRET_ID", secret_key="SECRET_KEY")
+        assert client.requisition.get_requisition_by_id("req") == {"id": "req"}
+
+        client.response_models = True
+        requisition = client.requisition.get_requisition_by_id("req")
+        assert isinstance(requisition, RequisitionModel)
+        assert requisition.status == "LN"
+        assert client.requisition.get_requisitions() == {"id": "req"}
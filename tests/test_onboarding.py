@@ -0,0 +1,76 @@
+from unittest import mock
+
+import pytest
+from requests.exceptions import HTTPError
+
+from nordigen import NordigenClient
+from nordigen.types import SessionRequest
+from nordigen.utils.onboarding import SQLiteOnboardingStore
+
+
+class TestInitializeSessions:
+    """Test bulk onboarding."""
+
+    @pytest.fixture
+    def fake_client(self, create_fake_client) -> NordigenClient:
+        return create_fake_client(max_workers=4)
+
+    def test_sessions_and_errors(self, fake_client, fake_api):
+        """Test sessions are created and failures collected per end user."""
+        requests = [
+            ("REVOLUT_REVOGB21", f"reference-{i}", "https://gocardless.com")
+            for i in range(20)
+        ]
+        create = fake_client.requisition.create_requisition
+
+        def failing(**kwargs):
+            if kwargs["reference_id"] == "reference-3":
+                raise HTTPError("Bad request")
+            return create(**kwargs)
+
+        with mock.patch.object(
+            fake_client.requisition, "create_requisition", failing
+        ):
+            result = fake_client.initialize_sessions(requests)
+
+        assert len(result.sessions) == 19
+        assert list(result.errors) == ["reference-3"]
+        assert result.sessions["reference-0"].link
+        assert len(fake_api.agreements) == 20
+        assert len(fake_api.requisitions) == 19
+
+    def test_resume(self, fake_client, fake_api):
+        """Test resumed run skips created agreements and requisitions."""
+        store = SQLiteOnboardingStore(":memory:")
+        requests = [
+            SessionRequest(
+                "REVOLUT_REVOGB21", f"reference-{i}", "https://gocardless.com"
+            )
+            for i in range(5)
+        ]
+        create = fake_client.requisition.create_requisition
+
+        def interrupted(**kwargs):
+            if kwargs["reference_id"] == "reference-4":
+                raise KeyboardInterrupt
+            return create(**kwargs)
+
+        with mock.patch.object(
+            fake_client.requisition, "create_requisition", interrupted
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                fake_client.initialize_sessions(requests, store=store)
+
+        created = store.load()
+        assert created["reference-4"].requisition_id is None
+
+        result = fake_client.initialize_sessions(requests, store=store)
+
+        assert result.resumed == 5
+        assert not result.errors
+        assert set(result.sessions) == {f"reference-{i}" for i in range(5)}
+        assert len(fake_api.agreements) == 5
+        assert len(fake_api.requisitions) == 5
+        assert store.load()["reference-4"].requisition_id == (
+            result.sessions["reference-4"].requisition_id
+        )
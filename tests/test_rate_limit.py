@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+import pytest
+
+from nordigen import NordigenClient
+from nordigen.utils.rate_limit import (
+    RateLimiter,
+    RateLimitExceeded,
+    rate_limit_buckets,
+)
+
+
+class TestRateLimiter:
+    """Test rate limiter."""
+
+    @pytest.fixture
+    def limiter(self, clock) -> RateLimiter:
+        return RateLimiter(max_wait=60, clock=clock, sleep=clock.sleep)
+
+    def test_buckets(self):
+        """Test endpoint family and account scope buckets."""
+        assert rate_limit_buckets("requisitions/") == ["requisitions"]
+        assert rate_limit_buckets("accounts/id/") == ["accounts"]
+        assert rate_limit_buckets("accounts/id/transactions/") == [
+            "accounts",
+            "accounts/id/transactions",
+        ]
+        assert rate_limit_buckets("accounts/premium/id/details") == [
+            "accounts",
+            "accounts/id/details",
+        ]
+
+    def test_waits_for_reset(self, limiter: RateLimiter, clock):
+        """Test requests wait for reset when budget is exhausted."""
+        limiter.update(
+            "requisitions/",
+            200,
+            {
+                "HTTP_X_RATELIMIT_LIMIT": "100",
+                "HTTP_X_RATELIMIT_REMAINING": "2",
+                "HTTP_X_RATELIMIT_RESET": "30",
+            },
+        )
+        limiter.acquire("requisitions/")
+        limiter.acquire("requisitions/")
+        assert limiter.state()["requisitions"].remaining == 0
+        assert clock.sleeps == []
+
+        limiter.acquire("requisitions/")
+        assert clock.sleeps == [30]
+        assert limiter.state()["requisitions"].remaining is None
+
+    def test_account_budget(self, limiter: RateLimiter):
+        """Test exhausted account budget fails fast."""
+        limiter.update(
+            "accounts/id/balances/",
+            200,
+            {
+                "X-RateLimit-Account-Success-Limit": "4",
+                "X-RateLimit-Account-Success-Remaining": "0",
+                "X-RateLimit-Account-Success-Reset": "3600",
+            },
+        )
+        limiter.acquire("accounts/id/details/")
+        with pytest.raises(RateLimitExceeded) as context:
+            limiter.acquire("accounts/id/balances/")
+        assert context.value.bucket == "accounts/id/balances"
+        assert context.value.retry_after == 3600
+
+    def test_blocked_request_keeps_budget(self, limiter: RateLimiter):
+        """Test request rejected by account budget keeps general budget."""
+        limiter.update(
+            "accounts/id/balances/",
+            200,
+            {
+                "HTTP_X_RATELIMIT_REMAINING": "5",
+                "HTTP_X_RATELIMIT_RESET": "60",
+                "X-RateLimit-Account-Success-Remaining": "0",
+                "X-RateLimit-Account-Success-Reset": "3600",
+            },
+        )
+        for _ in range(3):
+            with pytest.raises(RateLimitExceeded):
+                limiter.acquire("accounts/id/balances/")
+
+        assert limiter.state()["accounts"].remaining == 5
+        limiter.acquire("accounts/id/details/")
+        assert limiter.state()["accounts"].remaining == 4
+
+    def test_too_many_requests(self, limiter: RateLimiter, clock):
+        """Test 429 exhausts bucket until Retry-After."""
+        limiter.update("agreements/enduser/", 429, {"Retry-After": "5"})
+        limiter.acquire("agreements/enduser/")
+        assert clock.sleeps == [5]
+
+
+class TestClientRateLimit:
+    """Test NordigenClient uses rate limiter."""
+
+    @patch("requests.Session.get")
+    def test_request_updates_limiter(self, mock_request):
+        """Test response headers update limiter state."""
+        limiter = RateLimiter()
+        client = NordigenClient(
+            secret_id="SECRET_ID",
+            secret_key="SECRET_KEY",
+            rate_limiter=limiter,
+        )
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.headers = {
+            "HTTP_X_RATELIMIT_LIMIT": "100",
+            "HTTP_X_RATELIMIT_REMAINING": "0",
+            "HTTP_X_RATELIMIT_RESET": "3600",
+        }
+        client.requisition.get_requisitions()
+        assert client.rate_limiter.state()["requisitions"].remaining == 0
+
+        with pytest.raises(RateLimitExceeded):
+            client.requisition.get_requisitions()
+        client.institution.get_institutions()
+        assert mock_request.call_count == 2
@@ -32,7 +32,7 @@ class TestRequisitionApi:
             requisition (RequisitionsApi): Requisition instance
             client (NordigenClient): NordigenClient instance
         """
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             mock_request.return_value.json.return_value = generate_mock(
                 self.requisition_id
             )
@@ -60,7 +60,7 @@ class TestRequisitionApi:
         Args:
             requisition (RequisitionsApi): Requisition instance
         """
-        with patch("requests.delete") as mock_request:
+        with patch("requests.Session.delete") as mock_request:
             mock_request.return_value.json.return_value = {
                 "summary": "Requisition deleted"
             }
@@ -76,7 +76,7 @@ class TestRequisitionApi:
         Args:
             requisition (RequisitionsApi): Requisition instance
         """
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             mock_request.return_value.json.return_value = generate_mock(
                 self.requisition_id
             )
@@ -84,3 +84,37 @@ class TestRequisitionApi:
                 requisition_id=self.requisition_id
             )
             assert response["results"][1]["id"] == self.requisition_id
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iter_requisitions(
+        self, requisition: RequisitionsApi, client: NordigenClient, prefetch
+    ):
+        """
+        Test iterate over requisitions of all pages.
+
+        Args:
+            requisition (RequisitionsApi): Requisition instance
+            client (NordigenClient): NordigenClient instance
+            prefetch (bool): fetch next page in background
+        """
+        pages = {
+            0: {
+                "next": f"{client.base_url}/requisitions/?limit=2&offset=2",
+                "results": [{"id": "1"}, {"id": "2"}],
+            },
+            2: {"next": None, "results": [{"id": "3"}]},
+        }
+
+        def response(url, params, **kwargs):
+            mocked = mock.MagicMock()
+            mocked.json.return_value = pages[params.get("offset", 0)]
+            return mocked
+
+        with patch("requests.Session.get") as mock_request:
+            mock_request.side_effect = response
+            iterator = requisition.iter_requisitions(
+                limit=2, prefetch=prefetch
+            )
+            assert next(iterator) == {"id": "1"}
+            assert [item["id"] for item in iterator] == ["2", "3"]
+            assert mock_request.call_count == 2
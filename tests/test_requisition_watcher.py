@@ -0,0 +1,135 @@
+import asyncio
+from unittest import mock
+
+import pytest
+import requests
+
+from nordigen.utils.requisition_watcher import RequisitionWatcher
+
+
+class TestRequisitionWatcher:
+    """Test adaptive requisition status polling."""
+
+    def create(self, fake_client, count):
+        return [
+            fake_client.requisition.create_requisition(
+                "https://gocardless.com", f"reference-{i}", "REVOLUT_REVOGB21"
+            )["id"]
+            for i in range(count)
+        ]
+
+    def test_per_id_polling_backs_off(self, fake_client, fake_api, clock):
+        """Test idle requisitions back off and active ones are polled often."""
+        ids = self.create(fake_client, 200)
+        watcher = RequisitionWatcher(
+            fake_client.requisition,
+            min_interval=5,
+            idle_interval=30,
+            clock=clock,
+        )
+        watcher.watch(ids[:1])
+
+        [change] = watcher.poll()
+        assert (change.previous, change.status) == (None, "CR")
+        assert watcher.next_poll_in() == 30
+
+        clock.now = 30
+        assert watcher.poll() == []
+        assert watcher.next_poll_in() == 60
+
+        fake_api.requisitions[ids[0]]["status"] = "UA"
+        clock.now = 90
+        assert watcher.poll()[0].status == "UA"
+        assert watcher.next_poll_in() == 5
+        assert watcher.requests == 3
+
+    def test_per_id_failures(self, fake_client, fake_api, clock):
+        """Test deleted requisitions are unwatched and failed ones back off."""
+        deleted, failing, ok = self.create(fake_client, 3)
+        del fake_api.requisitions[deleted]
+        get = fake_client.requisition.get_requisition_by_id
+
+        def get_requisition(id):
+            if id == failing:
+                raise requests.ConnectionError("reset")
+            return get(id)
+
+        watcher = RequisitionWatcher(
+            fake_client.requisition, min_interval=5, page_size=1, clock=clock
+        )
+        watcher.watch([deleted, failing, ok])
+        with mock.patch.object(
+            fake_client.requisition, "get_requisition_by_id", get_requisition
+        ):
+            changes = watcher.poll()
+
+        assert [change.id for change in changes] == [ok]
+        assert len(watcher) == 2 and watcher.errors == 1
+        assert watcher._watched[failing].next_poll == 10
+
+    def test_sweep_failure(self, fake_client, clock):
+        """Test failed sweep backs off due requisitions instead of raising."""
+        ids = self.create(fake_client, 10)
+        watcher = RequisitionWatcher(
+            fake_client.requisition, min_interval=5, page_size=5, clock=clock
+        )
+        watcher.watch(ids)
+        with mock.patch.object(
+            fake_client.requisition, "get_requisitions",
+            side_effect=requests.ConnectionError("reset"),
+        ):
+            assert watcher.poll() == []
+
+        assert len(watcher) == 10 and watcher.errors == 1
+        assert watcher.next_poll_in() == 10
+        clock.now = 10
+        assert len(watcher.poll()) == 10
+
+    def test_sweep_and_callbacks(self, fake_client, fake_api, clock):
+        """Test cheaper sweep is used, terminal requisitions are unwatched."""
+        ids = self.create(fake_client, 10)
+        watcher = RequisitionWatcher(
+            fake_client.requisition,
+            page_size=5,
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        changes = []
+        watcher.on_change(changes.append)
+        watcher.watch(ids)
+
+        watcher.poll()
+        assert watcher.requests == 2
+        assert len(changes) == 10
+
+        for id in ids:
+            fake_api.requisitions[id]["status"] = "LN"
+        watcher.run(timeout=3600)
+
+        assert len(watcher) == 0
+        assert [change.status for change in changes[10:]] == ["LN"] * 10
+        assert watcher.requests == 4
+
+    def test_events(self, fake_client, fake_api):
+        """Test async event stream yields changes until all are terminal."""
+        [id] = self.create(fake_client, 1)
+        fake_api.requisitions[id]["status"] = "RJ"
+        watcher = RequisitionWatcher(fake_client.requisition)
+        watcher.watch([id])
+
+        async def collect():
+            return [change async for change in watcher.events()]
+
+        [change] = asyncio.run(collect())
+        assert change.status == "RJ"
+
+    def test_executor(self, fake_client):
+        """Test requisitions are fetched on executor."""
+        ids = self.create(fake_client, 3)
+        watcher = RequisitionWatcher(
+            fake_client.requisition, page_size=1, executor=fake_client.executor
+        )
+        watcher.watch(ids)
+
+        assert len(watcher.poll()) == 3
+        assert watcher.requests == 3
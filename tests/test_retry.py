@@ -0,0 +1,138 @@
+from unittest import mock
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.models import HTTPError
+
+from nordigen import NordigenClient
+from nordigen.types.http_enums import HTTPMethod
+from nordigen.utils.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+from .mocks import mocked_token
+
+
+def mock_response(status_code: int, headers: dict = None, json: dict = None):
+    """Create mocked response."""
+    response = mock.MagicMock()
+    response.ok = status_code < 400
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = json or {}
+    return response
+
+
+class TestRetryPolicy:
+    """Test retry policy decisions."""
+
+    def test_retries_idempotent_requests_only(self):
+        """Test only idempotent requests are retried."""
+        policy = RetryPolicy()
+        response = mock_response(503)
+        assert policy.delay(0, HTTPMethod.GET, "requisitions/", response)
+        assert policy.delay(0, HTTPMethod.POST, "token/new/", response)
+        assert (
+            policy.delay(0, HTTPMethod.POST, "requisitions/", response)
+            is None
+        )
+        assert policy.delay(
+            0, HTTPMethod.GET, "requisitions/", mock_response(404)
+        ) is None
+        assert (
+            policy.delay(3, HTTPMethod.GET, "requisitions/", response) is None
+        )
+
+    def test_full_jitter_backoff(self):
+        """Test backoff grows exponentially up to maximum."""
+        policy = RetryPolicy(backoff_base=1, backoff_max=5)
+        with patch("random.uniform", side_effect=lambda a, b: b):
+            assert [policy.backoff(attempt) for attempt in range(4)] == [
+                1, 2, 4, 5
+            ]
+
+    def test_retry_after(self):
+        """Test Retry-After header takes precedence over backoff."""
+        policy = RetryPolicy(backoff_max=30)
+        response = mock_response(429, {"Retry-After": "7"})
+        assert policy.delay(0, HTTPMethod.GET, "accounts/", response) == 7
+
+        response = mock_response(429, {"Retry-After": "3600"})
+        assert policy.delay(0, HTTPMethod.GET, "accounts/", response) is None
+
+        assert parse_retry_after(
+            {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        ) == 0
+        assert parse_retry_after({}) is None
+
+    def test_global_budget(self):
+        """Test retries stop when global budget is exhausted."""
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.5, max_tokens=1))
+        response = mock_response(500)
+        delay = policy.delay(0, HTTPMethod.GET, "accounts/", response)
+        assert delay is not None
+        assert policy.delay(0, HTTPMethod.GET, "accounts/", response) is None
+
+        policy.start()
+        policy.start()
+        delay = policy.delay(0, HTTPMethod.GET, "accounts/", response)
+        assert delay is not None
+        assert policy.stats.retries == 2
+        assert policy.stats.budget_exhausted == 1
+
+
+class TestClientRetry:
+    """Test NordigenClient retries requests."""
+
+    @pytest.fixture
+    def client(self) -> NordigenClient:
+        return NordigenClient(
+            secret_id="SECRET_ID",
+            secret_key="SECRET_KEY",
+            retry_policy=RetryPolicy(sleep=mock.Mock()),
+        )
+
+    @patch("requests.Session.get")
+    def test_retries_transient_failures(self, mock_request, client):
+        """Test connection errors and 5xx are retried."""
+        mock_request.side_effect = [
+            requests.ConnectionError("Connection reset"),
+            mock_response(503, {"Retry-After": "1"}),
+            mock_response(200, json={"id": "id"}),
+        ]
+        response = client.account_api("id").get_metadata()
+
+        assert response == {"id": "id"}
+        assert mock_request.call_count == 3
+        assert client.retry_policy.stats.retries == 2
+        assert client.retry_policy.sleep.call_args_list[-1] == mock.call(1)
+
+    @patch("requests.Session.get")
+    def test_closes_retried_response(self, mock_request, client):
+        """Test failed response is closed before retry, last one kept open."""
+        failed, ok = mock_response(503), mock_response(200, json={"id": "id"})
+        mock_request.side_effect = [failed, ok]
+
+        client.account_api("id").get_metadata()
+
+        failed.close.assert_called_once()
+        ok.close.assert_not_called()
+
+    @patch("requests.Session.get")
+    def test_gives_up_after_max_retries(self, mock_request, client):
+        """Test last failure is raised after max retries."""
+        mock_request.return_value = mock_response(502)
+        with pytest.raises(HTTPError):
+            client.account_api("id").get_metadata()
+        assert mock_request.call_count == 4
+
+    @patch("requests.Session.post")
+    def test_does_not_retry_writes(self, mock_request, client):
+        """Test non idempotent requests are not retried."""
+        mock_request.side_effect = [
+            mock_response(503),
+            mock_response(200, json=mocked_token),
+        ]
+        with pytest.raises(HTTPError):
+            client.agreement.create_agreement("REVOLUT_REVOGB21")
+        assert client.generate_token() == mocked_token
+        assert mock_request.call_count == 2
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from nordigen.utils.stream import iter_json_items
+
+paths = [("transactions", "booked"), ("transactions", "pending")]
+document = {
+    "account": {"transactions": {"booked": ["ignored"]}},
+    "transactions": {
+        "booked": [
+            {"id": i, "remittance": "Ēriks \"café\" " * i, "amount": 12345}
+            for i in range(10)
+        ],
+        "pending": [],
+        "other": [[1, 2], {"nested": True}],
+    },
+}
+
+
+def chunked(data: bytes, size: int):
+    """Split data to chunks of given size."""
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 64, 1 << 20])
+def test_iter_json_items(size):
+    """Test array items are decoded regardless of chunk boundaries."""
+    body = json.dumps(document, ensure_ascii=False, indent=2).encode()
+    items = list(iter_json_items(chunked(body, size), paths))
+
+    assert items == [
+        (("transactions", "booked"), transaction)
+        for transaction in document["transactions"]["booked"]
+    ]
+
+
+def test_truncated_stream_raises():
+    """Test truncated document raises ValueError."""
+    body = json.dumps(document).encode()[:-40]
+    with pytest.raises(ValueError):
+        list(iter_json_items(chunked(body, 16), paths))
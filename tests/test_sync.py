@@ -0,0 +1,114 @@
+from datetime import date
+from unittest import mock
+
+import pytest
+
+from nordigen.sync import SQLiteSyncStore, TransactionSync
+from nordigen.sync.engine import transaction_key
+
+
+def transactions_response(booked, pending=()):
+    """Create transactions response."""
+    return {"transactions": {"booked": list(booked), "pending": list(pending)}}
+
+
+class TestTransactionSync:
+    """Test incremental transaction sync."""
+
+    @pytest.fixture
+    def client(self):
+        """Mocked NordigenClient."""
+        return mock.MagicMock()
+
+    @pytest.fixture
+    def engine(self, client) -> TransactionSync:
+        """Sync engine with in-memory store."""
+        return TransactionSync(
+            client, SQLiteSyncStore(":memory:"), overlap_days=2
+        )
+
+    def test_transaction_key(self):
+        """Test transaction key falls back to content hash."""
+        assert transaction_key({"transactionId": "1"}) == "id:1"
+        assert transaction_key({"internalTransactionId": "2"}) == "internal:2"
+        assert transaction_key({"amount": "1"}).startswith("hash:")
+        assert transaction_key({"amount": "1"}) == transaction_key(
+            {"amount": "1"}
+        )
+
+    def test_sync_emits_only_new_and_changed(self, engine, client):
+        """Test second sync requests delta window and emits changes."""
+        account = client.account_api.return_value
+        account.get_transactions.return_value = transactions_response(
+            booked=[{"transactionId": "1"}, {"internalTransactionId": "2"}],
+            pending=[{"transactionId": "3", "amount": "5"}],
+        )
+        result = engine.sync("account", today=date(2022, 1, 10))
+
+        account.get_transactions.assert_called_with(
+            date_from=None, date_to="2022-01-10"
+        )
+        assert [t.key for t in result.transactions] == [
+            "id:1", "internal:2", "id:3"
+        ]
+        assert all(t.is_new for t in result.transactions)
+
+        account.get_transactions.return_value = transactions_response(
+            booked=[
+                {"transactionId": "1"},
+                {"transactionId": "3", "amount": "5"},
+                {"transactionId": "4"},
+            ],
+        )
+        result = engine.sync("account", today=date(2022, 1, 12))
+
+        account.get_transactions.assert_called_with(
+            date_from="2022-01-08", date_to="2022-01-12"
+        )
+        assert [(t.key, t.status, t.is_new) for t in result.transactions] == [
+            ("id:3", "booked", False),
+            ("id:4", "booked", True),
+        ]
+        assert engine.store.get_watermark("account") == date(2022, 1, 12)
+
+    def test_identical_transactions_without_id(self, engine, client):
+        """Test identical transactions without id are all emitted once."""
+        payment = {"bookingDate": "2022-01-09", "amount": "-3.50"}
+        account = client.account_api.return_value
+        account.get_transactions.return_value = transactions_response(
+            booked=[dict(payment), dict(payment)]
+        )
+        first = engine.sync("account", today=date(2022, 1, 10))
+        second = engine.sync("account", today=date(2022, 1, 11))
+
+        keys = [t.key for t in first.transactions]
+        assert len(keys) == 2
+        assert keys[0].endswith(":1") and keys[1].endswith(":2")
+        assert second.transactions == []
+
+    def test_failed_sync_keeps_watermark(self, engine, client):
+        """Test failed accounts are reported without moving watermark."""
+        client.executor.submit.side_effect = lambda fn, *args: mock.Mock(
+            result=mock.Mock(side_effect=lambda: fn(*args))
+        )
+        client.account_api.side_effect = lambda id: mock.Mock(
+            get_transactions=mock.Mock(
+                side_effect=ValueError("failed") if id == "bad"
+                else lambda **kwargs: transactions_response([])
+            )
+        )
+        results = engine.sync_many(["good", "bad"], today=date(2022, 1, 1))
+
+        assert results[0].error is None
+        assert str(results[1].error) == "failed"
+        assert engine.store.get_watermark("good") == date(2022, 1, 1)
+        assert engine.store.get_watermark("bad") is None
+
+    def test_initial_days(self, client):
+        """Test first sync window."""
+        engine = TransactionSync(
+            client, SQLiteSyncStore(":memory:"), initial_days=30
+        )
+        assert engine.window("account", today=date(2022, 1, 31)) == (
+            date(2022, 1, 1), date(2022, 1, 31)
+        )
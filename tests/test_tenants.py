@@ -0,0 +1,91 @@
+from unittest import mock
+
+import pytest
+
+from nordigen import NordigenClient, TenantRegistry
+from nordigen.testing import FakeBankAccountDataAPI
+from nordigen.transport import InMemoryTransport
+from nordigen.utils.cache import ResponseCache
+from nordigen.utils.rate_limit import RateLimiter
+from nordigen.utils.retry import RetryPolicy
+
+
+class TestTenantRegistry:
+    """Test multi-tenant client registry."""
+
+    @pytest.fixture
+    def registry(self) -> TenantRegistry:
+        registry = TenantRegistry(
+            transport=InMemoryTransport(FakeBankAccountDataAPI()),
+            max_workers=4,
+            rate_limiter_factory=RateLimiter,
+            metrics=True,
+        )
+        registry.register("first", "SECRET_ID_1", "SECRET_KEY_1")
+        registry.register("second", "SECRET_ID_2", "SECRET_KEY_2")
+        yield registry
+        registry.close()
+
+    def test_shared_resources(self, registry):
+        """Test tenants share transport and executor but not state."""
+        first, second = registry["first"], registry["second"]
+
+        assert first.transport is second.transport is registry.transport
+        assert first.executor is second.executor is registry.executor
+        assert first.token and second.token and first.token != second.token
+        assert first.rate_limiter is not second.rate_limiter
+        assert first.metrics is not second.metrics
+        assert list(registry) == ["first", "second"]
+
+    def test_per_tenant_metrics(self, registry):
+        """Test metrics are collected per tenant."""
+        registry["first"].institution.get_institutions("LV")
+        stats = registry.stats()
+
+        assert {row["endpoint"] for row in stats["first"]} == {
+            "token/new/", "institutions/"
+        }
+        assert {row["endpoint"] for row in stats["second"]} == set()
+
+    def test_token_generated_once(self, registry):
+        """Test token is generated on first access only."""
+        with mock.patch.object(
+            NordigenClient, "generate_token", autospec=True,
+            side_effect=lambda client: setattr(client, "token", "token"),
+        ) as generate:
+            registry.register("third", "SECRET_ID_3", "SECRET_KEY_3")
+            registry.get("third")
+            registry.get("third")
+
+        generate.assert_called_once()
+
+    def test_register_twice(self, registry):
+        """Test tenant can not be registered twice."""
+        with pytest.raises(ValueError):
+            registry.register("first", "SECRET_ID", "SECRET_KEY")
+        registry.remove("first")
+        assert "first" not in registry
+        with pytest.raises(KeyError):
+            registry.get("first")
+
+    def test_client_close_keeps_shared_resources(self, registry):
+        """Test closing tenant client does not close shared pools."""
+        registry["first"].close()
+
+        assert registry["second"].executor.submit(lambda: 1).result() == 1
+
+    def test_stateful_options_per_tenant(self):
+        """Test stateful options are created per tenant, never shared."""
+        with pytest.raises(ValueError, match="cache"):
+            TenantRegistry(cache=ResponseCache())
+
+        with TenantRegistry(
+            transport=InMemoryTransport(FakeBankAccountDataAPI()),
+            retry_policy_factory=RetryPolicy,
+            cache_factory=ResponseCache,
+        ) as registry:
+            first = registry.register("first", "SECRET_ID_1", "SECRET_KEY_1")
+            second = registry.register("second", "SECRET_ID_2", "SECRET_KEY_2")
+
+            assert first.retry_policy is not second.retry_policy
+            assert first.cache is not second.cache
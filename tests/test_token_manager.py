@@ -0,0 +1,125 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from unittest.mock import patch
+
+from requests.models import HTTPError
+
+from nordigen import NordigenClient
+from nordigen.utils.token_manager import TokenManager
+
+from .mocks import mocked_token
+
+
+class TestTokenManager:
+    """Test token lifecycle manager."""
+
+    def test_needs_refresh_before_expiry(self, clock):
+        """Test access token is refreshed within refresh margin."""
+        manager = TokenManager(refresh_margin=60, clock=clock)
+        assert not manager.needs_refresh
+
+        manager.update(mocked_token)
+        clock.now = 86400 - 61
+        assert not manager.needs_refresh
+        clock.now = 86400 - 60
+        assert manager.needs_refresh
+
+    def test_exchanges_refresh_token(self, clock):
+        """Test refresh token is exchanged for access token."""
+        manager = TokenManager(clock=clock)
+        manager.update(mocked_token)
+        clock.now = 86400
+
+        exchange = mock.Mock(
+            side_effect=lambda refresh: manager.update(
+                {"access": "new", "access_expires": 86400}
+            )
+        )
+        generate = mock.Mock()
+        manager.ensure_fresh(exchange, generate)
+
+        exchange.assert_called_once_with("refresh_token")
+        generate.assert_not_called()
+        assert not manager.needs_refresh
+        assert manager.refresh_token == "refresh_token"
+
+    def test_generates_token_when_refresh_is_dead(self, clock):
+        """Test new token pair is generated when refresh is rejected."""
+        manager = TokenManager(clock=clock)
+        manager.update(mocked_token)
+        clock.now = 86400
+
+        exchange = mock.Mock(side_effect=HTTPError({"status": 401}))
+        generate = mock.Mock()
+        manager.ensure_fresh(exchange, generate)
+        generate.assert_called_once()
+
+        clock.now = 2592000
+        exchange.reset_mock()
+        generate.reset_mock()
+        manager.ensure_fresh(exchange, generate)
+        exchange.assert_not_called()
+        generate.assert_called_once()
+
+    def test_single_flight_refresh(self, clock):
+        """Test concurrent callers share a single refresh."""
+        manager = TokenManager(clock=clock)
+        manager.update(mocked_token)
+        clock.now = 86400
+
+        def exchange(refresh):
+            time.sleep(0.05)
+            manager.update({"access": "new", "access_expires": 86400})
+
+        exchange_mock = mock.Mock(side_effect=exchange)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(16):
+                executor.submit(
+                    manager.ensure_fresh, exchange_mock, mock.Mock()
+                )
+
+        exchange_mock.assert_called_once()
+
+
+class TestClientTokenRefresh:
+    """Test NordigenClient refreshes token before requests."""
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_request_refreshes_expired_token(self, mock_post, mock_get, clock):
+        """Test expired access token is exchanged before request."""
+        client = NordigenClient(secret_id="SECRET_ID", secret_key="SECRET_KEY")
+        client.token_manager._clock = clock
+
+        mock_post.return_value.json.return_value = mocked_token
+        client.generate_token()
+
+        client.token_manager._clock.now = 86400
+        mock_post.return_value.json.return_value = {
+            "access": "new_access_token",
+            "access_expires": 86400,
+        }
+        mock_get.return_value.json.return_value = {}
+        client.account_api("id").get_details()
+
+        assert mock_post.call_args.kwargs["url"].endswith("token/refresh/")
+        assert client.token == "new_access_token"
+        assert mock_get.call_args.kwargs["headers"]["Authorization"] == (
+            "Bearer new_access_token"
+        )
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_auto_refresh_disabled(self, mock_post, mock_get, clock):
+        """Test token is not refreshed when auto refresh is disabled."""
+        client = NordigenClient(
+            secret_id="SECRET_ID", secret_key="SECRET_KEY", auto_refresh=False
+        )
+        client.token_manager._clock = clock
+        mock_post.return_value.json.return_value = mocked_token
+        client.generate_token()
+
+        client.token_manager._clock.now = 86400
+        client.account_api("id").get_details()
+        assert mock_post.call_count == 1
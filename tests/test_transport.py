@@ -0,0 +1,104 @@
+import socket
+
+import pytest
+import requests
+
+from nordigen import NordigenClient
+from nordigen.testing import (
+    FakeBankAccountDataAPI,
+    FakeServer,
+    ServerBehaviour
+)
+from nordigen.transport import (
+    HttpxTransport,
+    InMemoryTransport,
+    RequestsTransport,
+    Transport,
+    Urllib3Transport
+)
+from nordigen.types.http_enums import HTTPMethod
+
+TRANSPORTS = [RequestsTransport, Urllib3Transport, HttpxTransport]
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeServer(api=FakeBankAccountDataAPI(transactions=50)) as server:
+        yield server
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestTransport:
+    """Test HTTP transports."""
+
+    @pytest.mark.parametrize("transport", TRANSPORTS)
+    def test_session_flow(self, server, transport):
+        """Test client flow over HTTP through every transport."""
+        with NordigenClient(
+            secret_key="SECRET_KEY",
+            secret_id="SECRET_ID",
+            base_url=server.base_url,
+            transport=transport(),
+        ) as client:
+            self.assert_session_flow(client)
+
+    def test_send_is_abstract(self):
+        """Test transport without send fails when constructed."""
+        class Incomplete(Transport):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_in_memory(self):
+        """Test client flow through in-memory transport."""
+        api = FakeBankAccountDataAPI(transactions=50)
+        client = NordigenClient(
+            secret_key="SECRET_KEY",
+            secret_id="SECRET_ID",
+            transport=InMemoryTransport(api),
+        )
+        self.assert_session_flow(client)
+
+    @staticmethod
+    def assert_session_flow(client: NordigenClient):
+        client.generate_token()
+        session = client.initialize_session(
+            institution_id="REVOLUT_REVOGB21",
+            redirect_uri="https://gocardless.com",
+            reference_id="reference",
+        )
+        requisition = client.requisition.get_requisition_by_id(
+            session.requisition_id
+        )
+        account = client.account_api(requisition["accounts"][0])
+        transactions = account.get_transactions(date_from="2022-01-01")
+
+        assert len(transactions["transactions"]["booked"]) == 50
+        assert sum(1 for _ in account.iter_transactions()) == 52
+        assert client.requisition.delete_requisition(session.requisition_id)
+        with pytest.raises(requests.HTTPError) as error:
+            client.request(HTTPMethod.GET, "unknown/")
+        assert error.value.response.status_code == 404
+
+    @pytest.mark.parametrize("transport", TRANSPORTS)
+    def test_connection_error(self, transport):
+        """Test network failures are raised as requests exceptions."""
+        with pytest.raises(requests.ConnectionError):
+            transport().send(
+                "GET", f"http://127.0.0.1:{free_port()}/api/v2/", {}, timeout=1
+            )
+
+    @pytest.mark.parametrize("transport", TRANSPORTS)
+    def test_timeout(self, transport):
+        """Test timeouts are raised as requests exceptions."""
+        with FakeServer(behaviour=ServerBehaviour(latency=0.5)) as server:
+            with pytest.raises(requests.Timeout):
+                transport().send(
+                    "GET", f"{server.base_url}/institutions/", {}, timeout=0.1
+                )